@@ -1,5 +1,7 @@
 FIG_FORMAT = "pdf"
 
+# bbox_inches="tight" already trims the margins of single-axes figures;
+# calling tight_layout() before saving them only adds another layout pass
 SAVEFIG_KWARGS = {
     "bbox_inches": "tight",
     "pad_inches": 0.05,
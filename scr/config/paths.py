@@ -24,3 +24,6 @@ PATH_GRAPHIC_OUTPUT = path.join(PROJECT_DIR, "graphic_output")
 PATH_FIGURES = path.join(PATH_GRAPHIC_OUTPUT, "figures")
 PATH_VIDEOS = path.join(PATH_GRAPHIC_OUTPUT, "videos")
 PATH_INTERACTIVE = path.join(PATH_GRAPHIC_OUTPUT, "interactive")
+
+# cached intermediate products (safe to delete)
+PATH_CACHE = path.join(PROJECT_DIR, "cache")
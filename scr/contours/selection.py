@@ -1,9 +1,10 @@
 import numpy as np
+import shapely
 
 from scr.utils.types_alias import Contour, Contours, Mask
 from scr.utils.filesystem import is_empty
 
-from scr.geometry.contours.area import contour_area
+from scr.geometry.contours.area import contours_area
 from scr.geometry.contours.extraction import find_contours
 from scr.geometry.contours.distance import contours_distance
 from scr.geometry.contours.normalization import normalize_contour_input
@@ -32,25 +33,23 @@ def select_support_contours(
     if is_empty(primary_contours) or is_empty(support_contours):
         return []
 
-    support_shapes = [
-        (support, contour_to_shape(support))
-        for support in support_contours
-    ]
+    # Support centroids and areas do not depend on the primary contour
+    support_centroids = shapely.centroid([
+        contour_to_shape(support) for support in support_contours
+    ])
+    support_areas = contours_area(support_contours)
 
     selected: list = []
 
     for primary in primary_contours:
         primary_shape = contour_to_shape(primary)
 
-        candidates = [
-            support
-            for support, support_shape in support_shapes
-            if primary_shape.contains(support_shape.centroid)
-        ]
+        # Vectorised point-in-polygon test over all support centroids
+        candidates = np.flatnonzero(shapely.contains(primary_shape, support_centroids))
 
-        if candidates:
+        if candidates.size > 0:
             selected.append(
-                max(candidates, key=contour_area)
+                support_contours[candidates[np.argmax(support_areas[candidates])]]
             )
 
     return selected
@@ -42,6 +42,65 @@ def contour_area(
     return np.abs(contour_signed_area(contour, correction))
 
 
+def contours_area(
+        contours: Contours
+) -> np.ndarray:
+    """
+    Compute the (unsigned) areas of many contours at once.
+
+    Equivalent to `[contour_area(c) for c in contours]`, but all contours are
+    processed in one vectorised shoelace pass over their concatenated points.
+
+    Parameters
+    ----------
+    contours : list of (N,2) arrays
+        Ordered coordinates (row=y, col=x).
+
+    Returns
+    -------
+    np.ndarray
+        Area of each contour, shape (len(contours),).
+    """
+    return np.abs(contours_signed_area(contours))
+
+
+def contours_signed_area(
+        contours: Contours
+) -> np.ndarray:
+    """
+    Compute the signed areas of many contours at once (CCW > 0), as `contour_signed_area`
+    per contour, in one vectorised shoelace pass over their concatenated points.
+
+    Parameters
+    ----------
+    contours : list of (N,2) arrays
+        Ordered coordinates (row=y, col=x).
+
+    Returns
+    -------
+    np.ndarray
+        Signed area of each contour, shape (len(contours),).
+    """
+    if is_empty(contours):
+        return np.zeros(0)
+
+    lengths = np.array([len(contour) for contour in contours])
+    points = np.concatenate([np.reshape(contour, (-1, 2)) for contour in contours], axis=0)
+    x, y = points[:, 1], points[:, 0]
+
+    # Index of the previous point within the same (closed) contour
+    starts = np.cumsum(lengths) - lengths
+    previous = np.arange(len(points)) - 1
+    non_empty = lengths > 0
+    previous[starts[non_empty]] = (starts + lengths - 1)[non_empty]
+
+    terms = x * y[previous] - y * x[previous]
+    terms[np.isnan(terms)] = 0.  # as np.nansum per contour
+
+    owner = np.repeat(np.arange(len(lengths)), lengths)
+    return 0.5 * np.bincount(owner, weights=terms, minlength=len(lengths))
+
+
 def total_contours_area(
         contours: Contours,
         hole_contours: Contours | None = None
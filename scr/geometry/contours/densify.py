@@ -48,3 +48,22 @@ def densify_contour(
             new_points.append(pt)
 
     return np.vstack(new_points)
+
+
+def densified_vertex_index(
+        contour: Contour,
+        min_step: float = 0.5
+) -> np.ndarray:
+    """
+    Positions of the original vertices of `contour` within `densify_contour(contour, min_step)`.
+
+    The densified polyline keeps every original vertex, so values sampled on it
+    at these positions equal values sampled on the original contour.
+    """
+    seg = np.diff(contour, axis=0)
+    dist = np.hypot(seg[:, 0], seg[:, 1])
+
+    # same number of sub-steps per segment as in densify_contour
+    n_intervals = np.where(dist <= min_step, 1, np.ceil(dist / min_step)).astype(int)
+
+    return np.concatenate([[0], np.cumsum(n_intervals)])
@@ -3,7 +3,7 @@ import numpy as np
 from scr.utils.types_alias import Contour, Contours
 
 from scr.geometry.contours.distance import contours_distance
-from scr.geometry.contours.area import contour_area
+from scr.geometry.contours.area import contours_area
 
 
 def filter_candidate_contours(
@@ -29,4 +29,5 @@ def filter_contours_by_area(
     """
     if threshold_min == -np.inf and threshold_max == np.inf:
         return contours
-    return [c for c in contours if threshold_min <= contour_area(c) <= threshold_max]
+    areas = contours_area(contours)
+    return [c for c, area in zip(contours, areas) if threshold_min <= area <= threshold_max]
@@ -1,9 +1,25 @@
 import numpy as np
 from scipy.ndimage import map_coordinates
+from typing import NamedTuple
 
-from scr.utils.types_alias import Contour
+from scr.utils.types_alias import Contour, Contours
+from scr.utils.filesystem import is_empty
 
 from scr.geometry.contours.length import compute_contour_arc_lengths
+from scr.geometry.contours.normalization import normalize_contour_input
+from scr.geometry.contours.densify import densify_contour, densified_vertex_index
+
+
+class PreparedContours(NamedTuple):
+    """
+    Densified contours with their heliographic coordinates, sampled once per frame.
+    Empty contours are kept (as empty arrays) so the lists align with the input contours.
+    """
+    dense_contours: Contours      # closed and densified contours
+    vertex_index: list[np.ndarray]  # positions of the original vertices within the dense contours
+    lon: list[np.ndarray]
+    lat: list[np.ndarray]
+    arc_lengths: list[np.ndarray]
 
 
 def sample_map_at_contour(
@@ -31,6 +47,24 @@ def sample_map_at_contour(
         return data_map[r, c]
 
 
+def sample_map_at_contours(
+        contours: Contours,
+        data_map: np.ndarray,
+        interp: bool = True
+) -> list[np.ndarray]:
+    """
+    Sample 2D data_map at several contours with a single sampling call.
+    Returns: list of 1D arrays, one per contour (same as per-contour `sample_map_at_contour`).
+    """
+    if len(contours) == 0:
+        return []
+
+    points = np.concatenate([np.reshape(contour, (-1, 2)) for contour in contours])
+    sampled = sample_map_at_contour(contour=points, data_map=data_map, interp=interp)
+
+    return np.split(sampled, np.cumsum([len(contour) for contour in contours])[:-1])
+
+
 def calc_arc_lengths(
         contour: Contour,
         lon2d: np.ndarray,
@@ -40,7 +74,15 @@ def calc_arc_lengths(
     lon = sample_map_at_contour(contour=contour, data_map=lon2d, interp=True)
     lat = sample_map_at_contour(contour=contour, data_map=lat2d, interp=True)
 
-    ds = compute_contour_arc_lengths(lon_deg=lon, lat_deg=lat, rsun=rsun)
+    return arc_lengths_from_lonlat(contour_lon=lon, contour_lat=lat, rsun=rsun)
+
+
+def arc_lengths_from_lonlat(
+        contour_lon: np.ndarray,
+        contour_lat: np.ndarray,
+        rsun: float
+) -> np.ndarray:
+    ds = compute_contour_arc_lengths(lon_deg=contour_lon, lat_deg=contour_lat, rsun=rsun)
     ds = 0.5 * (ds + np.roll(ds, 1))  # centre of the arc
 
     return ds
@@ -54,3 +96,48 @@ def calc_spherical_length(
     ds = compute_contour_arc_lengths(lon_deg=contour_lon, lat_deg=contour_lat, rsun=rsun)
 
     return float(np.nansum(ds))
+
+
+def prepare_contours(
+        contours: Contour | Contours,
+        lon2d: np.ndarray,
+        lat2d: np.ndarray,
+        rsun: float,
+        min_step: float = 0.5
+) -> PreparedContours:
+    """
+    Densify contours and sample lon / lat (and arc lengths) on them once.
+
+    The result can be shared by `compute_flux_length_stats` and `compute_geometry_stats`
+    for the same contour set; the latter reads the values at the original vertices.
+    """
+    contours = normalize_contour_input(contours)
+    empty = [is_empty(c) for c in contours]
+
+    dense_contours = [c if e else densify_contour(c, min_step=min_step) for c, e in zip(contours, empty)]
+    vertex_index = [np.zeros(0, dtype=int) if e else densified_vertex_index(c, min_step=min_step)
+                    for c, e in zip(contours, empty)]
+
+    sampled_contours = [c for c, e in zip(dense_contours, empty) if not e]
+    lons = iter(sample_map_at_contours(sampled_contours, data_map=lon2d, interp=True))
+    lats = iter(sample_map_at_contours(sampled_contours, data_map=lat2d, interp=True))
+
+    lon, lat, arc_lengths = [], [], []
+    for e in empty:
+        if e:
+            lon.append(np.zeros(0))
+            lat.append(np.zeros(0))
+            arc_lengths.append(np.zeros(0))
+            continue
+        contour_lon, contour_lat = next(lons), next(lats)
+        lon.append(contour_lon)
+        lat.append(contour_lat)
+        arc_lengths.append(arc_lengths_from_lonlat(contour_lon=contour_lon, contour_lat=contour_lat, rsun=rsun))
+
+    return PreparedContours(
+        dense_contours=dense_contours,
+        vertex_index=vertex_index,
+        lon=lon,
+        lat=lat,
+        arc_lengths=arc_lengths,
+    )
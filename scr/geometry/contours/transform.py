@@ -1,6 +1,7 @@
 import numpy as np
 
 from scr.utils.types_alias import Contours
+from scr.utils.filesystem import is_empty
 
 
 def shift_contours(
@@ -23,7 +24,11 @@ def shift_contours(
     -------
     shifted_contours : list of contours
     """
-    return [
-        np.column_stack((c[:, 0] - y_offset, c[:, 1] - x_offset))
-        for c in contours
-    ]
+    if is_empty(contours):
+        return []
+
+    # Shift all points at once and split back into per-contour views
+    lengths = [len(c) for c in contours]
+    shifted = np.concatenate(contours, axis=0) - np.array([y_offset, x_offset])
+
+    return np.split(shifted, np.cumsum(lengths)[:-1])
@@ -49,3 +49,18 @@ def compute_crop_bounds(
         x_max = min(nx, x_max)
 
     return y_min, y_max, x_min, x_max
+
+
+def bounds_overlap(
+        bounds1: np.ndarray,
+        bounds2: np.ndarray
+) -> np.ndarray:
+    """
+    Whether bounding boxes (ymin, ymax, xmin, xmax) overlap, broadcasting over leading axes.
+
+    The boxes are compared as closed intervals, so boxes from `compute_crop_bounds`
+    (floored / ceiled contour extents) never miss a shared pixel; touching boxes count as overlapping.
+    """
+    bounds1, bounds2 = np.asarray(bounds1), np.asarray(bounds2)
+    return ((bounds1[..., 0] <= bounds2[..., 1]) & (bounds2[..., 0] <= bounds1[..., 1])
+            & (bounds1[..., 2] <= bounds2[..., 3]) & (bounds2[..., 2] <= bounds1[..., 3]))
@@ -3,8 +3,6 @@ import numpy as np
 from scr.utils.types_alias import Contours
 from scr.utils.filesystem import is_empty
 
-from scr.geometry.align import shift_to_centre_and_pad
-
 
 def crop_centered_fixed(
         image: np.ndarray,
@@ -16,19 +14,46 @@ def crop_centered_fixed(
     """
     Crop a fixed-size window centred on contour centroid.
     """
+    y_min, y_max, x_min, x_max = centered_crop_window(contours, target_shape=target_shape)
+    ny, nx = image.shape
+
+    # Copy the in-image part of the window into a background-filled output;
+    # equivalent to shift_to_centre_and_pad without the intermediate np.pad
+    cropped = np.full((y_max - y_min, x_max - x_min), background_value, dtype=image.dtype)
+
+    y0, y1 = max(y_min, 0), min(y_max, ny)
+    x0, x1 = max(x_min, 0), min(x_max, nx)
+    if y0 < y1 and x0 < x1:
+        cropped[y0 - y_min:y1 - y_min, x0 - x_min:x1 - x_min] = image[y0:y1, x0:x1]
+
+    shift = np.array([y_min, x_min], dtype=float)
+    return cropped, shift
+
+
+def centered_crop_window(
+        contours: Contours,
+        *,
+        target_shape: tuple[int, int],
+) -> tuple[int, int, int, int]:
+    """
+    Compute the window used by `crop_centered_fixed` without touching the image.
+
+    The window may extend beyond the image; such pixels are filled with the
+    background value when cropping.
+
+    Returns
+    -------
+    (ymin, ymax, xmin, xmax) : tuple of int
+        Window coordinates (inclusive-exclusive) in the original image.
+    """
     if is_empty(contours):
         raise ValueError("contours must contain at least one contour")
 
     points = np.vstack(contours)
     cy, cx = np.mean(points, axis=0)
 
-    cropped, new_cy, new_cx = shift_to_centre_and_pad(
-        image,
-        cy, cx,
-        target_shape,
-        background_value=background_value,
-        return_centre=True,
-    )
+    height, width = target_shape
+    y_min = int(np.round(cy)) - height // 2
+    x_min = int(np.round(cx)) - width // 2
 
-    shift = np.array([cy, cx]) - np.array([new_cy, new_cx])
-    return cropped, shift
+    return y_min, y_min + height, x_min, x_min + width
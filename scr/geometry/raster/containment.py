@@ -16,3 +16,26 @@ def containment_ratio(
     area_small = mask_small.sum()
 
     return intersection / area_small if area_small > 0.0 else 0.0
+
+
+def roi_intersection(
+        roi1: tuple[Mask, tuple[int, int]],
+        roi2: tuple[Mask, tuple[int, int]]
+) -> int:
+    """
+    Number of pixels set in both of two cropped masks (as from `contours_to_roi_mask`).
+
+    Only the overlap of the two bounding boxes is compared; pixels outside either box are empty.
+    """
+    (mask1, (y1, x1)), (mask2, (y2, x2)) = roi1, roi2
+
+    top, left = max(y1, y2), max(x1, x2)
+    bottom = min(y1 + mask1.shape[0], y2 + mask2.shape[0])
+    right = min(x1 + mask1.shape[1], x2 + mask2.shape[1])
+
+    if bottom <= top or right <= left:
+        return 0
+
+    window1 = mask1[top - y1:bottom - y1, left - x1:right - x1]
+    window2 = mask2[top - y2:bottom - y2, left - x2:right - x2]
+    return int(np.count_nonzero(window1 & window2))
@@ -3,9 +3,11 @@ from skimage.draw import polygon, polygon_perimeter
 from skimage.morphology import thin
 
 from scr.utils.types_alias import Contour, Contours, Mask
+from scr.utils.filesystem import is_empty
 
 from scr.geometry.contours.normalization import normalize_contour_input
 from scr.geometry.contours.area import contour_signed_area
+from scr.geometry.crop.bounds import compute_crop_bounds
 
 
 def contours_to_mask(
@@ -38,6 +40,38 @@ def contours_to_mask(
     return mask
 
 
+def contours_to_roi_mask(
+        contours: Contour | Contours,
+        shape: tuple[int, int]
+) -> tuple[Mask, tuple[int, int]]:
+    """
+    Filled binary mask of one or more contours, cropped to the bounding box of its pixels.
+
+    Parameters:
+        contours: A single (N, 2) array or a list of such arrays, each representing a contour.
+        shape: Shape of the full frame (height, width).
+
+    Returns:
+        The cropped mask and the (row, column) of its top-left corner in the full frame.
+        Pasted there, the mask equals `contours_to_mask(contours, shape)`; no contour
+        pixels give a (0, 0) mask.
+    """
+    contours = normalize_contour_input(contours)
+    filled = [polygon(contour[:, 0], contour[:, 1], shape) for contour in contours]
+
+    rr = np.concatenate([r for r, _ in filled]) if filled else np.empty(0, dtype=int)
+    cc = np.concatenate([c for _, c in filled]) if filled else np.empty(0, dtype=int)
+
+    if rr.size == 0:
+        return np.zeros((0, 0), dtype=bool), (0, 0)
+
+    y_min, x_min = int(rr.min()), int(cc.min())
+    roi = np.zeros((int(rr.max()) - y_min + 1, int(cc.max()) - x_min + 1), dtype=bool)
+    roi[rr - y_min, cc - x_min] = True
+
+    return roi, (y_min, x_min)
+
+
 def nested_contours_to_mask(
         contours: Contour | Contours,
         shape: tuple[int, int],
@@ -63,17 +97,34 @@ def nested_contours_to_mask(
     contours = [contours[i] for i in order]
     areas = [areas[i] for i in order]
 
-    mask = np.zeros(shape, dtype=bool)
+    if is_empty(contours):
+        return np.zeros(shape, dtype=bool)
+
+    # Rasterise (and thin) only within the contours' bounding box; the margin
+    # keeps the box edges empty so thinning behaves as on the full frame.
+    # An even offset keeps np.round's half-to-even ties on the same pixels.
+    y_min, y_max, x_min, x_max = compute_crop_bounds(contours, margin=2, image_shape=shape)
+    if y_max <= y_min or x_max <= x_min:  # contours entirely outside the frame
+        return np.zeros(shape, dtype=bool)
+    y_min, x_min = y_min - y_min % 2, x_min - x_min % 2
+    offset = np.array([y_min, x_min])
+    box_shape = (y_max - y_min, x_max - x_min)
+
+    box = np.zeros(box_shape, dtype=bool)
 
     for i, contour in enumerate(contours):
-        r, c = contour[:, 0], contour[:, 1]
+        r, c = (contour - offset).T
         if border_only:
-            rr, cc = polygon_perimeter(r, c, shape, clip=True)
-            mask[rr, cc] = True
+            rr, cc = polygon_perimeter(r, c, box_shape, clip=True)
+            box[rr, cc] = True
         else:
-            rr, cc = polygon(r, c, shape)
-            mask[rr, cc] = areas[i] > 0  # CCW = True, CW = False
+            rr, cc = polygon(r, c, box_shape)
+            box[rr, cc] = areas[i] > 0  # CCW = True, CW = False
 
     if border_only:
-        return thin(mask)
+        box = thin(box)
+
+    mask = np.zeros(shape, dtype=bool)
+    mask[y_min:y_max, x_min:x_max] = box
+
     return mask
@@ -2,24 +2,87 @@ import numpy as np
 from astropy.io import fits
 from glob import glob
 from os import path
-from typing import Literal
+from typing import Iterable, Literal
 
 from scr.utils.types_alias import Headers
 from scr.physics.magnetic import compute_Bhor
 
 
-def load_image(
-        filename: str,
-        quantity: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] | int
+def _read_plane(
+        hdu: fits.ImageHDU | fits.CompImageHDU,
+        plane: int = 0,
+        dtype: type = np.float32,
+        window: tuple[int, int, int, int] | None = None,
+) -> np.ndarray:
+    # `.section` reads (and for tiled compression, decompresses) only the
+    # requested plane instead of the whole cube
+    if window is None:
+        return np.asarray(hdu.section[plane], dtype=dtype)
+
+    # Read only the (y_min, y_max, x_min, x_max) window; parts of the window
+    # outside the image are filled with NaN
+    y_min, y_max, x_min, x_max = window
+    ny, nx = hdu.shape[-2:]
+
+    out = np.full((y_max - y_min, x_max - x_min), np.nan, dtype=dtype)
+
+    y0, y1 = max(y_min, 0), min(y_max, ny)
+    x0, x1 = max(x_min, 0), min(x_max, nx)
+    if y0 < y1 and x0 < x1:
+        out[y0 - y_min:y1 - y_min, x0 - x_min:x1 - x_min] = hdu.section[plane, y0:y1, x0:x1]
+
+    return out
+
+
+def _read_quantity(
+        hdul: fits.HDUList,
+        quantity: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] | int,
+        window: tuple[int, int, int, int] | None = None,
 ) -> np.ndarray:
     if quantity == "Bhor":
-        Bp = np.asarray(fits.getdata(filename, "Bp", memmap=True), dtype=np.float64)[0]
-        Bt = np.asarray(fits.getdata(filename, "Bt", memmap=True), dtype=np.float64)[0]
+        Bp = _read_plane(hdul["Bp"], dtype=np.float64, window=window)
+        Bt = _read_plane(hdul["Bt"], dtype=np.float64, window=window)
         return compute_Bhor(Bp=Bp, Bt=Bt).astype(np.float32)
 
     if quantity == "Bver":
         quantity = "Br"
-    return np.asarray(fits.getdata(filename, quantity, memmap=True), dtype=np.float32)[0]
+    return _read_plane(hdul[quantity], window=window)
+
+
+def load_hdu_plane(
+        filename: str,
+        ext: int | str = 1,
+        plane: int = 0,
+        dtype: type = np.float32,
+) -> np.ndarray:
+    """
+    Load a single 2D plane of a (possibly tile-compressed) image cube.
+    """
+    with fits.open(filename, memmap=True) as hdul:
+        return _read_plane(hdul[ext], plane=plane, dtype=dtype)
+
+
+def load_images(
+        filename: str,
+        quantities: Iterable[Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] | int],
+        window: tuple[int, int, int, int] | None = None,
+) -> dict[str | int, np.ndarray]:
+    """
+    Load several quantities from one FITS file, opening it only once.
+
+    If `window` = (ymin, ymax, xmin, xmax) is given, only that region is read;
+    parts of the window outside the image are filled with NaN.
+    """
+    with fits.open(filename, memmap=True, lazy_load_hdus=True) as hdul:
+        return {quantity: _read_quantity(hdul, quantity, window=window) for quantity in quantities}
+
+
+def load_image(
+        filename: str,
+        quantity: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] | int,
+        window: tuple[int, int, int, int] | None = None,
+) -> np.ndarray:
+    return load_images(filename, (quantity,), window=window)[quantity]
 
 
 def load_fits_headers(
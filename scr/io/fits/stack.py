@@ -1,4 +1,6 @@
 import numpy as np
+from collections.abc import Sequence
+from functools import lru_cache
 from glob import glob
 from os import path
 from typing import Literal
@@ -67,3 +69,32 @@ def load_fits_stack(
             result[i] = data
 
     return result
+
+
+class LazyFitsStack(Sequence):
+    """
+    Read-on-access sequence of one quantity over a list of FITS files.
+
+    Drop-in for the `load_fits_stack` array when frames are visited in order:
+    only the `cache_size` most recently accessed frames are held in memory.
+    """
+    def __init__(
+            self,
+            filename_list: list[str],
+            quantity: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] | int,
+            cache_size: int = 2
+    ):
+        self.filename_list = list(filename_list)
+        self.quantity = quantity
+        self._load = lru_cache(maxsize=cache_size)(self._read)
+
+    def _read(self, index: int) -> np.ndarray:
+        return load_image(self.filename_list[index], self.quantity)
+
+    def __len__(self) -> int:
+        return len(self.filename_list)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Frame index {index} out of range.")
+        return self._load(index % len(self))
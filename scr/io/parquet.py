@@ -1,11 +1,31 @@
 import pandas as pd
 
 
-def load_parquet(filename: str) -> pd.DataFrame:
-    """Load a parquet file into a DataFrame."""
-    return pd.read_parquet(filename)
+def load_parquet(
+        filename: str,
+        columns: list[str] | None = None,
+        filters: list[tuple] | list[list[tuple]] | None = None,
+) -> pd.DataFrame:
+    """
+    Load a parquet file into a DataFrame.
 
+    `columns` and `filters` are pushed down to the parquet reader, so only the
+    requested columns and the row groups/rows matching the predicates are read.
+    """
+    return pd.read_parquet(filename, columns=columns, filters=filters)
 
-def save_parquet(filename: str, df: pd.DataFrame) -> None:
-    """Save a parquet file into a DataFrame."""
-    df.to_parquet(filename, index=False)
+
+def save_parquet(
+        filename: str,
+        df: pd.DataFrame,
+        compression: str | None = "snappy",
+        row_group_size: int | None = None,
+) -> None:
+    """
+    Save a DataFrame into a parquet file.
+
+    `row_group_size` chunks the file along rows; smaller row groups let
+    filtered reads skip more of the file.
+    """
+    kwargs = {} if row_group_size is None else {"row_group_size": row_group_size}
+    df.to_parquet(filename, index=False, compression=compression, **kwargs)
@@ -1,4 +1,10 @@
 import pickle
+from os import path
+from typing import Callable, TypeVar
+
+from scr.utils.filesystem import check_dir
+
+T = TypeVar("T")
 
 
 def load_pickle(filename: str):
@@ -11,3 +17,28 @@ def save_pickle(filename: str, obj) -> None:
     """Save a pickle file without schema assumptions."""
     with open(filename, "wb") as f:
         pickle.dump(obj, f)
+
+
+def load_or_build_pickle(
+        filename: str,
+        build: Callable[[], T],
+        force_rebuild: bool = False,
+        is_valid: Callable[[T], bool] | None = None,
+) -> T:
+    """
+    Return the object cached in `filename`, or build it and cache it there.
+
+    The cache is not invalidated automatically: key `filename` on the inputs
+    behind `build`, pass `is_valid` to reject (and rebuild) a stale cached
+    object, or pass `force_rebuild=True`.
+    """
+    if not force_rebuild and path.isfile(filename):
+        obj = load_pickle(filename)
+        if is_valid is None or is_valid(obj):
+            return obj
+
+    obj = build()
+    check_dir(filename, is_file=True)
+    save_pickle(filename, obj)
+
+    return obj
@@ -1,3 +1,5 @@
+from typing import Iterable, Literal
+
 from scr.utils.types_alias import StatsByObject
 from scr.utils.filesystem import check_dir
 
@@ -5,23 +7,28 @@ from scr.io.npz import load_npz, save_npz
 
 
 def load_tracks_and_stats(
-        filename: str
-) -> tuple[dict, StatsByObject, dict]:
+        filename: str,
+        keys: Iterable[Literal["tracks", "stats", "metadata"]] = ("tracks", "stats", "metadata"),
+) -> tuple[dict | None, StatsByObject | None, dict | None]:
     """
     Load track data, statistics, and metadata from a .npz file.
 
     Parameters:
         filename: Path to the saved .npz archive.
+        keys: Archive entries to decode. Entries are decompressed and unpickled
+            only on access, so skipping the large ones (usually "tracks") saves most
+            of the load time. Skipped entries are returned as None.
 
     Returns:
         Tuple of (tracks, stats, metadata) dictionaries.
     """
-    data = load_npz(filename)
-    return (
-        data["tracks"].item(),
-        data["stats"].item(),
-        data["metadata"].item(),
-    )
+    keys = set(keys)
+
+    with load_npz(filename) as data:
+        return tuple(
+            data[key].item() if key in keys else None
+            for key in ("tracks", "stats", "metadata")
+        )
 
 
 def save_tracks_and_stats(
@@ -3,9 +3,11 @@ from skimage.draw import polygon2mask
 from skimage.transform import rescale, resize
 
 from scr.utils.types_alias import Contour, Contours, Mask
+from scr.utils.filesystem import is_empty
 
 from scr.geometry.contours.normalization import normalize_contour_input
 from scr.geometry.contours.area import contour_signed_area
+from scr.geometry.crop.bounds import compute_crop_bounds
 
 
 def filling_factor_mask(
@@ -14,6 +16,32 @@ def filling_factor_mask(
         oversample: int = 5
 ) -> Mask:
     contours = normalize_contour_input(contours)
+    if is_empty(contours):
+        return np.zeros(shape, dtype=float)
+
+    # Rasterise only the contours' bounding box: the filling factor is zero
+    # elsewhere. The margin keeps the anti-aliasing kernel (a few high-res
+    # pixels) inside the box, so the values equal those of a full-frame pass.
+    y_min, y_max, x_min, x_max = compute_crop_bounds(contours, margin=3, image_shape=shape)
+    if y_max <= y_min or x_max <= x_min:  # contours entirely outside the frame
+        return np.zeros(shape, dtype=float)
+    offset = np.array([y_min, x_min])
+
+    filling_factor = np.zeros(shape, dtype=float)
+    filling_factor[y_min:y_max, x_min:x_max] = _filling_factor_mask(
+        [contour - offset for contour in contours],
+        shape=(y_max - y_min, x_max - x_min),
+        oversample=oversample,
+    )
+
+    return filling_factor
+
+
+def _filling_factor_mask(
+        contours: Contours,
+        shape: tuple[int, int],
+        oversample: int = 5
+) -> Mask:
     highres_shape = (shape[0] * oversample, shape[1] * oversample)
 
     # highres_contours = [contour * oversample for contour in contours]
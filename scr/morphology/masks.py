@@ -27,13 +27,13 @@ def compute_masks(
         If provided, each filling mask will have mask_holes subtracted
         (useful to remove umbra from penumbra). Should be same shape.
     dtype : numpy dtype, optional
-        dtype for masks (default float32)
+        dtype for the filling-factor masks (default float32)
 
     Returns
     -------
     masks : list of 2D float arrays
         Filling-factor masks (values in [0,1])  one per contour (may be empty list).
-    masks_border : list of 2D float arrays
+    masks_border : list of 2D bool arrays
         Border (1-px) masks  one per contour (may be empty list).
     """
     # treat None or empty list as empty
@@ -47,9 +47,7 @@ def compute_masks(
     if not is_empty(mask_holes):
         masks = [subtract_filling_masks(m, mask_holes).astype(dtype) for m in masks]
 
-    # border masks (one-pixel borders)
-    masks_border = [
-        nested_contours_to_mask(c, shape, border_only=True).astype(dtype) for c in contours
-    ]
+    # border masks (one-pixel borders); binary, so kept as bool
+    masks_border = [nested_contours_to_mask(c, shape, border_only=True) for c in contours]
 
     return masks, masks_border
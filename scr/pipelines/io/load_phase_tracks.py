@@ -1,10 +1,14 @@
+import hashlib
 import pandas as pd
+from os import path
 from typing import Literal
 
 from scr.utils.types_alias import SunspotsPhasesByObservation
 from scr.config.filtering import gimme_filtering_kwargs
+from scr.config.paths import PATH_CACHE
 
 from scr.io.datasets import load_contours_and_df_stat
+from scr.io.pickle import load_or_build_pickle
 
 from scr.stats.dataframe.filtering import filter_combined_df
 
@@ -13,10 +17,16 @@ def load_filtered_phase_tracks(
         nosuffix_filename: str,
         mode: Literal["sunspots", "pores", "all_sunspots", "all_pores"],
         drop_unknown: bool = True,
+        use_cache: bool = False,
 ) -> tuple[SunspotsPhasesByObservation, pd.DataFrame]:
     """
     Load contour phase tracks and apply standard filtering.
 
+    With `use_cache=True` the filtered result is pickled under PATH_CACHE and
+    reused by later calls (from any script) with the same inputs. The cache
+    key includes the modification times of the .npz/.parquet files and the
+    filtering configuration, so it is rebuilt whenever either changes.
+
     Returns
     -------
     contours_phases : dict
@@ -24,9 +34,28 @@ def load_filtered_phase_tracks(
     combined_df : pandas.DataFrame
         Filtered metadata table.
     """
+    filtering_kwargs = gimme_filtering_kwargs(mode=mode)
+
+    if use_cache:
+        for suffix in [".npz", ".parquet"]:
+            if nosuffix_filename.endswith(suffix):
+                nosuffix_filename = nosuffix_filename[:-len(suffix)]
+
+        cache_key = repr((
+            path.abspath(nosuffix_filename),
+            path.getmtime(f"{nosuffix_filename}.npz"),
+            path.getmtime(f"{nosuffix_filename}.parquet"),
+            mode,
+            drop_unknown,
+            filtering_kwargs,
+        ))
+        return load_or_build_pickle(
+            path.join(PATH_CACHE, f"phase_tracks_{hashlib.sha1(cache_key.encode()).hexdigest()}.pkl"),
+            lambda: load_filtered_phase_tracks(nosuffix_filename, mode=mode, drop_unknown=drop_unknown),
+        )
+
     contours_phases, combined_df = load_contours_and_df_stat(nosuffix_filename)
 
-    filtering_kwargs = gimme_filtering_kwargs(mode=mode)
     combined_df = filter_combined_df(
         combined_df,
         filtering_kwargs=filtering_kwargs,
@@ -19,7 +19,7 @@ def compute_stats_from_contours(
     """
     Returns: tracks, stats, metadata
     """
-    tracks, _, metadata = load_tracks_and_stats(contour_file)
+    tracks, _, metadata = load_tracks_and_stats(contour_file, keys=("tracks", "metadata"))
     metadata |= {
         "contour_path": contour_file,
         "quantities": quantities,
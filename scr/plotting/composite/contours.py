@@ -2,7 +2,7 @@ from matplotlib.axes import Axes
 from typing import Sequence
 
 from scr.plotting.types import ContourGroup
-from scr.plotting.generic.contours import plot_contours
+from scr.plotting.generic.contours import plot_packed_contours
 
 
 def plot_contour_groups(
@@ -17,9 +17,10 @@ def plot_contour_groups(
     for group in contour_groups:
         style = default_contour_kwargs | group.style
 
-        plot_contours(
+        plot_packed_contours(
             ax,
-            group.contours,
+            group.vertices,
+            group.offsets,
             label=group.label,
             contour_kwargs=style,
         )
@@ -37,3 +37,40 @@ def plot_contours(
         handles.append(h)
 
     return handles
+
+
+def plot_packed_contours(
+        ax: Axes,
+        vertices: np.ndarray,
+        offsets: np.ndarray,
+        *,
+        label: str | None = None,
+        contour_kwargs: dict | None = None,
+) -> list[Line2D]:
+    """
+    Plot contours stored as stacked vertices with offsets.
+
+    Drop-in counterpart of `plot_contours`: `vertices` has shape (N, 2) with
+    columns (row, col) and contour i spans ``vertices[offsets[i]:offsets[i + 1]]``.
+    The contours are separated by NaN rows and drawn as one artist, so the returned
+    list holds a single handle (none if there are no contours); as in `plot_contours`,
+    `label` gives the group one legend entry.
+    """
+    contour_kwargs = merge_explicit_kwargs(contour_kwargs)
+
+    if len(offsets) < 2:
+        return []
+
+    if np.ndim(vertices) != 2 or np.shape(vertices)[1] != 2:
+        raise ValueError("Vertices must have shape (N, 2)")
+
+    points = np.insert(np.asarray(vertices, dtype=float), offsets[1:-1], np.nan, axis=0)
+
+    h, = ax.plot(
+        points[:, 1],  # x
+        points[:, 0],  # y
+        label=label,
+        **contour_kwargs,
+    )
+
+    return [h]
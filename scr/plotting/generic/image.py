@@ -15,16 +15,26 @@ def plot_image(
         vmax: float | None = None,
         origin: Literal["upper", "lower"] = "lower",
         image_kwargs: dict | None = None,
+        max_display_size: int | None = None,
 ) -> AxesImage:
     """
     Plot a 2D image on given axes.
+
+    If `max_display_size` is given and the image is larger along either axis,
+    it is decimated by an integer stride before plotting. The extent is kept
+    in original pixel coordinates, so overlaid contours stay aligned.
     """
+    extent = None
+    if max_display_size is not None and (image_kwargs or {}).get("extent") is None:
+        image, extent = _decimate_for_display(image, max_display_size, origin=origin)
+
     image_kwargs = merge_explicit_kwargs(
         image_kwargs,
         cmap=cmap,
         vmin=vmin,
         vmax=vmax,
         origin=origin,
+        extent=extent,
     )
 
     im = ax.imshow(
@@ -33,3 +43,23 @@ def plot_image(
     )
 
     return im
+
+
+def _decimate_for_display(
+        image: np.ndarray,
+        max_display_size: int,
+        *,
+        origin: Literal["upper", "lower"] = "lower",
+) -> tuple[np.ndarray, tuple[float, float, float, float] | None]:
+    step = int(np.ceil(max(np.shape(image)[:2]) / max_display_size))
+    if step <= 1:
+        return image, None
+
+    decimated = image[::step, ::step]
+    ny, nx = np.shape(decimated)[:2]
+
+    # Each decimated pixel spans `step` original pixels, centred on the pixel it was taken from
+    x_extent = (-0.5 * step, (nx - 0.5) * step)
+    y_extent = (-0.5 * step, (ny - 0.5) * step) if origin == "lower" else ((ny - 0.5) * step, -0.5 * step)
+
+    return decimated, (*x_extent, *y_extent)
@@ -1,10 +1,25 @@
 import numpy as np
 from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
 from typing import Sequence
 
 from scr.plotting.utils import merge_explicit_kwargs
 
 
+def segment_colors(
+        color_labels: Sequence[str],
+        colors: dict[str, str],
+) -> np.ndarray:
+    """
+    RGBA colour of each segment between consecutive points.
+
+    Segment i is coloured according to color_labels[i]; each distinct label
+    is converted only once.
+    """
+    labels, inverse = np.unique(np.asarray(color_labels)[:-1], return_inverse=True)
+    return to_rgba_array([colors[label] for label in labels])[inverse]
+
+
 def make_colored_segments(
         x: Sequence[float],
         y: Sequence[float],
@@ -13,11 +28,13 @@ def make_colored_segments(
         linestyle: str = "-",
         linewidth: float = 2,
         segment_kwargs: dict | None = None,
+        seg_colors: np.ndarray | None = None,
 ) -> LineCollection:
     """
     Build a LineCollection with per-segment coloring.
 
-    Segment i is coloured according to color_labels[i].
+    Segment i is coloured according to color_labels[i]. Pass `seg_colors`
+    (from `segment_colors`) to reuse colours computed for the same labels.
     """
     if not (len(x) == len(y) == len(color_labels)):
         raise ValueError("x, y and color_labels must have the same length")
@@ -25,7 +42,7 @@ def make_colored_segments(
     pts = np.array([x, y]).T.reshape(-1, 1, 2)
     segs = np.concatenate([pts[:-1], pts[1:]], axis=1)
 
-    seg_cols = [colors[c] for c in color_labels[:-1]]
+    seg_cols = segment_colors(color_labels, colors) if seg_colors is None else seg_colors
 
     segment_kwargs = merge_explicit_kwargs(
         segment_kwargs,
@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Callable
 
 from scr.plotting.types import ContourGroup
@@ -27,8 +28,8 @@ def contour_groups_from_tracks(
             continue
 
         contour_groups.append(
-            ContourGroup(
-                contours=contours,
+            ContourGroup.from_polylines(
+                contours,
                 style=style_resolver(track_id),
                 label=str(track_id),
             )
@@ -55,17 +56,16 @@ def contour_groups_from_sunspots(
     obs_data = nested_tracks.get(observation_id, {})
 
     for sunspot_id, sunspot_data in obs_data.items():
-        merged: list = []
-
-        for part_tracks in sunspot_data.values():
-            merged.extend(part_tracks.get(frame, []))
+        merged = list(chain.from_iterable(
+            part_tracks.get(frame, ()) for part_tracks in sunspot_data.values()
+        ))
 
         if not merged:
             continue
 
         contour_groups.append(
-            ContourGroup(
-                contours=merged,
+            ContourGroup.from_polylines(
+                merged,
                 style=style_resolver(sunspot_id),
                 label=str(sunspot_id),
             )
@@ -96,17 +96,16 @@ def contour_groups_from_sunspot_phases(
         # exactly one phase per sunspot per frame
         for phase, phase_data in sunspot_data.items():
 
-            merged: list = []
-
-            for part_tracks in phase_data.values():
-                merged.extend(part_tracks.get(frame, []))
+            merged = list(chain.from_iterable(
+                part_tracks.get(frame, ()) for part_tracks in phase_data.values()
+            ))
 
             if not merged:
                 continue
 
             contour_groups.append(
-                ContourGroup(
-                    contours=merged,
+                ContourGroup.from_polylines(
+                    merged,
                     style=style_resolver(sunspot_id, phase),
                     label=str(sunspot_id),
                     # label=f"{sunspot_id}:{phase}",
@@ -18,6 +18,8 @@ def render_scene(
         vmax: float | None = None,
         origin: Literal["upper", "lower"] = "lower",
         image_kwargs: dict | None = None,
+        max_display_size: int | None = None,
+        rasterize_image: bool = True,
         contour_kwargs: dict | None = None,
         annotations: Callable[[Axes, Sequence[ContourGroup]], None] | None = None,
         return_image: bool = False,
@@ -25,7 +27,9 @@ def render_scene(
     """
     Render a single plotting scene on one Axes.
 
-    This is a pure composition helper.
+    This is a pure composition helper. Large images can be decimated for
+    display with `max_display_size` (see `plot_image`). The image is
+    rasterized at the savefig dpi by default, while contours stay vector.
     """
     im = None
 
@@ -37,7 +41,8 @@ def render_scene(
             vmin=vmin,
             vmax=vmax,
             origin=origin,
-            image_kwargs=image_kwargs,
+            image_kwargs={"rasterized": rasterize_image, **(image_kwargs or {})},
+            max_display_size=max_display_size,
         )
 
     if contour_groups:
@@ -47,8 +52,13 @@ def render_scene(
         annotations(ax, contour_groups)
 
     if im is not None:
-        ax.set_xlim(im.get_extent()[:2])
-        ax.set_ylim(im.get_extent()[2:])
+        # An explicit extent is what the image was drawn with; only ask
+        # matplotlib for it when the default pixel extent was used
+        extent = (image_kwargs or {}).get("extent")
+        if extent is None:
+            extent = im.get_extent()
+        ax.set_xlim(extent[0], extent[1])
+        ax.set_ylim(extent[2], extent[3])
 
     if return_image:
         return im
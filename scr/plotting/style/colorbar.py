@@ -3,7 +3,6 @@ from matplotlib.cm import ScalarMappable
 from matplotlib.colorbar import Colorbar
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 from matplotlib.ticker import Formatter
-import matplotlib.pyplot as plt
 from typing import Callable
 
 
@@ -21,7 +20,7 @@ def add_colorbar(
     divider = make_axes_locatable(ax)
     cax = divider.append_axes(**cbar_kwargs)
 
-    cbar = plt.colorbar(mappable, cax=cax)
+    cbar = cax.figure.colorbar(mappable, cax=cax)
 
     if formatter is not None:
         cbar.ax.yaxis.set_major_formatter(formatter)
@@ -30,5 +30,8 @@ def id_colors(
         ids: Iterable[int],
         cmap: str
 ) -> dict[int, np.ndarray]:
-    ids = list(ids)
-    return dict(zip(ids, sample_cmap(cmap, len(ids))))
+    # Sized inputs (lists, arrays) are converted directly; only generic
+    # iterables need an intermediate list.
+    ids = np.asarray(ids if hasattr(ids, "__len__") else list(ids))
+    colors = sample_cmap(cmap, ids.size)
+    return {int(i): colors[j] for j, i in enumerate(ids)}
@@ -1,5 +1,30 @@
-import matplotlib.pyplot as plt
+import matplotlib
+from functools import lru_cache
 from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Mapping
+
+
+@lru_cache(maxsize=None)
+def _latex_rc(
+        fontsize: int,
+        use_tex: bool,
+        amsmath: bool,
+) -> Mapping:
+    """
+    Build (once per argument combination) the rcParams for LaTeX-style plotting.
+
+    The cached mapping is read-only, so no caller can alter it for later calls.
+    """
+    rc = {
+        "text.usetex": use_tex,
+        "font.size": fontsize,
+    }
+
+    if use_tex and amsmath:
+        rc["text.latex.preamble"] = r"\usepackage{amsmath}"
+
+    return MappingProxyType(rc)
 
 
 def latex_setup(
@@ -19,14 +44,7 @@ def latex_setup(
     amsmath : bool
         Whether to include amsmath in the LaTeX preamble.
     """
-    plt.rc("text", usetex=use_tex)
-
-    if use_tex and amsmath:
-        plt.rcParams["text.latex.preamble"] = r"\usepackage{amsmath}"
-
-    plt.rcParams.update({
-        "font.size": fontsize,
-    })
+    matplotlib.rcParams.update(_latex_rc(fontsize, use_tex, amsmath))
 
 
 @contextmanager
@@ -35,10 +53,14 @@ def latex_style(
         use_tex: bool = True,
         amsmath: bool = True,
 ):
-    old_rc = plt.rcParams.copy()
-    latex_setup(fontsize, use_tex, amsmath)
-    try:
+    rc = _latex_rc(fontsize, use_tex, amsmath)
+
+    # Already in this style (latex_setup or an enclosing latex_style):
+    # skip the rcParam round trip, the usetex toggle is the expensive part
+    if all(matplotlib.rcParams[key] == value for key, value in rc.items()):
         yield
-    finally:
-        plt.rcParams.update(old_rc)
+        return
 
+    # rc_context restores the previous state without re-validating every rcParam
+    with matplotlib.rc_context(rc):
+        yield
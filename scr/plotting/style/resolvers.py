@@ -1,20 +1,23 @@
 import numpy as np
-from typing import Callable
+from types import MappingProxyType
+from typing import Callable, Mapping
 
 from scr.plotting.types import ContourGroup
 
+# Read-only, so the shared default cannot be mutated by one scene for the rest
+_DEFAULT_STYLE: Mapping = MappingProxyType(ContourGroup(contours=[]).style)
 
-def default_style_resolver() -> Callable[..., dict]:
+
+def _default_resolver(*args) -> Mapping:
+    return _DEFAULT_STYLE
+
+
+def default_style_resolver() -> Callable[..., Mapping]:
     """
     Return a resolver that always yields the default ContourGroup style.
     Accepts arbitrary positional arguments (id, id+phase, etc.).
     """
-    default = ContourGroup(contours=[]).style
-
-    def resolver(*args) -> dict:
-        return default
-
-    return resolver
+    return _default_resolver
 
 
 def track_style_resolver(
@@ -15,9 +15,13 @@ def add_colored_timeseries(
         linestyle: str = "-",
         linewidth: float = 2,
         segment_kwargs: dict | None = None,
+        seg_colors: np.ndarray | None = None,
 ) -> LineCollection:
     """
     Add a continuous phase-coloured timeseries to an axis.
+
+    When several series share the same phases, compute their colours once
+    with `segment_colors` and pass them as `seg_colors`.
     """
     lc = make_colored_segments(
         x=x,
@@ -27,11 +31,16 @@ def add_colored_timeseries(
         linestyle=linestyle,
         linewidth=linewidth,
         segment_kwargs=segment_kwargs,
+        seg_colors=seg_colors,
     )
     lc.set_transform(ax.transData)
     ax.add_collection(lc)
 
-    ax.set_xlim(np.nanmin(x), np.nanmax(x))
+    # Convert and filter once; nanmin/nanmax would each re-convert `x`
+    x_finite = np.asarray(x, dtype=float)
+    x_finite = x_finite[np.isfinite(x_finite)]
+    if x_finite.size > 0:
+        ax.set_xlim(x_finite.min(), x_finite.max())
     ax.autoscale_view(scalex=False, scaley=True)
 
     lc.set_zorder(3)
@@ -9,6 +9,11 @@ from scr.utils.types_alias import Contours
 class ContourGroup:
     """
     A styled group of contours to be plotted together.
+
+    At construction, the contours are also packed into a structure of arrays:
+    `vertices` holds all points stacked into one (N, 2) array and
+    `offsets` holds the K + 1 boundaries, so contour i is
+    ``vertices[offsets[i]:offsets[i + 1]]``.
     """
     contours: Contours
     style: dict = field(default_factory=lambda: {
@@ -18,6 +23,46 @@ class ContourGroup:
         "alpha": 1.0,
     })
     label: str | None = None
+    vertices: np.ndarray = field(init=False, repr=False, compare=False)
+    offsets: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for contour in self.contours:
+            if np.ndim(contour) != 2 or np.shape(contour)[1] != 2:
+                raise ValueError("Each contour must have shape (N, 2)")
+
+        lengths = [len(contour) for contour in self.contours]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.intp)
+        np.cumsum(lengths, out=offsets[1:])
+
+        if self.contours:
+            vertices = np.concatenate(self.contours, axis=0).astype(float, copy=False)
+        else:
+            vertices = np.empty((0, 2), dtype=float)
+
+        # frozen dataclass: bypass the generated __setattr__
+        object.__setattr__(self, "vertices", vertices)
+        object.__setattr__(self, "offsets", offsets)
+
+    @classmethod
+    def from_polylines(
+            cls,
+            polylines: Contours,
+            **kwargs,
+    ) -> "ContourGroup":
+        """
+        Build a group whose `contours` are views into the packed `vertices`.
+        """
+        group = cls(contours=list(polylines), **kwargs)
+        object.__setattr__(group, "contours", group.polylines)
+        return group
+
+    @property
+    def polylines(self) -> Contours:
+        """
+        Individual contours as views into `vertices`.
+        """
+        return np.split(self.vertices, self.offsets[1:-1])
 
 
 @dataclass
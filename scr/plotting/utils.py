@@ -23,10 +23,7 @@ def merge_explicit_kwargs(
     dict
         Merged kwargs dictionary.
     """
-    merged = {} if base is None else dict(base)
-
-    for key, value in explicit.items():
-        if value is not None:
-            merged[key] = value
-
-    return merged
+    return {
+        **(base or {}),
+        **{key: value for key, value in explicit.items() if value is not None},
+    }
@@ -21,7 +21,7 @@ def _linspace_frames(
     # Add two "virtual" endpoints, then drop them to avoid edges
     positions = np.linspace(0, len(frames) - 1, n + 2)[1:-1]
     indices = np.round(positions).astype(int)
-    return [frames[i] for i in indices]
+    return np.asarray(frames)[indices].tolist()
 
 
 def select_representative_frames(
@@ -59,11 +59,17 @@ def select_representative_frames(
     """
     frames_per_phase: dict[str, list[int]] = {}
 
+    # Split the frames by phase in a single pass instead of one mask per phase
+    grouped = {
+        phase: group.to_numpy()
+        for phase, group in df.groupby("phase", sort=False, observed=True)["frame"]
+    }
+
     # Collect sorted frames per available phase
     for phase in phases:
-        phase_frames = np.sort(df.loc[df["phase"] == phase, "frame"].to_numpy())
-        if len(phase_frames) > 0:
-            frames_per_phase[phase] = phase_frames.tolist()
+        phase_frames = grouped.get(phase)
+        if phase_frames is not None and len(phase_frames) > 0:
+            frames_per_phase[phase] = np.sort(phase_frames).tolist()
 
     if not frames_per_phase:
         return []
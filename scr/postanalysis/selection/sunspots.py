@@ -78,7 +78,8 @@ def apply_standard_sunspots_phases_filter(
     Returns
     -------
     dict
-        SunspotsPhases pruned to exactly those appearing in filtered_df
+        SunspotsPhases pruned to exactly those appearing in filtered_df,
+        with the frames of every region in increasing order
     """
 
     required_cols = {"observation_id", "sunspot_id", "phase", "frame"}
@@ -104,13 +105,24 @@ def apply_standard_sunspots_phases_filter(
                     continue
 
                 allowed_frames = frame_index[key]
+                if not allowed_frames:
+                    continue
+
+                ordered_allowed = sorted(allowed_frames)
 
                 for region, frames in spot.items():
-                    for frame, data in frames.items():
-                        if frame in allowed_frames:
-                            selected[obs_id] \
-                                .setdefault(spot_id, {}) \
-                                .setdefault(phase, {}) \
-                                .setdefault(region, {})[frame] = data
+                    # Walk whichever side is smaller and hash into the other;
+                    # both ways give the kept frames in increasing order
+                    if len(ordered_allowed) < len(frames):
+                        kept_frames = [frame for frame in ordered_allowed if frame in frames]
+                    else:
+                        kept_frames = sorted(frame for frame in frames if frame in allowed_frames)
+
+                    kept = {frame: frames[frame] for frame in kept_frames}
+
+                    if kept:
+                        selected[obs_id] \
+                            .setdefault(spot_id, {}) \
+                            .setdefault(phase, {})[region] = kept
 
     return selected
@@ -1,5 +1,9 @@
+import matplotlib
+matplotlib.use("Agg", force=True)  # also if an importer already selected a backend
+
 from os import path
 import numpy as np
+import pandas as pd
 from typing import Literal
 
 from scr.config.paths import PATH_CONTOURS_PHASES, PATH_VIDEOS
@@ -43,9 +47,11 @@ def main():
         nosuffix_filename=path.join(PATH_CONTOURS_PHASES, "all_sunspots_phases"),
         mode=MODE,
         drop_unknown=True,
+        use_cache=True,  # shared between the snapshot/animation scripts
     )
 
-    observation_id = np.unique(df["observation_id"])[obs_index]
+    # Hash-based unique + sort of the (few) distinct ids, not of every row
+    observation_id = np.sort(pd.unique(df["observation_id"].to_numpy()))[obs_index]
     df_obs = df[df["observation_id"] == observation_id]
     del df
 
@@ -2,23 +2,28 @@ import matplotlib
 matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 from os import path
 import numpy as np
+import pandas as pd
 from typing import Literal
 
-from scr.config.paths import PATH_CONTOURS_PHASES, PATH_FIGURES
+from scr.config.paths import PATH_CACHE, PATH_CONTOURS_PHASES, PATH_FIGURES
 from scr.config.figures import FIG_FORMAT, SAVEFIG_KWARGS
 from scr.config.plotting import PHASE_COLORS
 from scr.config.quantities import get_quantity_spec
-from scr.utils.filesystem import check_dir
+from scr.utils.filesystem import check_dir, files_signature, files_unchanged
+from scr.utils.numerics import nan_minmax
 
 from scr.geometry.crop.common import common_crop_shape_from_tracks
-from scr.geometry.crop.centered import crop_centered_fixed
+from scr.geometry.crop.centered import centered_crop_window
 from scr.geometry.contours.extraction import find_contours
 from scr.geometry.contours.transform import shift_contours
 from scr.contours.selection import select_support_contours
 
-from scr.io.fits.read import load_image
+from scr.io.fits.read import load_images
+from scr.io.pickle import load_or_build_pickle
 from scr.stats.dataframe.timeseries import add_relative_time
 from scr.pipelines.io.load_phase_tracks import load_filtered_phase_tracks
 from scr.postanalysis.selection.sunspots import apply_standard_sunspots_phases_filter
@@ -29,45 +34,45 @@ from scr.plotting.scene.frame_data import FrameData
 from scr.plotting.style.latex import latex_style
 
 
-def main():
+def prepare_data(
+        tracks_filename: str,
+        mode: Literal["sunspots", "pores"],
+        quantity: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"],
+        quantity_support: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"],
+        obs_index: int,
+        sunspot_id: int,
+        nrows: int,
+        ncols: int,
+        crop_margin: int,
+        key_region: str,
+) -> tuple[list[FrameData], float, float, np.ndarray, tuple]:
     """
-    Plot equidistant evolution snapshots of a single sunspot as a grid of images
-    with phase-colored contours and support contours overlaid.
+    Load the selected snapshots of one sunspot (FITS crops with primary and support contours)
+    and the global color limits; no plotting. The last item is the `files_signature` of the FITS files read.
     """
-    # ------------------------------------------------------------------
-    # Configuration
-    # ------------------------------------------------------------------
-    QUANTITY: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] = "Ic"
-    QUANTITY_SUPPORT: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] = "B"
-    MODE: Literal["sunspots", "pores"] = "sunspots"
-
-    obs_index = 45  # 45, 90, 136
-    sunspot_id = 0  # 0, 0, 1
-
-    nrows, ncols = 3, 5
-    crop_margin = 30
-    key_region = "outer"
-
-    spec = get_quantity_spec(QUANTITY)
-    spec_support = get_quantity_spec(QUANTITY_SUPPORT)
-
-    figure_outdir = path.join(PATH_FIGURES, "paper_plots")
-    check_dir(figure_outdir)
+    spec = get_quantity_spec(quantity)
+    spec_support = get_quantity_spec(quantity_support)
 
     # ------------------------------------------------------------------
     # Load phase tracks and select observation / sunspot
     # ------------------------------------------------------------------
     contours_phases, df = load_filtered_phase_tracks(
-        nosuffix_filename=path.join(PATH_CONTOURS_PHASES, "all_sunspots_phases"),
-        mode=MODE,
+        nosuffix_filename=tracks_filename,
+        mode=mode,
         drop_unknown=True,
+        use_cache=True,  # shared between the snapshot/animation scripts
     )
 
-    observation_id = np.unique(df["observation_id"])[obs_index]
-    df_obs = df[
-        (df["observation_id"] == observation_id)
-        & (df["sunspot_id"] == sunspot_id)
-    ]
+    # Keep only the columns used below
+    df = df[["observation_id", "sunspot_id", "frame", "phase", "image_path"]]
+
+    # Hash-based unique + sort of the (few) distinct ids, not of every row
+    observation_id = np.sort(pd.unique(df["observation_id"].to_numpy()))[obs_index]
+    df_obs = (
+        df
+        .groupby(["observation_id", "sunspot_id"], sort=False, observed=True)
+        .get_group((observation_id, sunspot_id))
+    )
     del df
 
     # Add time axis relative to first detection
@@ -93,30 +98,19 @@ def main():
     # ------------------------------------------------------------------
     # Prepare FrameData objects (pure data, no plotting)
     # ------------------------------------------------------------------
-    frames: list[FrameData] = []
-
     # Determine a common crop size across all selected frames
     target_shape = common_crop_shape_from_tracks(sunspot_phases, key_region=key_region, margin=crop_margin)
 
-    for _, row in df_sel.iterrows():
-        # Load primary and support images
-        image = load_image(row["image_path"], quantity=QUANTITY)
-        image_support = load_image(row["image_path"], quantity=QUANTITY_SUPPORT)
-
+    def build_frame(row: tuple) -> FrameData:
         # Primary contours for this frame
-        contours = sunspot_phases[row["phase"]][key_region][row["frame"]]
+        contours = sunspot_phases[row.phase][key_region][row.frame]
 
-        # Crop both images using the same fixed window
-        image, (y_offset, x_offset) = crop_centered_fixed(
-            image,
-            contours,
-            target_shape=target_shape,
-        )
-        image_support, _ = crop_centered_fixed(
-            image_support,
-            contours,
-            target_shape=target_shape,
-        )
+        # Read only the fixed crop window of the primary and support images
+        window = centered_crop_window(contours, target_shape=target_shape)
+        y_offset, x_offset = window[0], window[2]
+
+        images = load_images(row.image_path, quantities=(quantity, quantity_support), window=window)
+        image, image_support = images[quantity], images[quantity_support]
 
         # Shift contours into the cropped image coordinate system
         contours = shift_contours(
@@ -139,7 +133,7 @@ def main():
             ContourGroup(
                 contours=contours,
                 style={
-                    "color": PHASE_COLORS[row["phase"]],
+                    "color": PHASE_COLORS[row.phase],
                     "linewidth": 1.5,
                     "linestyle": "-",
                 },
@@ -156,22 +150,79 @@ def main():
             ),
         ]
 
-        frames.append(
-            FrameData(
-                image=image,
-                contour_groups=contour_groups,
-            )
+        return FrameData(
+            image=image,
+            contour_groups=contour_groups,
         )
 
+    # Frames are independent (FITS read, crop, contour extraction) and the
+    # heavy parts release the GIL, so build them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(df_sel)))) as executor:
+        frames: list[FrameData] = list(executor.map(build_frame, df_sel.itertuples(index=False)))
+
     # ------------------------------------------------------------------
     # Global color scaling
     # ------------------------------------------------------------------
-    vmin = np.nanmin([np.nanmin(frame.image) for frame in frames])
-    vmax = np.nanmax([np.nanmax(frame.image) for frame in frames])
+    vmin, vmax = nan_minmax(frame.image for frame in frames)
+
+    # FITS files read above; a cached result is stale once any of them changes
+    fits_signature = files_signature(df_sel["image_path"].unique())
+
+    return frames, vmin, vmax, df_sel["time_hours"].to_numpy(), fits_signature
+
+
+def main():
+    """
+    Plot equidistant evolution snapshots of a single sunspot as a grid of images
+    with phase-colored contours and support contours overlaid.
+    """
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    QUANTITY: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] = "Ic"
+    QUANTITY_SUPPORT: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] = "B"
+    MODE: Literal["sunspots", "pores"] = "sunspots"
+
+    obs_index = 45  # 45, 90, 136
+    sunspot_id = 0  # 0, 0, 1
+
+    nrows, ncols = 3, 5
+    crop_margin = 30
+    key_region = "outer"
+
+    FORCE_REBUILD = False  # ignore cached frames
+
+    tracks_filename = path.join(PATH_CONTOURS_PHASES, "all_sunspots_phases")
+
+    figure_outdir = path.join(PATH_FIGURES, "paper_plots")
+    check_dir(figure_outdir)
+
+    # ------------------------------------------------------------------
+    # Load or rebuild the plotting data
+    # ------------------------------------------------------------------
+    # The plotting data depend only on the configuration and the input files, so reruns
+    # that only change styling reuse the cached frames. The key includes the phase-track
+    # files (path and modification time); the FITS files read are checked on load.
+    config = dict(
+        mode=MODE, quantity=QUANTITY, quantity_support=QUANTITY_SUPPORT, obs_index=obs_index,
+        sunspot_id=sunspot_id, nrows=nrows, ncols=ncols, crop_margin=crop_margin, key_region=key_region,
+    )
+    cache_key = repr((
+        "evolution_snapshots",
+        files_signature([f"{tracks_filename}.npz", f"{tracks_filename}.parquet"]),
+        sorted(config.items()),
+    ))
+    cache_file = path.join(PATH_CACHE, f"{hashlib.sha1(cache_key.encode()).hexdigest()}.pkl")
+
+    frames, vmin, vmax, time_hours, _ = load_or_build_pickle(
+        cache_file,
+        lambda: prepare_data(tracks_filename, **config),
+        force_rebuild=FORCE_REBUILD,
+        is_valid=lambda data: files_unchanged(data[-1]),
+    )
 
     # Pixel scale (arcsec per pixel, for aspect ratio only)
     dx, dy = 0.29714842896202537, 0.31997767629244117
-    time_hours = df_sel["time_hours"]
 
     # ------------------------------------------------------------------
     # Plot
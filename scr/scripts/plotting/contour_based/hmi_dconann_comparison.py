@@ -13,9 +13,13 @@ from scr.config.figures import FIG_FORMAT, SAVEFIG_KWARGS
 from scr.config.paths import PATH_FIGURES
 from scr.config.quantities import get_quantity_spec
 from scr.utils.filesystem import check_dir
+from scr.utils.numerics import nan_minmax
+
+from scr.io.fits.read import load_hdu_plane
 
 from scr.geometry.contours.area import contour_area
 from scr.geometry.contours.extraction import find_contours
+from scr.geometry.contours.transform import shift_contours
 from scr.geometry.crop.tight import crop_tight
 
 from scr.plotting.types import ContourGroup
@@ -46,27 +50,28 @@ def main():
     # ------------------------------------------------------------------
     # Load FITS data
     # ------------------------------------------------------------------
-    with fits.open(
+    dconANN = load_hdu_plane(
         "/nfsscratch/david/Contours/fits_to_plot/AR-11084_20100702_S19E07/"
-        "hmi.proc_720s_dconANN.20100702_040000_TAI.ibptr.fits"
-    ) as hdu:
-        dconANN = hdu[1].data[0]
+        "hmi.proc_720s_dconANN.20100702_040000_TAI.ibptr.fits",
+        ext=1,
+    )
 
-    with fits.open(
+    hmi_filename = (
         "/nfsscratch/david/Contours/fits_to_plot/AR-11084_20100702_S19E07/"
         "hmi.ic_720s.20100702_040000_TAI.1.continuum.fits"
-    ) as hdu:
-        hmi = hdu[1].data[0]
-        header = hdu[0].header
+    )
+    hmi = load_hdu_plane(hmi_filename, ext=1)
+    header = fits.getheader(hmi_filename, 0)
 
     # ------------------------------------------------------------------
     # Determine region of interest from strongest deconvolved contour
     # ------------------------------------------------------------------
-    dconANN_09 = sorted(
-        find_contours(dconANN, level=0.9),
-        key=contour_area,
-        reverse=True,
-    )[:1]
+    def largest_contours(image: np.ndarray, level: float) -> list[np.ndarray]:
+        # Only the largest contour is kept: a linear max, not a full sort
+        largest = max(find_contours(image, level=level), key=contour_area, default=None)
+        return [] if largest is None else [largest]
+
+    dconANN_09 = largest_contours(dconANN, level=0.9)
 
     # Crop both images using the same contour-defined window
     dconANN, (y_off, x_off) = crop_tight(
@@ -80,43 +85,31 @@ def main():
         margin=crop_margin,
     )
 
+    # The ROI contour lies inside the crop, so shifting it gives the same
+    # result as rescanning the cropped image at the same level
+    dconANN_09 = shift_contours(dconANN_09, y_offset=y_off, x_offset=x_off)
+
     # ------------------------------------------------------------------
     # Extract contours on cropped images
     # ------------------------------------------------------------------
     contour_groups = [
         ContourGroup(
-            contours=sorted(
-                find_contours(dconANN, level=0.5),
-                key=contour_area,
-                reverse=True,
-            )[:1],
+            contours=largest_contours(dconANN, level=0.5),
             style={"color": "yellow", "linewidth": 1.5, "linestyle": "--"},
             label="Deconvolved 0.5",
         ),
         ContourGroup(
-            contours=sorted(
-                find_contours(dconANN, level=0.9),
-                key=contour_area,
-                reverse=True,
-            )[:1],
+            contours=dconANN_09,
             style={"color": "green", "linewidth": 1.5, "linestyle": "--"},
             label="Deconvolved 0.9",
         ),
         ContourGroup(
-            contours=sorted(
-                find_contours(hmi, level=0.5),
-                key=contour_area,
-                reverse=True,
-            )[:1],
+            contours=largest_contours(hmi, level=0.5),
             style={"color": "red", "linewidth": 1.5, "linestyle": "-"},
             label="SDO/HMI 0.5",
         ),
         ContourGroup(
-            contours=sorted(
-                find_contours(hmi, level=0.9),
-                key=contour_area,
-                reverse=True,
-            )[:1],
+            contours=largest_contours(hmi, level=0.9),
             style={"color": "blue", "linewidth": 1.5, "linestyle": "-"},
             label="SDO/HMI 0.9",
         ),
@@ -141,8 +134,7 @@ def main():
     # ------------------------------------------------------------------
     # Global intensity scaling
     # ------------------------------------------------------------------
-    vmin = np.nanmin((hmi, dconANN))
-    vmax = np.nanmax((hmi, dconANN))
+    vmin, vmax = nan_minmax((hmi, dconANN))
 
     frame_left = FrameData(
         image=hmi,
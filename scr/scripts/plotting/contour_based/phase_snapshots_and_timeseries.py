@@ -2,81 +2,92 @@ import matplotlib
 matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 from matplotlib.gridspec import GridSpec
 from os import path
 import numpy as np
+import pandas as pd
 from typing import Literal
 
-from scr.config.paths import PATH_CONTOURS_PHASES, PATH_FIGURES
+from scr.config.paths import PATH_CACHE, PATH_CONTOURS_PHASES, PATH_FIGURES
 from scr.config.figures import FIG_FORMAT, SAVEFIG_KWARGS
 from scr.config.plotting import PHASE_COLORS
 from scr.config.quantities import get_quantity_spec
-from scr.utils.filesystem import check_dir
+from scr.utils.filesystem import check_dir, files_signature, files_unchanged
+from scr.utils.numerics import nan_minmax
 
 from scr.geometry.crop.common import common_crop_shape_from_tracks
-from scr.geometry.crop.centered import crop_centered_fixed
+from scr.geometry.crop.centered import centered_crop_window
 from scr.geometry.contours.transform import shift_contours
 
 from scr.io.fits.read import load_image
+from scr.io.pickle import load_or_build_pickle
 from scr.stats.dataframe.timeseries import add_relative_time
 from scr.pipelines.io.load_phase_tracks import load_filtered_phase_tracks
 from scr.postanalysis.selection.sunspots import apply_standard_sunspots_phases_filter
 from scr.postanalysis.selection.representative_frames import select_representative_frames
 
 from scr.plotting.types import ContourGroup
+from scr.plotting.generic.segments import segment_colors
 from scr.plotting.timeseries.colored import add_colored_timeseries
 from scr.plotting.scene.render import render_scene
 from scr.plotting.scene.frame_data import FrameData
 from scr.plotting.style.latex import latex_style
 
 
-def main() -> None:
-    # ------------------------------------------------------------------
-    # Configuration
-    # ------------------------------------------------------------------
-    QUANTITY_SNAPSHOTS: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] = "Ic"
-    QUANTITY_LINEPLOTS: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] = "B"
-
-    MODE: Literal["pores", "sunspots"] = "sunspots"
-
-    obs_index = 45  # 45, 90, 136
-    sunspot_id = 0  # 0, 0, 1
-
-    crop_margin = 20
-    key_region = "outer"
-
-    spec_snapshots = get_quantity_spec(QUANTITY_LINEPLOTS)
-    spec_lineplots = get_quantity_spec(QUANTITY_LINEPLOTS)
-
-    figure_outdir = path.join(PATH_FIGURES, "paper_plots")
-    check_dir(figure_outdir)
+def prepare_data(
+        tracks_filename: str,
+        mode: Literal["pores", "sunspots"],
+        quantity_snapshots: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"],
+        quantity_lineplots: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"],
+        obs_index: int,
+        sunspot_id: int,
+        crop_margin: int,
+        key_region: str,
+) -> tuple[list[FrameData], float, float, pd.DataFrame, pd.DataFrame, tuple]:
+    """
+    Load the representative snapshots of one sunspot (FITS crops with contours), the global
+    color limits and the selected / full time series rows; no plotting. The last item is
+    the `files_signature` of the FITS files read.
+    """
+    spec_snapshots = get_quantity_spec(quantity_lineplots)
+    spec_lineplots = get_quantity_spec(quantity_lineplots)
 
     # ----------------------------------------------------------------------------
     # Load data
     # ----------------------------------------------------------------------------
     contours_phases, df = load_filtered_phase_tracks(
-        nosuffix_filename=path.join(PATH_CONTOURS_PHASES, "all_sunspots_phases"),
-        mode=MODE,
+        nosuffix_filename=tracks_filename,
+        mode=mode,
         drop_unknown=True,
+        use_cache=True,  # shared between the snapshot/animation scripts
     )
 
-    observation_id = np.unique(df["observation_id"])[obs_index]
-    df_obs = df[
-        (df["observation_id"] == observation_id)
-        & (df["sunspot_id"] == sunspot_id)
-    ]
+    # Keep only the columns used below
+    df = df[[
+        "observation_id", "sunspot_id", "frame", "phase", "image_path",
+        spec_lineplots.mean_col, spec_lineplots.std_col,
+    ]]
+
+    # Hash-based unique + sort of the (few) distinct ids, not of every row
+    observation_id = np.sort(pd.unique(df["observation_id"].to_numpy()))[obs_index]
+    df_obs = (
+        df
+        .groupby(["observation_id", "sunspot_id"], sort=False, observed=True)
+        .get_group((observation_id, sunspot_id))
+    )
     del df
 
     # Add time axis relative to first detection
     df_obs = add_relative_time(df_obs)
+    if not df_obs["frame"].is_monotonic_increasing:
+        df_obs = df_obs.sort_values("frame", kind="stable")
 
-    # Select representative frames in phases
+    # Select representative frames in phases (sorted lookup of the few frames)
     frame_indices = select_representative_frames(df_obs)
-    df_sel = (
-        df_obs[df_obs["frame"].isin(frame_indices)]
-        .sort_values("frame")  # ensures frame order
-        .reset_index(drop=True)
-    )
+    positions = np.searchsorted(df_obs["frame"].to_numpy(), np.sort(frame_indices))
+    df_sel = df_obs.iloc[positions].reset_index(drop=True)
 
     # Restrict contour tracks to the selected frames only
     contour_source = apply_standard_sunspots_phases_filter(
@@ -90,24 +101,18 @@ def main() -> None:
     # ------------------------------------------------------------------
     # Prepare FrameData objects (pure data, no plotting)
     # ------------------------------------------------------------------
-    frames: list[FrameData] = []
-
     # Determine a common crop size across all selected frames
     target_shape = common_crop_shape_from_tracks(sunspot_phases, key_region=key_region, margin=crop_margin)
 
-    for _, row in df_sel.iterrows():
-        # Load the image
-        image = load_image(row["image_path"], quantity=QUANTITY_SNAPSHOTS)
-
+    def build_frame(row: tuple) -> FrameData:
         # Contours for this frame
-        contours = sunspot_phases[row["phase"]][key_region][row["frame"]]
+        contours = sunspot_phases[row.phase][key_region][row.frame]
 
-        # Crop the image using the fixed window
-        image, (y_offset, x_offset) = crop_centered_fixed(
-            image,
-            contours,
-            target_shape=target_shape,
-        )
+        # Read only the fixed crop window of the image
+        window = centered_crop_window(contours, target_shape=target_shape)
+        y_offset, x_offset = window[0], window[2]
+
+        image = load_image(row.image_path, quantity=quantity_snapshots, window=window)
 
         # Shift contours into the cropped image coordinate system
         contours = shift_contours(
@@ -120,7 +125,7 @@ def main() -> None:
             ContourGroup(
                 contours=contours,
                 style={
-                    "color": PHASE_COLORS[row["phase"]],
+                    "color": PHASE_COLORS[row.phase],
                     "linewidth": 1.5,
                     "linestyle": "-",
                 },
@@ -128,18 +133,74 @@ def main() -> None:
             ),
         ]
 
-        frames.append(
-            FrameData(
-                image=image,
-                contour_groups=contour_groups,
-            )
+        return FrameData(
+            image=image,
+            contour_groups=contour_groups,
         )
 
+    # Frames are independent (FITS read and crop) and the heavy parts
+    # release the GIL, so build them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(df_sel)))) as executor:
+        frames: list[FrameData] = list(executor.map(build_frame, df_sel.itertuples(index=False)))
+
     # ------------------------------------------------------------------
     # Global color scaling
     # ------------------------------------------------------------------
-    vmin = np.nanmin([np.nanmin(frame.image) for frame in frames])
-    vmax = np.nanmax([np.nanmax(frame.image) for frame in frames])
+    vmin, vmax = nan_minmax(frame.image for frame in frames)
+
+    # FITS files read above; a cached result is stale once any of them changes
+    fits_signature = files_signature(df_sel["image_path"].unique())
+
+    return frames, vmin, vmax, df_sel, df_obs, fits_signature
+
+
+def main() -> None:
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    QUANTITY_SNAPSHOTS: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] = "Ic"
+    QUANTITY_LINEPLOTS: Literal["Ic", "B", "Bp", "Bt", "Br", "Bver", "Bhor"] = "B"
+
+    MODE: Literal["pores", "sunspots"] = "sunspots"
+
+    obs_index = 45  # 45, 90, 136
+    sunspot_id = 0  # 0, 0, 1
+
+    crop_margin = 20
+    key_region = "outer"
+
+    FORCE_REBUILD = False  # ignore cached frames
+
+    tracks_filename = path.join(PATH_CONTOURS_PHASES, "all_sunspots_phases")
+
+    spec_lineplots = get_quantity_spec(QUANTITY_LINEPLOTS)
+
+    figure_outdir = path.join(PATH_FIGURES, "paper_plots")
+    check_dir(figure_outdir)
+
+    # ------------------------------------------------------------------
+    # Load or rebuild the plotting data
+    # ------------------------------------------------------------------
+    # The plotting data depend only on the configuration and the input files, so reruns
+    # that only change styling reuse the cached frames. The key includes the phase-track
+    # files (path and modification time); the FITS files read are checked on load.
+    config = dict(
+        mode=MODE, quantity_snapshots=QUANTITY_SNAPSHOTS, quantity_lineplots=QUANTITY_LINEPLOTS,
+        obs_index=obs_index, sunspot_id=sunspot_id, crop_margin=crop_margin, key_region=key_region,
+    )
+    cache_key = repr((
+        "phase_snapshots_and_timeseries",
+        files_signature([f"{tracks_filename}.npz", f"{tracks_filename}.parquet"]),
+        sorted(config.items()),
+    ))
+    cache_file = path.join(PATH_CACHE, f"{hashlib.sha1(cache_key.encode()).hexdigest()}.pkl")
+
+    frames, vmin, vmax, df_sel, df_obs, _ = load_or_build_pickle(
+        cache_file,
+        lambda: prepare_data(tracks_filename, **config),
+        force_rebuild=FORCE_REBUILD,
+        is_valid=lambda data: files_unchanged(data[-1]),
+    )
 
     # Pixel scale (arcsec per pixel, for aspect ratio only)
     dx, dy = 0.29714842896202537, 0.31997767629244117
@@ -195,6 +256,9 @@ def main() -> None:
         # ---------------------------------------------------------------------
         # Bottom row: time series (mean + std on twin axis)
         # ---------------------------------------------------------------------
+        # Mean and std share the phase labels, so colour the segments once
+        phase_seg_colors = segment_colors(df_obs["phase"], PHASE_COLORS)
+
         for ax_ts in line_axes:
             add_colored_timeseries(
                 ax_ts,
@@ -202,6 +266,7 @@ def main() -> None:
                 y=df_obs[spec_lineplots.mean_col],
                 phases=df_obs["phase"],
                 phase_colors=PHASE_COLORS,
+                seg_colors=phase_seg_colors,
                 linestyle="-",
                 linewidth=2.0,
             )
@@ -235,6 +300,7 @@ def main() -> None:
                 y=df_obs[spec_lineplots.std_col],
                 phases=df_obs["phase"],
                 phase_colors=PHASE_COLORS,
+                seg_colors=phase_seg_colors,
                 linestyle=":",
                 linewidth=2.0,
             )
@@ -1,7 +1,8 @@
 import matplotlib
 matplotlib.use("Agg")
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
 from os import path
 from typing import Literal
@@ -14,7 +15,7 @@ from scr.config.figures import FIG_FORMAT, SAVEFIG_KWARGS, CBAR_KWARGS
 from scr.utils.filesystem import check_dir
 from scr.geometry.solar.units import pixelarea_to_Mm2
 from scr.io.parquet import load_parquet
-from scr.stats.dataframe.filtering import filter_combined_df
+from scr.stats.dataframe.filtering import filter_combined_df, filtering_columns
 
 from scr.plotting.generic.hist import plot_hist2d
 from scr.plotting.style.latex import latex_style
@@ -41,10 +42,21 @@ def main():
     # ------------------------------------------------------------------
     # Load and filter combined phase data
     # ------------------------------------------------------------------
+    filtering_kwargs = gimme_filtering_kwargs(MODE)
+
+    # Read only the columns needed for filtering and plotting. The dispersion
+    # cut below is not pushed into the reader: group-wise filters must see
+    # all frames of a sunspot.
     df = load_parquet(
-        path.join(PATH_CONTOURS_PHASES, f"all_{MODE}_phases_merged.parquet")
+        path.join(PATH_CONTOURS_PHASES, f"all_{MODE}_phases_merged.parquet"),
+        columns=list(dict.fromkeys([
+            *filtering_columns(filtering_kwargs),
+            "overall_corrected_total_area",
+            spec.mean_col,
+            spec.std_col,
+        ])),
     )
-    df = filter_combined_df(df, gimme_filtering_kwargs(MODE))
+    df = filter_combined_df(df, filtering_kwargs)
 
     # ------------------------------------------------------------------
     # Prepare quantities for plotting
@@ -65,7 +77,10 @@ def main():
     # Plot
     # ------------------------------------------------------------------
     with latex_style(fontsize=20):
-        fig, ax = plt.subplots(figsize=(10, 10))
+        # Agg figure without the pyplot state machine
+        fig = Figure(figsize=(10, 10))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
 
         im = plot_hist2d(
             ax,
@@ -87,8 +102,6 @@ def main():
             fr"{'Sunspot' if MODE == 'sunspots' else 'Pore'} area (Mm$^2$)"
         )
 
-        plt.tight_layout()
-
         fig.savefig(
             path.join(
                 figure_outdir,
@@ -97,7 +110,6 @@ def main():
             format=FIG_FORMAT,
             **SAVEFIG_KWARGS,
         )
-        plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 import matplotlib
 matplotlib.use("Agg")
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from os import path
 from typing import Literal
 
@@ -12,7 +13,7 @@ from scr.config.figures import FIG_FORMAT, SAVEFIG_KWARGS
 
 from scr.utils.filesystem import check_dir
 from scr.io.parquet import load_parquet
-from scr.stats.dataframe.filtering import filter_combined_df
+from scr.stats.dataframe.filtering import filter_combined_df, filtering_columns
 
 from scr.plotting.generic.hist import plot_pdfs, overlay_gaussian_fit
 from scr.plotting.style.latex import latex_style
@@ -38,34 +39,30 @@ def main():
     # ------------------------------------------------------------------
     # Load and filter combined phase data
     # ------------------------------------------------------------------
+    filtering_kwargs = gimme_filtering_kwargs(MODE)
+
+    # Read only the columns needed for filtering and plotting
     df = load_parquet(
-        path.join(PATH_CONTOURS_PHASES, f"all_{MODE}_phases_merged.parquet")
+        path.join(PATH_CONTOURS_PHASES, f"all_{MODE}_phases_merged.parquet"),
+        columns=list(dict.fromkeys([
+            *filtering_columns(filtering_kwargs),
+            "phase",
+            spec.mean_col,
+            spec.std_col,
+        ])),
     )
-    df = filter_combined_df(df, gimme_filtering_kwargs(MODE))
+    df = filter_combined_df(df, filtering_kwargs)
 
     # ------------------------------------------------------------------
     # Extract phase-wise distributions
     # ------------------------------------------------------------------
-    forming = filter_combined_df(
-        df,
-        filtering_kwargs={
-            "phase": {"exact_value": "forming", "mode": "frame-wise"}
-        },
-    )[spec.mean_col].to_numpy()
-
-    stable_df = filter_combined_df(
-        df,
-        filtering_kwargs={
-            "phase": {"exact_value": "stable", "mode": "frame-wise"}
-        },
-    )[[spec.mean_col, spec.std_col]]  # keep both mean & dispersion
-
-    decaying = filter_combined_df(
-        df,
-        filtering_kwargs={
-            "phase": {"exact_value": "decaying", "mode": "frame-wise"}
-        },
-    )[spec.mean_col].to_numpy()
+    # Narrow to the plotted columns before the per-phase row selections
+    df = df[["phase", spec.mean_col, spec.std_col]]
+    phase = df["phase"]
+
+    forming = df.loc[phase == "forming", spec.mean_col].to_numpy()
+    stable_df = df.loc[phase == "stable", [spec.mean_col, spec.std_col]]  # keep both mean & dispersion
+    decaying = df.loc[phase == "decaying", spec.mean_col].to_numpy()
 
     del df  # free memory early
 
@@ -82,7 +79,10 @@ def main():
     # Plot
     # ------------------------------------------------------------------
     with latex_style(fontsize=20):
-        fig, ax = plt.subplots(figsize=(10, 10))
+        # Agg figure without the pyplot state machine
+        fig = Figure(figsize=(10, 10))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
 
         handles = plot_pdfs(
             ax,
@@ -115,8 +115,6 @@ def main():
         ax.set_ylabel(r"PDF (\%)")
 
         ax.set_xlim((400, 1200))
-        plt.tight_layout()
-
         fig.savefig(
             path.join(
                 figure_outdir,
@@ -125,7 +123,6 @@ def main():
             format=FIG_FORMAT,
             **SAVEFIG_KWARGS,
         )
-        plt.close(fig)
 
 
 if __name__ == "__main__":
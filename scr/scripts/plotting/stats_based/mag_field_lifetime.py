@@ -1,7 +1,8 @@
 import matplotlib
 matplotlib.use("Agg")
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from os import path
 from typing import Literal
 
@@ -35,7 +36,8 @@ def main():
     # Load data and compute aggregations
     # ------------------------------------------------------------------
     df = load_parquet(
-        path.join(PATH_CONTOURS_PHASES, "all_sunspots_phases.parquet")
+        path.join(PATH_CONTOURS_PHASES, "all_sunspots_phases.parquet"),
+        columns=["observation_id", "sunspot_id", spec.mean_col],
     )
 
     # Lifetime (hours) and corresponding mean value per object
@@ -50,7 +52,10 @@ def main():
     # Plot
     # ------------------------------------------------------------------
     with latex_style(fontsize=20):
-        fig, ax = plt.subplots(figsize=(8, 6))
+        # Agg figure without the pyplot state machine
+        fig = Figure(figsize=(8, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
 
         plot_scatter(
             ax,
@@ -61,14 +66,11 @@ def main():
         ax.set_xlabel("Lifetime (h)")
         ax.set_ylabel(spec.ylabel_mean)
 
-        plt.tight_layout()
-
         fig.savefig(
             path.join(figure_outdir, f"lifetime_{QUANTITY}_{where}.{FIG_FORMAT}"),
             format=FIG_FORMAT,
             **SAVEFIG_KWARGS,
         )
-        plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 import matplotlib
 matplotlib.use("Agg")
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from os import path
 from typing import Literal
 
@@ -12,7 +13,7 @@ from scr.config.figures import FIG_FORMAT, SAVEFIG_KWARGS
 
 from scr.utils.filesystem import check_dir
 from scr.io.parquet import load_parquet
-from scr.stats.dataframe.filtering import filter_combined_df
+from scr.stats.dataframe.filtering import filter_combined_df, filtering_columns
 from scr.stats.segments.phase import extract_phase_segments, median_curve
 
 from scr.plotting.generic.lines import plot_line
@@ -42,10 +43,20 @@ def main():
     # ------------------------------------------------------------------
     # Load and filter data
     # ------------------------------------------------------------------
+    filtering_kwargs = gimme_filtering_kwargs(MODE)
+
+    # Read only the columns needed for filtering and segment extraction
     df = load_parquet(
-        path.join(PATH_CONTOURS_PHASES, f"all_{MODE}_phases_merged.parquet")
+        path.join(PATH_CONTOURS_PHASES, f"all_{MODE}_phases_merged.parquet"),
+        columns=list(dict.fromkeys([
+            *filtering_columns(filtering_kwargs),
+            "spot_global_index",
+            "frame",
+            "phase",
+            spec.mean_col,
+        ])),
     )
-    df = filter_combined_df(df, gimme_filtering_kwargs(MODE))
+    df = filter_combined_df(df, filtering_kwargs)
 
     # Extract time-normalised segments for each phase
     segments = {
@@ -59,7 +70,10 @@ def main():
     # Plot
     # ------------------------------------------------------------------
     with latex_style(fontsize=20):
-        fig, ax = plt.subplots(figsize=(10, 10))
+        # Agg figure without the pyplot state machine
+        fig = Figure(figsize=(10, 10))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
 
         for i, phase in enumerate(phases):
             # Individual phase segments
@@ -80,14 +94,11 @@ def main():
 
         ax.set_ylabel(spec.ylabel_mean)
 
-        plt.tight_layout()
-
         fig.savefig(
             path.join(figure_outdir, f"phase_evolution_{QUANTITY}_{MODE}_{where}.{FIG_FORMAT}"),
             format=FIG_FORMAT,
             **SAVEFIG_KWARGS,
         )
-        plt.close(fig)
 
 
 if __name__ == "__main__":
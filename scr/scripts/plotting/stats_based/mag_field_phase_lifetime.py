@@ -1,7 +1,8 @@
 import matplotlib
 matplotlib.use("Agg")
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 from os import path
 from typing import Literal
@@ -39,14 +40,13 @@ def main():
     # ------------------------------------------------------------------
     # Load and filter data
     # ------------------------------------------------------------------
+    # Quality and phase selection are row-wise, so let the reader apply them
     df = load_parquet(
-        path.join(PATH_CONTOURS_PHASES, "all_sunspots_phases.parquet")
+        path.join(PATH_CONTOURS_PHASES, "all_sunspots_phases.parquet"),
+        columns=["observation_id", "sunspot_id", "phase_duration", spec.mean_col],
+        filters=[("phase", "==", PHASE), (spec.std_col, "<", 500.)],
     )
 
-    # Quality and phase selection
-    df = df[df[spec.std_col] < 500]
-    df = df[df["phase"] == PHASE]
-
     # Aggregate statistics as a function of phase duration
     stats = phase_duration_statistics(
         df,
@@ -80,7 +80,10 @@ def main():
     # Plot
     # ------------------------------------------------------------------
     with latex_style(fontsize=20):
-        fig, ax = plt.subplots(figsize=(8, 6))
+        # Agg figure without the pyplot state machine
+        fig = Figure(figsize=(8, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
 
         plot_line(
             ax, x, y_max,
@@ -103,14 +106,11 @@ def main():
         ax.set_ylabel(spec.ylabel_mean)
         ax.legend()
 
-        plt.tight_layout()
-
         fig.savefig(
             path.join(figure_outdir, f"lifetime_{PHASE}_{QUANTITY}_{where}.{FIG_FORMAT}"),
             format=FIG_FORMAT,
             **SAVEFIG_KWARGS,
         )
-        plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -5,7 +5,8 @@ from typing import Literal
 from scr.config.paths import PATH_CONTOURS
 
 from scr.io.tracks import load_tracks_and_stats, save_tracks_and_stats
-from scr.io.fits.read import load_fits_headers, load_image
+from scr.io.fits.read import load_fits_headers
+from scr.io.fits.stack import LazyFitsStack
 
 from scr.stats.computation.evolution import compute_sunspot_statistics_evolution
 from scr.stats.postprocessing.propagation import propagate_stat_parameter
@@ -21,7 +22,8 @@ def main() -> None:
         tracks, stats, metadata = load_tracks_and_stats(contour_file)
 
         headers = load_fits_headers(metadata["filename_list"], header_index=0)
-        images = [load_image(filename, quantity=QUANTITIY) for filename in metadata["filename_list"]]
+        # Frames are visited in order, so only the current one needs to be in memory
+        images = LazyFitsStack(metadata["filename_list"], quantity=QUANTITIY)
 
         for mode in ["sunspots", "pores"]:
             quantity_stats = compute_sunspot_statistics_evolution(
@@ -13,35 +13,73 @@ def phase_duration_statistics(
     """
     Aggregate per (observation, sunspot, phase segment).
     """
-    groups = df.groupby(
-        ["observation_id", "sunspot_id", duration_col],
-        observed=True,
-    )
-
-    duration = []
-    max_val = []
-    perc_vals = {p: [] for p in percentiles}
-
-    for _, g in groups:
-        duration.append(np.nanmax(g[duration_col]))
-        vals = np.abs(g[value_col])
+    keys = ["observation_id", "sunspot_id", duration_col]
+    vals = df[value_col].abs()
 
-        max_val.append(np.nanmax(vals))
-        for p in percentiles:
-            perc_vals[p].append(
-                np.nanpercentile(vals, p, method="median_unbiased")
-            )
+    groups = vals.groupby([df[key] for key in keys], observed=True, sort=False)
+    max_val = groups.max()
 
     out = {
-        "duration": np.asarray(duration),
-        "max": np.asarray(max_val),
+        "duration": max_val.index.get_level_values(duration_col).to_numpy(),
+        "max": max_val.to_numpy(),
     }
-    for p in percentiles:
-        out[f"p{p}"] = np.asarray(perc_vals[p])
+
+    # Rows with a missing key belong to no group (ngroup gives NaN for them)
+    codes = groups.ngroup().fillna(-1).to_numpy(dtype=int)
+    picks = _grouped_nanpercentile_median_unbiased(
+        codes,
+        vals.to_numpy(dtype=float),
+        n_groups=len(max_val),
+        q=np.asarray(percentiles, dtype=float) / 100.,
+    )
+    for p, pick in zip(percentiles, picks):
+        out[f"p{p}"] = pick
 
     return out
 
 
+def _grouped_nanpercentile_median_unbiased(
+        codes: np.ndarray,
+        values: np.ndarray,
+        n_groups: int,
+        q: np.ndarray,
+) -> np.ndarray:
+    """
+    Per-group `np.nanpercentile(..., method="median_unbiased")` in one pass.
+
+    `codes` assigns each value to a group in [0, n_groups) (negative = no group).
+    All quantiles in `q` share a single sort; the result has shape (len(q), n_groups).
+    """
+    valid = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+
+    # Sort by group, then by value; each group becomes a contiguous sorted run
+    order = np.lexsort((values, codes))
+    values = values[order]
+
+    counts = np.bincount(codes, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+
+    # Virtual index of the median-unbiased estimator (alpha = beta = 1/3)
+    q = np.atleast_1d(q)[:, None]
+    virtual = counts * q + (1. / 3. + q / 3.) - 1.
+    previous = np.floor(virtual)
+    gamma = virtual - previous
+
+    last = np.maximum(counts - 1, 0)
+    previous = np.clip(previous, 0, last).astype(int)
+    following = np.minimum(previous + 1, last)
+    gamma = np.where((virtual < 0) | (virtual >= counts - 1), 0., gamma)
+
+    result = np.full(virtual.shape, np.nan)
+    has_values = counts > 0
+    lower = values[(starts + previous)[:, has_values]]
+    upper = values[(starts + following)[:, has_values]]
+    result[:, has_values] = lower + gamma[:, has_values] * (upper - lower)
+
+    return result
+
+
 def lifetime_and_mean(
         df: pd.DataFrame,
         value_col: str,
@@ -49,14 +87,8 @@ def lifetime_and_mean(
     """
     Lifetime = number of valid frames.
     """
-    groups = df.groupby(["observation_id", "sunspot_id"], observed=True)
-
-    lifetime = []
-    mean_val = []
-
-    for _, g in groups:
-        mask = np.isfinite(g[value_col])
-        lifetime.append(mask.sum())
-        mean_val.append(np.nanmean(g.loc[mask, value_col]))
+    # Only finite values are valid frames; mask inf like NaN
+    vals = df[value_col].where(np.isfinite(df[value_col]))
+    groups = vals.groupby([df["observation_id"], df["sunspot_id"]], observed=True, sort=False)
 
-    return np.asarray(lifetime), np.asarray(mean_val)
+    return groups.count().to_numpy(), groups.mean().to_numpy()
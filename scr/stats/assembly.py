@@ -11,7 +11,7 @@ from scr.io.discovery.stats import discover_stat_files
 def _load_reference_schema(
         reference_file: str
 ) -> tuple[dict, dict]:
-    tracks, _, metadata = load_tracks_and_stats(reference_file)
+    tracks, _, metadata = load_tracks_and_stats(reference_file, keys=("tracks", "metadata"))
     return tracks, metadata
 
 
@@ -30,7 +30,8 @@ def _assemble_stats(
                 print(f"Missing file:\n\t{fname}")
                 continue
 
-            _, stat, _ = load_tracks_and_stats(fname)
+            # Only the statistics are needed; skip decoding the tracks and metadata
+            _, stat, _ = load_tracks_and_stats(fname, keys=("stats",))
             stats[stype][quantity] = stat[stype][quantity]
 
     return stats
@@ -1,11 +1,14 @@
 import numpy as np
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from tqdm import tqdm
 from typing import Sequence
 
 from scr.utils.types_alias import Sunspots, Stats, Headers
 from scr.utils.filesystem import is_empty
 
-from scr.geometry.contours.sampling import sample_map_at_contour
+from scr.geometry.contours.sampling import sample_map_at_contour, prepare_contours
 from scr.geometry.contours.utils import contour_to_shape
 from scr.geometry.solar.mu import compute_mu
 from scr.geometry.solar.projection import pixel_to_lonlat
@@ -13,10 +16,9 @@ from scr.geometry.solar.projection import pixel_to_lonlat
 from scr.morphology.masks import compute_masks
 
 from scr.stats.computation.geometry import compute_geometry_stats, compute_corrected_total_area
-from scr.stats.computation.masks import overall_mask, corr_mask
+from scr.stats.computation.masks import overall_mask
 from scr.stats.computation.flux import compute_flux_area_stats, compute_flux_length_stats
 from scr.stats.computation.ratio import compute_ratio_stats
-from scr.stats.computation.mu import compute_mu_stats
 from scr.stats.computation.utils import nanaverage, safe_call
 
 
@@ -25,7 +27,8 @@ def compute_sunspot_statistics_evolution(
         images: Sequence[np.ndarray],
         headers: Headers,
         min_step: float = 0.5,
-        take_abs: bool = False
+        take_abs: bool = False,
+        max_workers: int | None = None
 ) -> Stats:
     """
     Compute geometric and intensity-based statistics for umbra and penumbra
@@ -39,164 +42,243 @@ def compute_sunspot_statistics_evolution(
 
     Parameters:
         sunspots: Dictionary of contours: {sid: {"outer": {t: [...]}, "inner": {t: [...]}}}
-        images: 3D array of (T, H, W), time series of intensity/field maps.
+        images: 3D array of (T, H, W), time series of intensity/field maps (or any sequence indexed
+            by frame, e.g. a LazyFitsStack; frames are accessed in increasing order).
         headers: List of FITS headers, one per frame, used to compute mu map.
         min_step: Maximum distance between contour points.
         take_abs: Whether to take absolute value of the field before flux integration.
+        max_workers: Number of worker processes, each computing whole frames (None = executor default).
 
     Returns:
         Nested dictionary: {sid: {"penumbra": {t: {...}}, "umbra": {...}, "ratio": {...}, "overall": {...}}}
     """
 
     stats: Stats = {}
+    lifetimes: dict = {}
+    sids_by_frame: dict[int, list] = {}
 
-    for sid, group in tqdm(sunspots.items()):
+    for sid, group in sunspots.items():
         stats[sid] = {"penumbra": {}, "umbra": {}, "ratio": {}, "overall": {}}
 
+        # Precompute lifetime (frames count) for fields; shared by all frames of the sunspot
+        lifetimes[sid] = {
+            "umbra_lifetime": len(group.get("inner", {})),
+            "penumbra_lifetime": len(group.get("outer", {})),
+        }
+
         # frames where either inner or outer exists
-        frames = sorted(set(group.get("outer", {}).keys()) | set(group.get("inner", {}).keys()))
+        for t in group.get("outer", {}).keys() | group.get("inner", {}).keys():
+            sids_by_frame.setdefault(t, []).append(sid)
 
-        # Precompute lifetime (frames count) for fields
-        penumbra_lifetime = len(set(group.get("outer", {}).keys()))
-        umbra_lifetime = len(set(group.get("inner", {}).keys()))
+    # Frames are independent; each worker gets the frame's image, header and contours
+    # and computes the header-derived maps itself. Only a few frames are in flight at
+    # a time, so lazily loaded stacks are still read frame by frame and in order.
+    n_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
 
-        lifetime_stats = {
-                "umbra_lifetime": umbra_lifetime,
-                "penumbra_lifetime": penumbra_lifetime,
-            }
+        def collect() -> None:
+            t_done, future = pending.popleft()
+            for sid, sid_stats in future.result().items():
+                for key, value in sid_stats.items():
+                    stats[sid][key][t_done] = value
 
-        for t in frames:
-            image, header = images[t], headers[t]
-            shape = image.shape
-
-            outer_contours = group.get("outer", {}).get(t, []) or []
-            inner_contours = group.get("inner", {}).get(t, []) or []
-
-            mu2D = compute_mu(header)
-            lon2D, lat2D = pixel_to_lonlat(header)
-            rsun = header["RSUN_OBS"] / header["CDELT1"]
-
-            # --- Masks ---
-            umbra_masks, umbra_masks_border = compute_masks(
-                contours=inner_contours,
-                shape=shape,
-                mask_holes=None,
-                dtype=np.float32
-            )
-
-            penumbra_masks, penumbra_masks_border = compute_masks(
-                contours=outer_contours,
-                shape=shape,
-                mask_holes=overall_mask(umbra_masks, shape=shape, dtype=np.float32),
-                dtype=np.float32
-            )
-
-            spot_mask = overall_mask(umbra_masks + penumbra_masks, shape=shape)
-
-            # --- Geometric stats ---
-            umbra_stats = compute_geometry_stats(
-                contours=inner_contours,
-                masks=umbra_masks,
-                masks_border=umbra_masks_border,
-                shape=shape,
-                mu2d=mu2D,
-                lon2d=lon2D,
-                lat2d=lat2D,
-                rsun=rsun
-            )
-
-            penumbra_stats = compute_geometry_stats(
-                contours=outer_contours,
-                masks=penumbra_masks,
-                masks_border=penumbra_masks_border,
-                shape=shape,
-                mu2d=mu2D,
-                lon2d=lon2D,
-                lat2d=lat2D,
-                rsun=rsun
-            )
-
-            # --- Flux stats ---
-            umbra_stats.update(compute_flux_area_stats(
-                image=image,
-                masks=umbra_masks,
-                shape=shape,
-                mu2d=mu2D,
-                take_abs=take_abs)
-            )
-            umbra_stats.update(compute_flux_length_stats(
-                image=image,
-                contours=inner_contours,
-                lon2d=lon2D,
-                lat2d=lat2D,
-                rsun=rsun,
-                mu2d=mu2D,
-                min_step=min_step,
-                take_abs=take_abs)
-            )
-
-            penumbra_stats.update(compute_flux_area_stats(
-                image=image,
-                masks=penumbra_masks,
-                shape=shape,
-                mu2d=mu2D,
-                take_abs=take_abs)
-            )
-            penumbra_stats.update(compute_flux_length_stats(
-                image=image,
-                contours=outer_contours,
-                lon2d=lon2D,
-                lat2d=lat2D,
-                rsun=rsun,
-                mu2d=mu2D,
-                min_step=min_step,
-                take_abs=take_abs)
-            )
-
-            stats[sid]["penumbra"][t] = penumbra_stats
-            stats[sid]["umbra"][t] = umbra_stats
-            stats[sid]["ratio"][t] = compute_ratio_stats(
-                umbra_stats=umbra_stats,
-                penumbra_stats=penumbra_stats
-            )
-            stats[sid]["overall"][t] = (
-                    compute_mu_stats(
-                        mask=spot_mask,
-                        mu2d=mu2D,
-                        contour=outer_contours[0] if not is_empty(outer_contours) else None
-                    )
-                    | lifetime_stats
-                    | compute_corrected_total_area(spot_mask=spot_mask, mu2d=mu2D)
-            )
-
-            # --- µ statistics ---
-            spots_mask = overall_mask(umbra_masks, shape=shape) + overall_mask(penumbra_masks, shape=shape)
-            spots_mask_bin = spots_mask > 0.5
-            empty_entry = not spots_mask.any()
-
-            # centroid µ
-            if not is_empty(outer_contours):
-                centroid_coords = np.array(contour_to_shape(outer_contours[0]).centroid.coords[0]).reshape(-1, 2)
-                mu_centroid = float(sample_map_at_contour(centroid_coords, mu2D, interp=True)[0])
-            else:
-                mu_centroid = np.nan
-
-            mu_mean = safe_call(nanaverage, empty_entry, mu2D, weights=spots_mask)
-
-            if spots_mask_bin.any():
-                mu_min = float(np.nanmin(mu2D[spots_mask_bin]))
-                mu_max = float(np.nanmax(mu2D[spots_mask_bin]))
-            else:
-                mu_min = mu_max = np.nan
-
-            stats[sid]["overall"][t] = {
-                "umbra_lifetime": umbra_lifetime,
-                "penumbra_lifetime": penumbra_lifetime,
-                "corrected_total_area": safe_call(np.nansum, empty_entry, corr_mask(spots_mask, mu2d=mu2D)),
-                "mu_centroid": mu_centroid,
-                "mu_min": mu_min,
-                "mu_max": mu_max,
-                "mu_mean": mu_mean,
+        for t in tqdm(sorted(sids_by_frame)):
+            frame_contours = {
+                sid: (sunspots[sid].get("outer", {}).get(t, []) or [],
+                      sunspots[sid].get("inner", {}).get(t, []) or [])
+                for sid in sids_by_frame[t]
             }
+            pending.append((t, executor.submit(
+                _frame_stats,
+                frame_contours,
+                {sid: lifetimes[sid] for sid in frame_contours},
+                images[t],
+                headers[t],
+                min_step,
+                take_abs
+            )))
+            if len(pending) >= 2 * n_workers:
+                collect()
+
+        while pending:
+            collect()
 
     return stats
+
+
+def _frame_stats(
+        frame_contours: dict,
+        lifetimes: dict,
+        image: np.ndarray,
+        header,
+        min_step: float,
+        take_abs: bool
+) -> dict:
+    """
+    Statistics of the sunspots present in one frame: {sid: {"penumbra": ..., "umbra": ..., ...}}.
+    `frame_contours` maps sid to its (outer, inner) contours in the frame. Runs in a worker process.
+    """
+    # mu and lon/lat maps depend only on the frame header, so they are computed
+    # once per frame rather than once per sunspot
+    mu2D = compute_mu(header)
+    lon2D, lat2D = pixel_to_lonlat(header)
+    rsun = header["RSUN_OBS"] / header["CDELT1"]
+
+    return {
+        sid: _sunspot_frame_stats(
+            outer_contours=outer_contours,
+            inner_contours=inner_contours,
+            lifetime_stats=lifetimes[sid],
+            image=image,
+            mu2D=mu2D,
+            lon2D=lon2D,
+            lat2D=lat2D,
+            rsun=rsun,
+            min_step=min_step,
+            take_abs=take_abs
+        )
+        for sid, (outer_contours, inner_contours) in frame_contours.items()
+    }
+
+
+def _sunspot_frame_stats(
+        outer_contours: list,
+        inner_contours: list,
+        lifetime_stats: dict,
+        image: np.ndarray,
+        mu2D: np.ndarray,
+        lon2D: np.ndarray,
+        lat2D: np.ndarray,
+        rsun: float,
+        min_step: float,
+        take_abs: bool
+) -> dict:
+    """Statistics of one sunspot in one frame."""
+    shape = image.shape
+
+    # --- Masks ---
+    umbra_masks, umbra_masks_border = compute_masks(
+        contours=inner_contours,
+        shape=shape,
+        mask_holes=None,
+        dtype=np.float32
+    )
+
+    penumbra_masks, penumbra_masks_border = compute_masks(
+        contours=outer_contours,
+        shape=shape,
+        mask_holes=overall_mask(umbra_masks, shape=shape, dtype=np.float32),
+        dtype=np.float32
+    )
+
+    spot_mask = overall_mask(umbra_masks + penumbra_masks, shape=shape)
+
+    # Densified contours and their lon / lat, shared by geometry and flux stats
+    umbra_prepared = prepare_contours(inner_contours, lon2d=lon2D, lat2d=lat2D, rsun=rsun,
+                                      min_step=min_step)
+    penumbra_prepared = prepare_contours(outer_contours, lon2d=lon2D, lat2d=lat2D, rsun=rsun,
+                                         min_step=min_step)
+
+    # --- Geometric stats ---
+    umbra_stats = compute_geometry_stats(
+        contours=inner_contours,
+        masks=umbra_masks,
+        masks_border=umbra_masks_border,
+        shape=shape,
+        mu2d=mu2D,
+        lon2d=lon2D,
+        lat2d=lat2D,
+        rsun=rsun,
+        prepared=umbra_prepared
+    )
+
+    penumbra_stats = compute_geometry_stats(
+        contours=outer_contours,
+        masks=penumbra_masks,
+        masks_border=penumbra_masks_border,
+        shape=shape,
+        mu2d=mu2D,
+        lon2d=lon2D,
+        lat2d=lat2D,
+        rsun=rsun,
+        prepared=penumbra_prepared
+    )
+
+    # --- Flux stats ---
+    umbra_stats.update(compute_flux_area_stats(
+        image=image,
+        masks=umbra_masks,
+        shape=shape,
+        mu2d=mu2D,
+        take_abs=take_abs)
+    )
+    umbra_stats.update(compute_flux_length_stats(
+        image=image,
+        contours=inner_contours,
+        lon2d=lon2D,
+        lat2d=lat2D,
+        rsun=rsun,
+        mu2d=mu2D,
+        min_step=min_step,
+        take_abs=take_abs,
+        prepared=umbra_prepared)
+    )
+
+    penumbra_stats.update(compute_flux_area_stats(
+        image=image,
+        masks=penumbra_masks,
+        shape=shape,
+        mu2d=mu2D,
+        take_abs=take_abs)
+    )
+    penumbra_stats.update(compute_flux_length_stats(
+        image=image,
+        contours=outer_contours,
+        lon2d=lon2D,
+        lat2d=lat2D,
+        rsun=rsun,
+        mu2d=mu2D,
+        min_step=min_step,
+        take_abs=take_abs,
+        prepared=penumbra_prepared)
+    )
+
+    ratio_stats = compute_ratio_stats(
+        umbra_stats=umbra_stats,
+        penumbra_stats=penumbra_stats
+    )
+
+    # --- µ statistics (on the combined umbra + penumbra mask) ---
+    # Only the (few) pixels with nonzero weight contribute; gather them once
+    spot_idx = np.flatnonzero(spot_mask)
+    spot_weights = spot_mask.ravel()[spot_idx]
+    spot_mu = mu2D.ravel()[spot_idx]
+    spot_mu_bin = spot_mu[spot_weights > 0.5]
+    empty_entry = spot_idx.size == 0
+
+    # centroid µ
+    if not is_empty(outer_contours):
+        centroid_coords = np.array(contour_to_shape(outer_contours[0]).centroid.coords[0]).reshape(-1, 2)
+        mu_centroid = float(sample_map_at_contour(centroid_coords, mu2D, interp=True)[0])
+    else:
+        mu_centroid = np.nan
+
+    mu_mean = safe_call(nanaverage, empty_entry, spot_mu, weights=spot_weights)
+
+    if spot_mu_bin.size:
+        mu_min = float(np.nanmin(spot_mu_bin))
+        mu_max = float(np.nanmax(spot_mu_bin))
+    else:
+        mu_min = mu_max = np.nan
+
+    overall_stats = {
+        **lifetime_stats,
+        **compute_corrected_total_area(spot_mask=spot_mask, mu2d=mu2D),
+        "mu_centroid": mu_centroid,
+        "mu_min": mu_min,
+        "mu_max": mu_max,
+        "mu_mean": mu_mean,
+    }
+
+    return {"penumbra": penumbra_stats, "umbra": umbra_stats, "ratio": ratio_stats, "overall": overall_stats}
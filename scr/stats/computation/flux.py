@@ -1,14 +1,12 @@
 import numpy as np
 
-from scr.utils.types_alias import Contour, Contours, Masks, Mask, Stat
+from scr.utils.types_alias import Contours, Masks, Stat
 from scr.utils.filesystem import is_empty
 
-from scr.geometry.contours.normalization import normalize_contour_input
-from scr.geometry.contours.sampling import sample_map_at_contour, calc_arc_lengths
-from scr.geometry.contours.densify import densify_contour
+from scr.geometry.contours.sampling import PreparedContours, prepare_contours, sample_map_at_contours
 
 from scr.stats.computation.masks import overall_mask, corr_mask
-from scr.stats.computation.utils import safe_call, nanaverage, weighted_std, safe_sum
+from scr.stats.computation.utils import safe_call, nanaverage_std, safe_sum
 
 
 def compute_flux_area_stats(
@@ -41,51 +39,118 @@ def compute_flux_area_stats(
         plus per-mask lists.
     """
 
-    def _process_mask(mask: Mask) -> tuple[float, float, float, float, float, float]:
-        empty_entry = not np.any(mask)
-
-        # uncorrected
-        total = safe_call(safe_sum, empty_entry, values * mask)
-        mean = safe_call(nanaverage, empty_entry, values, weights=mask)
-        std = safe_call(weighted_std, empty_entry, values, mean, weights=mask)
-
-        # corrected
-        if mu2d is None:
-            corr_total = corr_mean = corr_std = np.nan
+    def _weighted_stats(
+            weights: np.ndarray,
+            labels: np.ndarray | None = None,
+            n_rows: int = 0
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Row-wise safe_sum / nanaverage / weighted_std of `values` for (K, N) weights.
+        # Disjoint masks can instead be given as one (N,) weight vector with the row
+        # (mask) index of each pixel in `labels`: every row sum is then one bincount
+        if labels is None:
+            def row_sum(x):
+                return x.sum(axis=1)
+
+            def per_pixel(row_values):
+                return row_values[:, None]
         else:
-            corr_weights = corr_mask(mask, mu2d=mu2d)
-
-            corr_total = safe_call(safe_sum, empty_entry, values * corr_weights)
-            corr_mean = safe_call(nanaverage, empty_entry, values, weights=corr_weights)
-            corr_std = safe_call(weighted_std, empty_entry, values, corr_mean, weights=corr_weights)
-
-        return total, mean, std, corr_total, corr_mean, corr_std
-
-    values = np.abs(image) if take_abs else image
+            def row_sum(x):
+                return np.bincount(labels, weights=np.ravel(x), minlength=n_rows)
+
+            def per_pixel(row_values):
+                return row_values[labels]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weighted = values * weights
+            is_nan = np.isnan(weighted)
+            totals = row_sum(np.where(is_nan, 0., weighted))
+            # safe_sum over the full image: zero-weight pixels outside the support
+            # only count as NaN where the image itself is not finite
+            if outside_not_finite:
+                n_nan = row_sum(is_nan)
+                if labels is not None:
+                    # pixels of the other masks have zero weight in this row
+                    n_nan += np.count_nonzero(~finite) - row_sum(~finite)
+                totals[n_nan == values.size] = np.nan
+
+            # nanaverage only uses pixels where both the value and the weight are finite
+            valid_weights = np.where(finite & np.isfinite(weights), weights, 0.)
+            weight_sums = row_sum(valid_weights)
+
+            if labels is None:
+                # weighted sums as contractions: no (K, N) weight * value products are materialised
+                means = np.einsum("kn,n->k", valid_weights, finite_values) / weight_sums
+            else:
+                means = row_sum(valid_weights * finite_values) / weight_sums
+            # values - (python float) mean keeps the values' dtype; do the same row-wise
+            deviations = (finite_values - per_pixel(means).astype(finite_values.dtype)) ** 2.
+            if labels is None:
+                stds = np.sqrt(np.einsum("kn,kn->k", valid_weights, deviations) / weight_sums)
+            else:
+                stds = np.sqrt(row_sum(valid_weights * deviations) / weight_sums)
+
+        means[weight_sums == 0.] = np.nan
+        stds[(weight_sums == 0.) | ~np.isfinite(means)] = np.nan
+
+        return totals, means, stds
 
     # ---- Ensure mask list format ----
     if isinstance(masks, np.ndarray):
         masks = [masks]
 
-    # ---- Containers for per-mask values ----
-    totals, means, stds = [], [], []
-    corr_totals, corr_means, corr_stds = [], [], []
-
-    # ---- Process each mask individually ----
+    # ---- Gather the pixels covered by any mask once ----
+    # Every statistic is a weighted reduction with zero weight outside the
+    # masks, so all of them run on these 1D arrays instead of full frames
+    support = np.zeros(shape, dtype=bool)
     for mask in masks:
-        t, m, s, ct, cm, cs = _process_mask(mask)
-        totals.append(t)
-        means.append(m)
-        stds.append(s)
-        corr_totals.append(ct)
-        corr_means.append(cm)
-        corr_stds.append(cs)
+        support |= mask != 0
+    support_idx = np.flatnonzero(support)
 
-    # global stats
-    mask = overall_mask(masks, shape=shape)
+    image_values = np.abs(image) if take_abs else image
+    values = image_values.ravel()[support_idx]
+    mu_values = None if mu2d is None else np.ravel(mu2d)[support_idx]
+
+    finite = np.isfinite(values)
+    finite_values = np.where(finite, values, 0.).astype(np.result_type(values, 0.), copy=False)
+
+    outside_not_finite = (
+            np.count_nonzero(~np.isfinite(image_values)) - np.count_nonzero(~np.isfinite(values))
+            == support.size - support_idx.size
+    )
 
-    global_total, global_mean, global_std, global_corr_total, global_corr_mean, global_corr_std = _process_mask(
-        mask
+    # ---- Stack the per-mask weights and the global mask as rows ----
+    # All masks and their union are then processed in single (K + 1, N) passes
+    masks = [np.ravel(mask)[support_idx] for mask in masks]
+    weights = np.stack([*masks, overall_mask(masks, shape=support_idx.shape)])
+    empty_entry = ~np.any(weights, axis=1)
+
+    # Disjoint masks (each pixel in at most one of them, the usual case for separate
+    # contours): the K mask rows collapse into one labelled weight vector.
+    # The bincounts only beat the (K + 1, N) reductions from about five masks on
+    labels = _disjoint_labels(weights[:-1]) if len(masks) >= 5 else None
+
+    def _all_stats(w: np.ndarray) -> list[np.ndarray]:
+        if labels is None:
+            return list(_weighted_stats(w))
+        per_mask = _weighted_stats(w[:-1].sum(axis=0), labels=labels, n_rows=len(masks))
+        overall = _weighted_stats(w[-1:])
+        return [np.concatenate(stat) for stat in zip(per_mask, overall)]
+
+    # uncorrected
+    stats = _all_stats(weights)
+
+    # corrected
+    if mu2d is None:
+        stats += [np.full(len(weights), np.nan) for _ in range(3)]
+    else:
+        stats += _all_stats(corr_mask(weights, mu2d=mu_values))
+
+    for stat in stats:
+        stat[empty_entry] = np.nan
+
+    totals, means, stds, corr_totals, corr_means, corr_stds = (stat[:-1].tolist() for stat in stats)
+    global_total, global_mean, global_std, global_corr_total, global_corr_mean, global_corr_std = (
+        float(stat[-1]) for stat in stats
     )
 
     out = {
@@ -106,6 +171,14 @@ def compute_flux_area_stats(
     return out
 
 
+def _disjoint_labels(weights: np.ndarray) -> np.ndarray | None:
+    """Row index of the nonzero weight of every column of (K, N) weights, or None if rows overlap."""
+    nonzero = weights != 0
+    if np.any(np.count_nonzero(nonzero, axis=0) > 1):
+        return None
+    return np.argmax(nonzero, axis=0)
+
+
 def compute_flux_length_stats(
         image: np.ndarray,
         contours: Contours,
@@ -114,7 +187,8 @@ def compute_flux_length_stats(
         rsun: float,
         mu2d: np.ndarray | None = None,
         min_step: float = 0.5,
-        take_abs: bool = False
+        take_abs: bool = False,
+        prepared: PreparedContours | None = None
 ) -> Stat:
     """
     Compute flux statistics for a list of borders.
@@ -136,6 +210,9 @@ def compute_flux_length_stats(
         Minimum step between contour vertices.
     take_abs : bool
         Whether to take absolute value of image before integration.
+    prepared : PreparedContours, optional
+        Output of `prepare_contours` for these contours (and min_step); skips
+        the densification and the lon / lat sampling.
 
     Returns
     -------
@@ -144,55 +221,56 @@ def compute_flux_length_stats(
         plus per-mask lists.
     """
 
-    def _process_contour(contour: Contour | Contours) -> tuple[float, float, float, float, float, float]:
-        # Determine if we have a list of contours (Contours)
-        if isinstance(contour, list):
-            contour_list = [c for c in contour if not is_empty(c)]
-        else:
-            contour_list = [contour] if not is_empty(contour) else []
-
-        # Check empty entry
-        empty_entry = (len(contour_list) == 0)
+    def _process_contour(
+            samples: list[tuple[np.ndarray, np.ndarray, np.ndarray | None]]
+    ) -> tuple[float, float, float, float, float, float]:
+        # `samples` holds (values, arc lengths, 1/mu) of the non-empty contours to combine
+        empty_entry = (len(samples) == 0)
 
         if empty_entry:
             return np.nan, np.nan, np.nan, np.nan, np.nan, np.nan  # solve np.concatenate of []
 
-        values_on_contour = np.concatenate([sample_map_at_contour(contour=c, data_map=values, interp=True)
-                                            for c in contour_list])
-        arc_lengths = np.concatenate(
-            [calc_arc_lengths(c, lon2d=lon2d, lat2d=lat2d, rsun=rsun) for c in contour_list])
+        values_on_contour = np.concatenate([v for v, _, _ in samples])
+        arc_lengths = np.concatenate([ds for _, ds, _ in samples])
+        values_finite = np.isfinite(values_on_contour)  # shared by both weightings
 
         # uncorrected
         total = safe_call(safe_sum, empty_entry, values_on_contour * arc_lengths)
-        mean = safe_call(nanaverage, empty_entry, values_on_contour, weights=arc_lengths)
-        std = safe_call(weighted_std, empty_entry, values_on_contour, mean, weights=arc_lengths)
+        mean, std = safe_call(nanaverage_std, empty_entry, values_on_contour, weights=arc_lengths,
+                              array_finite=values_finite, n_outputs=2)
 
         # corrected
         if mu2d is None:
             corr_total = corr_mean = corr_std = np.nan
         else:
-            weights = np.concatenate([1. / sample_map_at_contour(contour=c, data_map=mu2d, interp=True)
-                                      for c in contour_list])
+            weights = np.concatenate([w for _, _, w in samples]) * arc_lengths
 
-            corr_total = safe_call(safe_sum, empty_entry, values_on_contour * weights * arc_lengths)
-            corr_mean = safe_call(nanaverage, empty_entry, values_on_contour, weights=weights * arc_lengths)
-            corr_std = safe_call(weighted_std, empty_entry, values_on_contour, corr_mean,
-                                  weights=weights * arc_lengths)
+            corr_total = safe_call(safe_sum, empty_entry, values_on_contour * weights)
+            corr_mean, corr_std = safe_call(nanaverage_std, empty_entry, values_on_contour, weights=weights,
+                                            array_finite=values_finite, n_outputs=2)
 
         return total, mean, std, corr_total, corr_mean, corr_std
 
     values = np.abs(image) if take_abs else image
 
-    # ---- Ensure contour list format ----
-    contours = normalize_contour_input(contours)
+    # ---- Densify each contour ONCE (and sample lon / lat on it) ----
+    if prepared is None:
+        prepared = prepare_contours(contours, lon2d=lon2d, lat2d=lat2d, rsun=rsun, min_step=min_step)
+    dense_contours = prepared.dense_contours
 
-    # ---- Densify each contour ONCE ----
-    dense_contours = []
-    for c in contours:
-        if is_empty(c):
-            dense_contours.append(c)  # keep empty
-        else:
-            dense_contours.append(densify_contour(c, min_step=min_step))
+    # ---- Sample each map ONCE for all non-empty contours ----
+    # The global stats reuse the per-contour samples instead of sampling again
+    sampled_contours = [c for c in dense_contours if not is_empty(c)]
+
+    values_on_contours = sample_map_at_contours(sampled_contours, data_map=values, interp=True)
+    arc_lengths = [ds for c, ds in zip(dense_contours, prepared.arc_lengths) if not is_empty(c)]
+    if mu2d is None:
+        inv_mu = [None] * len(sampled_contours)
+    else:
+        inv_mu = [1. / mu for mu in sample_map_at_contours(sampled_contours, data_map=mu2d, interp=True)]
+
+    samples = list(zip(values_on_contours, arc_lengths, inv_mu))
+    contour_samples = iter(samples)
 
     # ---- Containers for per-mask values ----
     totals, means, stds = [], [], []
@@ -200,7 +278,7 @@ def compute_flux_length_stats(
 
     # ---- Process each mask individually ----
     for contour in dense_contours:
-        t, m, s, ct, cm, cs = _process_contour(contour)
+        t, m, s, ct, cm, cs = _process_contour([] if is_empty(contour) else [next(contour_samples)])
         totals.append(t)
         means.append(m)
         stds.append(s)
@@ -210,7 +288,7 @@ def compute_flux_length_stats(
 
     # global stats
     global_total, global_mean, global_std, global_corr_total, global_corr_mean, global_corr_std = _process_contour(
-        contour=dense_contours
+        samples
     )
 
     out = {
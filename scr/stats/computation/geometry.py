@@ -3,12 +3,12 @@ import numpy as np
 from scr.utils.types_alias import Contours, Mask, Masks, Stat
 from scr.utils.filesystem import is_empty
 
-from scr.geometry.contours.sampling import sample_map_at_contour, calc_spherical_length
+from scr.geometry.contours.sampling import PreparedContours, sample_map_at_contours, calc_spherical_length
 from scr.geometry.contours.fractal import fractal_dimension_mask
 from scr.geometry.contours.length import contour_length
 from scr.geometry.contours.area import contour_signed_area
 
-from scr.stats.computation.masks import overall_mask, corr_mask
+from scr.stats.computation.masks import overall_mask, corr_mask, inverse_mu
 from scr.stats.computation.utils import safe_call
 
 
@@ -21,14 +21,25 @@ def compute_geometry_stats(
         lon2d: np.ndarray,
         lat2d: np.ndarray,
         rsun: float,
+        prepared: PreparedContours | None = None
 ) -> Stat:
-    """Compute geometric stats (areas, lengths, fractals) for a set of contours and masks."""
+    """
+    Compute geometric stats (areas, lengths, fractals) for a set of contours and masks.
+    If `prepared` (from `prepare_contours` on the same contours) is given, lon / lat at the
+    contour vertices are read from it instead of being sampled again.
+    """
     empty_entry = is_empty(contours)
     total_mask = overall_mask(masks, shape=shape)
-    total_mask_border = overall_mask(masks_border, shape=shape)
+    total_mask_border = overall_mask(masks_border, shape=shape, dtype=bool)
 
-    lons1d = [sample_map_at_contour(contour=contour, data_map=lon2d, interp=True) for contour in contours]
-    lats1d = [sample_map_at_contour(contour=contour, data_map=lat2d, interp=True) for contour in contours]
+    if prepared is None:
+        lons1d = sample_map_at_contours(contours, data_map=lon2d, interp=True)
+        lats1d = sample_map_at_contours(contours, data_map=lat2d, interp=True)
+    else:
+        # the densified contours keep the original vertices (in order, closing vertex last)
+        vertices = [idx[:len(c)] for c, idx in zip(contours, prepared.vertex_index)]
+        lons1d = [lon[idx] for lon, idx in zip(prepared.lon, vertices)]
+        lats1d = [lat[idx] for lat, idx in zip(prepared.lat, vertices)]
 
     # Fractal dimensions
     fractal_dims = [safe_call(fractal_dimension_mask, empty_entry, mask) for mask in masks_border]
@@ -55,9 +66,10 @@ def compute_geometry_stats(
     contour_areas = [safe_call(contour_signed_area, empty_entry, c) for c in contours]
     contour_area = safe_call(np.nansum, empty_entry, contour_areas)
 
-    # Corrected areas
-    corrected_areas = [safe_call(np.nansum, empty_entry, corr_mask(mask, mu2d=mu2d)) for mask in masks]
-    corrected_area = safe_call(np.nansum, empty_entry, corr_mask(total_mask, mu2d=mu2d))
+    # Corrected areas (1/mu computed once and shared by all masks)
+    inv_mu = inverse_mu(mu2d)
+    corrected_areas = [safe_call(np.nansum, empty_entry, mask * inv_mu) for mask in masks]
+    corrected_area = safe_call(np.nansum, empty_entry, total_mask * inv_mu)
 
     # Counts and holes
     counts, holes = safe_call(count_components, empty_entry, contour_areas, n_outputs=2)
@@ -94,8 +106,10 @@ def count_components(areas: list[float]) -> tuple[int, int]:
     Count components and holes based only on sign of area.
     Preserves contour order; only counts.
     """
-    counts = sum(a >= 0. for a in areas)
-    holes = sum(a < 0. for a in areas)
+    areas = np.fromiter(areas, dtype=float, count=len(areas))
+    # not len(areas) - counts: a NaN area is neither a component nor a hole
+    counts = int(np.count_nonzero(areas >= 0.))
+    holes = int(np.count_nonzero(areas < 0.))
     return counts, holes
 
 
@@ -7,22 +7,59 @@ from scr.utils.filesystem import is_empty
 def overall_mask(
         masks: Masks,
         shape: tuple[int, int],
-        dtype: type = np.float32
+        dtype: type = np.float32,
+        assume_binary: bool = False
 ) -> Mask:
-    """Combine a list of masks into a single clipped mask."""
-    if not is_empty(masks):
-        stacked = np.nansum(np.stack(masks, axis=0), axis=0)
-        return np.clip(stacked, 0.0, 1.0).astype(dtype)
-    else:
+    """
+    Combine a list of masks into a single clipped mask.
+    Boolean / uint8 masks (or any masks with assume_binary=True, where a pixel
+    counts if its value is > 0) are combined with a bitwise OR in uint8.
+    """
+    if is_empty(masks):
         return np.zeros(shape=shape, dtype=dtype)
 
+    if assume_binary or all(mask.dtype in (np.bool_, np.uint8) for mask in masks):
+        total = np.zeros(np.shape(masks[0]), dtype=np.uint8)
+        for mask in masks:
+            if mask.dtype == np.bool_ or mask.dtype == np.uint8:
+                np.bitwise_or(total, mask.view(np.uint8), out=total)
+            else:
+                np.bitwise_or(total, (mask > 0).view(np.uint8), out=total)
+
+        np.minimum(total, 1, out=total)
+        return total.astype(dtype, copy=False)
+
+    # Accumulate in place instead of stacking all masks into a (K, H, W) array
+    total = np.zeros(np.shape(masks[0]), dtype=np.result_type(*{mask.dtype for mask in masks}))
+    for mask in masks:
+        if mask.dtype.kind == "f":
+            np.add(total, mask, out=total, where=~np.isnan(mask))
+        else:
+            total += mask
+
+    if total.dtype != bool:
+        np.clip(total, 0.0, 1.0, out=total)
+    return total.astype(dtype, copy=False)
+
 
 def corr_mask(
         mask: Mask,
         mu2d: np.ndarray
 ) -> Mask:
-    corrected_mask = np.zeros_like(mask, dtype=float)
+    # One masked divide instead of gathering and scattering the valid pixels;
+    # mask and mu2d broadcast (e.g. a (K, N) stack of masks against (N,) mu values)
     valid = np.isfinite(mask) & np.isfinite(mu2d) & (mu2d != 0)
-    corrected_mask[valid] = mask[valid] / mu2d[valid]
+    corrected_mask = np.zeros(valid.shape, dtype=float)
+    np.divide(mask, mu2d, out=corrected_mask, where=valid)
 
     return corrected_mask
+
+
+def inverse_mu(
+        mu2d: np.ndarray
+) -> np.ndarray:
+    """1 / mu where mu is finite and nonzero, else 0 (the weights `corr_mask` applies)."""
+    inv_mu = np.zeros(np.shape(mu2d), dtype=float)
+    np.divide(1., mu2d, out=inv_mu, where=np.isfinite(mu2d) & (mu2d != 0))
+
+    return inv_mu
@@ -6,12 +6,15 @@ from scr.utils.filesystem import is_empty
 
 def nanaverage(
         array: np.ndarray,
-        weights: np.ndarray | None = None
+        weights: np.ndarray | None = None,
+        array_finite: np.ndarray | None = None
 ) -> float:
     if weights is None:
         return np.nan
 
-    mask = np.isfinite(array) & np.isfinite(weights)
+    if array_finite is None:
+        array_finite = np.isfinite(array)
+    mask = array_finite & np.isfinite(weights)
     if not np.any(mask):
         return np.nan
 
@@ -33,6 +36,39 @@ def weighted_std(
     return np.sqrt(nanaverage(array=(array - mean) ** 2., weights=weights))
 
 
+def nanaverage_std(
+        array: np.ndarray,
+        weights: np.ndarray | None = None,
+        array_finite: np.ndarray | None = None
+) -> tuple[float, float]:
+    """
+    `nanaverage` and the matching `weighted_std` in one go: the finite
+    (value, weight) pairs are selected once and shared by both moments.
+    `array_finite` (np.isfinite(array)) can be passed when several weightings
+    of the same array are averaged.
+    """
+    if weights is None:
+        return np.nan, np.nan
+
+    if array_finite is None:
+        array_finite = np.isfinite(array)
+    mask = array_finite & np.isfinite(weights)
+    if not np.any(mask):
+        return np.nan, np.nan
+
+    a, w = array[mask], weights[mask]
+    w_sum = np.sum(w)
+    if w_sum == 0.0:
+        return np.nan, np.nan
+
+    mean = float(np.average(a, weights=w))
+    if not np.isfinite(mean):
+        return mean, np.nan
+
+    # Two-pass variance (as in weighted_std) to stay accurate for large offsets
+    return mean, float(np.sqrt(np.average((a - mean) ** 2., weights=w)))
+
+
 def safe_call(
         func: Callable,
         empty_case: bool,
@@ -57,4 +93,12 @@ def safe_call(
 
 
 def safe_sum(x: list | np.ndarray) -> float:
-    return float(np.nan) if is_empty(x) or np.all(np.isnan(x)) else float(np.nansum(x))
+    if is_empty(x):
+        return float(np.nan)
+
+    s = np.nansum(x)
+    # nansum gives 0 for all-NaN input; only a zero sum needs the extra scan
+    if s == 0. and np.all(np.isnan(x)):
+        return float(np.nan)
+
+    return float(s)
@@ -1,3 +1,4 @@
+import math
 import numpy as np
 import pandas as pd
 from typing import Literal
@@ -5,6 +6,42 @@ from typing import Literal
 from scr.utils.filesystem import is_empty
 
 
+GROUP_COLS = ["observation_id", "sunspot_id"]
+
+
+def _build_column_name(part: str, param: str, stats_key: str | None = None) -> str:
+    if part in {"overall", "ratio"}:
+        return f"{part}_{param}"
+
+    if "flux" in param or "variation" in param:
+        if stats_key is None:
+            raise ValueError(f"'stats_key' required for flux parameter '{param}'")
+        return f"{stats_key}_{part}_{param}"
+
+    return f"{part}_{param}"
+
+
+def filtering_columns(
+        filtering_kwargs: dict
+) -> list[str]:
+    """
+    Columns read by `filter_combined_df` for the given criteria.
+
+    Useful to project a table on load to only the columns it will need.
+    """
+    columns = list(GROUP_COLS)
+
+    for key, spec in filtering_kwargs.items():
+        if "min_value" in spec or "exact_value" in spec:
+            columns.append(key)
+            continue
+
+        for param, p_spec in spec.items():
+            columns.append(_build_column_name(part=key, param=param, stats_key=p_spec.get("stats_key")))
+
+    return list(dict.fromkeys(columns))
+
+
 def filter_combined_df(
         df: pd.DataFrame,
         filtering_kwargs: dict
@@ -13,26 +50,17 @@ def filter_combined_df(
     Filter a combined sunspot statistics DataFrame using flexible, hierarchical criteria.
     """
 
-    group_cols = ["observation_id", "sunspot_id"]
+    group_cols = GROUP_COLS
 
-    # Precompute group keys ONCE (important for speed & correctness)
-    group_keys = df[group_cols].apply(tuple, axis=1)
+    # Precompute integer group codes ONCE (important for speed & correctness);
+    # they are filtered alongside the rows, so group reductions need no re-indexing
+    group_codes = df.groupby(group_cols, observed=True, sort=False, dropna=False).ngroup().to_numpy()
+    n_groups = int(group_codes.max()) + 1 if len(group_codes) else 0
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    def _build_column_name(part: str, param: str, stats_key: str | None = None) -> str:
-        if part in {"overall", "ratio"}:
-            return f"{part}_{param}"
-
-        if "flux" in param or "variation" in param:
-            if stats_key is None:
-                raise ValueError(f"'stats_key' required for flux parameter '{param}'")
-            return f"{stats_key}_{part}_{param}"
-
-        return f"{part}_{param}"
-
     def _cell_satisfies(
             value,
             min_val: float | None = None,
@@ -48,8 +76,11 @@ def filter_combined_df(
         if value is None:
             return False
 
-        if isinstance(value, float) and np.isnan(value):
-            return False
+        # Plain scalars: Python comparisons, no array wrapping
+        if isinstance(value, (int, float, np.number)):
+            if isinstance(value, float) and math.isnan(value):
+                return False
+            return _check_scalar(value, min_val=min_val, max_val=max_val, exact_val=exact_val)
 
         if isinstance(value, (list, tuple, np.ndarray)):
             arr = np.asarray(value)
@@ -70,6 +101,23 @@ def filter_combined_df(
 
         return bool(np.all(cond))
 
+    def _check_scalar(
+            value,
+            min_val: float | None = None,
+            max_val: float | None = None,
+            exact_val: float | str | None = None,
+    ) -> bool:
+        """`_cell_satisfies` for a single number (NaN fails any bound)."""
+        if exact_val is not None:
+            return bool(value == exact_val)
+
+        if min_val is not None and not value >= min_val:
+            return False
+        if max_val is not None and not value <= max_val:
+            return False
+
+        return True
+
     def _scalar_satisfies(
             arr: np.ndarray,
             min_val: float | None = None,
@@ -82,25 +130,70 @@ def filter_combined_df(
         if exact_val is not None:
             return mask & (arr == exact_val)
 
-        if min_val is not None:
-            mask &= arr >= min_val
-        if max_val is not None:
-            mask &= arr <= max_val
+        # One comparison buffer reused for both bounds, combined in place
+        if min_val is not None or max_val is not None:
+            in_bounds = np.empty_like(mask)
+            if min_val is not None:
+                mask &= np.greater_equal(arr, min_val, out=in_bounds)
+            if max_val is not None:
+                mask &= np.less_equal(arr, max_val, out=in_bounds)
 
         return mask
 
+    def _object_satisfies(
+            values: np.ndarray,
+            min_val: float | None = None,
+            max_val: float | None = None,
+            exact_val: float | str | None = None,
+    ) -> np.ndarray:
+        """
+        `_cell_satisfies` over an object column.
+        Array cells (ragged lengths) are tested together on their concatenation;
+        any other cell (None, NaN, scalars, lists) goes through `_cell_satisfies`.
+        """
+        is_array = np.fromiter((isinstance(value, np.ndarray) for value in values), dtype=bool, count=len(values))
+        row_mask = np.zeros(len(values), dtype=bool)
+
+        for i in np.flatnonzero(~is_array):
+            row_mask[i] = _cell_satisfies(values[i], min_val=min_val, max_val=max_val, exact_val=exact_val)
+
+        arrays = [np.ravel(value) for value in values[is_array]]
+        if not arrays:
+            return row_mask
+
+        lengths = np.fromiter((len(arr) for arr in arrays), dtype=int, count=len(arrays))
+        flat = np.concatenate(arrays)
+
+        if exact_val is not None:
+            cond = flat == exact_val
+        else:
+            cond = np.ones(flat.shape, dtype=bool)
+            if min_val is not None:
+                cond &= flat >= min_val
+            if max_val is not None:
+                cond &= flat <= max_val
+
+        # A row passes if it is non-empty and none of its elements fails
+        rows = np.repeat(np.arange(len(arrays)), lengths)
+        n_failed = np.bincount(rows[~cond], minlength=len(arrays))
+        row_mask[is_array] = (lengths > 0) & (n_failed == 0)
+
+        return row_mask
+
     # ------------------------------------------------------------------
     # Core filtering logic
     # ------------------------------------------------------------------
 
     def _apply_filter(
             df: pd.DataFrame,
+            codes: np.ndarray,
             column: str,
             mode: Literal["frame-wise", "any", "all"],
             min_val: float | None = None,
             max_val: float | None = None,
             exact_val: float | str | None = None,
-    ) -> pd.DataFrame:
+    ) -> np.ndarray:
+        """Boolean mask of the rows of `df` (with group codes `codes`) to keep."""
 
         series = df[column]
 
@@ -112,32 +205,25 @@ def filter_combined_df(
                 max_val=max_val,
                 exact_val=exact_val,
             )
-            row_mask = pd.Series(row_mask, index=series.index)
 
         # ---------------- Generic (arrays / objects)
         else:
-            row_mask = series.apply(
-                _cell_satisfies,
+            row_mask = _object_satisfies(
+                series.to_numpy(),
                 min_val=min_val,
                 max_val=max_val,
                 exact_val=exact_val,
             )
 
-        if row_mask.isna().any():
-            raise ValueError(
-                f"Non-boolean mask produced for column '{column}'. "
-                f"Check NaNs or invalid cell values."
-            )
-
         # ---------------- Frame-wise
         if mode == "frame-wise":
-            return df[row_mask]
+            return row_mask
 
         # ---------------- Group-wise reduction
         if mode == "any":
-            group_mask = row_mask.groupby(group_keys, observed=True).any()
+            group_mask = np.bincount(codes[row_mask], minlength=n_groups) > 0
         elif mode == "all":
-            group_mask = row_mask.groupby(group_keys, observed=True).all()
+            group_mask = np.bincount(codes[~row_mask], minlength=n_groups) == 0
         else:
             raise ValueError(f"Unknown mode '{mode}'")
         """
@@ -151,15 +237,7 @@ def filter_combined_df(
             raise ValueError(f"Unknown mode '{mode}'")
         """
 
-        if group_mask.isna().any():
-            raise ValueError(
-                f"NaN encountered in group mask for column '{column}'."
-            )
-
-        keep_ids = group_mask[group_mask].index
-        idx = pd.MultiIndex.from_frame(df[group_cols])
-
-        return df[idx.isin(keep_ids)]
+        return group_mask[codes]
 
     # ------------------------------------------------------------------
     # Apply all filters sequentially
@@ -169,14 +247,16 @@ def filter_combined_df(
 
         # ---- Case 1: direct column
         if "min_value" in spec or "exact_value" in spec:
-            df = _apply_filter(
+            keep = _apply_filter(
                 df,
+                group_codes,
                 column=key,
                 min_val=spec.get("min_value"),
                 max_val=spec.get("max_value"),
                 exact_val=spec.get("exact_value"),
                 mode=spec["mode"],
             )
+            df, group_codes = df[keep], group_codes[keep]
             continue
 
         # ---- Case 2: structured
@@ -191,13 +271,15 @@ def filter_combined_df(
             if col not in df.columns:
                 raise KeyError(f"Column '{col}' not found in DataFrame")
 
-            df = _apply_filter(
+            keep = _apply_filter(
                 df,
+                group_codes,
                 column=col,
                 min_val=p_spec.get("min_value"),
                 max_val=p_spec.get("max_value"),
                 exact_val=p_spec.get("exact_value"),
                 mode=p_spec["mode"],
             )
+            df, group_codes = df[keep], group_codes[keep]
 
     return df
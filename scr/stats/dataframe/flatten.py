@@ -25,113 +25,58 @@ def flatten_spot_features_with_frame(all_stats: dict[ObservationID, StatsByQuant
         - sunspot_id, frame: int32
         - all numeric values: float32
     """
-    records = []
-    valid_parts = {"penumbra", "umbra", "ratio", "overall"}
-
-    for obs_id, quantities in all_stats.items():
-
-        # All spot ids under any physical quantity
-        spot_ids = set().union(*(q.keys() for q in quantities.values()))
-
-        for spot_id in spot_ids:
-
-            # Collect all frames for this spot
-            all_frames = set()
-            for spots in quantities.values():
-                if spot_id not in spots:
+    parts = ("penumbra", "umbra", "ratio", "overall")
+    tables = []
+
+    for part in parts:
+        # Rows keyed by (observation_id, sunspot_id, frame), gathered in one pass:
+        # per quantity for the flux parameters, and per position of the quantity
+        # within its observation for the quantity-independent parameters
+        rows_by_quantity: dict = {}
+        rows_by_rank: dict = {}
+
+        for obs_id, quantities in all_stats.items():
+            for rank, (phys_q, spots) in enumerate(quantities.items()):
+                quantity_rows = rows_by_quantity.setdefault(phys_q, {})
+                rank_rows = rows_by_rank.setdefault(rank, {})
+
+                for spot_id, spot_data in spots.items():
+                    for frame, params in spot_data.get(part, {}).items():
+                        quantity_rows[(obs_id, spot_id, frame)] = params
+                        rank_rows[(obs_id, spot_id, frame)] = params
+
+        # (A) umbra / penumbra flux parameters → quantity-dependent
+        if part in {"umbra", "penumbra"}:
+            for phys_q, rows in rows_by_quantity.items():
+                if not rows:
                     continue
-                for part in valid_parts:
-                    if part in spots[spot_id]:
-                        all_frames.update(spots[spot_id][part].keys())
-
-            # Process each frame
-            for frame in all_frames:
-
-                record = {
-                    "observation_id": obs_id,  # will convert to category later
-                    "sunspot_id": np.int32(spot_id),
-                    "frame": np.int32(frame),
-                }
-
-                written_overall = False
-                written_ratio = False
-                written_geom_umbra = False
-                written_geom_pen = False
-
-                for phys_q, spots in quantities.items():
-                    if spot_id not in spots:
-                        continue
-
-                    spot_data = spots[spot_id]
-
-                    for part in valid_parts:
-                        if part not in spot_data:
-                            continue
-
-                        part_data = spot_data[part]
-                        if frame not in part_data:
-                            continue
-
-                        params = part_data[frame]
-
-                        # ---------------- ratio: once per frame ----------------
-                        if part == "ratio":
-                            if not written_ratio:
-                                for param, val in params.items():
-                                    record[f"ratio_{param}"] = (
-                                        np.float32(val) if val is not None else np.nan
-                                    )
-                                written_ratio = True
-                            continue
-
-                        # ---------------- overall: once per frame --------------
-                        if part == "overall":
-                            if not written_overall:
-                                for param, val in params.items():
-                                    record[f"overall_{param}"] = (
-                                        np.float32(val) if val is not None else np.nan
-                                    )
-                                written_overall = True
-                            continue
-
-                        # ---------------- umbra / penumbra ---------------------
-                        if part in {"umbra", "penumbra"}:
-
-                            # (A) flux parameters → quantity-dependent
-                            for param, val in params.items():
-                                if "flux" in param:
-                                    key = f"{phys_q}_{part}_{param}"
-                                    record[key] = (
-                                        np.float32(val) if val is not None else np.nan
-                                    )
-
-                            # (B) geometric parameters → once per part per frame
-                            if part == "umbra" and not written_geom_umbra:
-                                for param, val in params.items():
-                                    if "flux" not in param:
-                                        key = f"{part}_{param}"
-                                        record[key] = (
-                                            np.float32(val)
-                                            if val is not None
-                                            else np.nan
-                                        )
-                                written_geom_umbra = True
-
-                            if part == "penumbra" and not written_geom_pen:
-                                for param, val in params.items():
-                                    if "flux" not in param:
-                                        key = f"{part}_{param}"
-                                        record[key] = (
-                                            np.float32(val)
-                                            if val is not None
-                                            else np.nan
-                                        )
-                                written_geom_pen = True
-
-                records.append(record)
-
-    # Convert to DataFrame
-    df = pd.DataFrame(records)
+                table = _rows_to_table(rows)
+                table = table[[param for param in table.columns if "flux" in param]]
+                tables.append(table.add_prefix(f"{phys_q}_{part}_"))
+
+        # (B) ratio, overall and umbra / penumbra geometric parameters → once per frame,
+        # taken from the first quantity (in each observation) that has the frame
+        shared = [_rows_to_table(rows) for rows in rows_by_rank.values() if rows]
+        if shared:
+            table = pd.concat(shared)
+            table = table[~table.index.duplicated(keep="first")]
+            if part in {"umbra", "penumbra"}:
+                table = table[[param for param in table.columns if "flux" not in param]]
+            tables.append(table.add_prefix(f"{part}_"))
+
+    df = pd.concat(tables, axis=1)
+
+    # Scalar parameters are cast to float32 as one block; only the list
+    # parameters need a per-cell conversion
+    list_params = [param for param, values in df.items() if _holds_arrays(values)]
+    df = pd.concat(
+        [df.drop(columns=list_params).astype(np.float32)]
+        + [_to_float32_arrays(df[param]) for param in list_params],
+        axis=1,
+    )[df.columns]
+
+    df.index.names = ["observation_id", "sunspot_id", "frame"]
+    df.reset_index(inplace=True)
 
     # Optimise ID columns
     df["observation_id"] = df["observation_id"].astype("category")
@@ -142,15 +87,39 @@ def flatten_spot_features_with_frame(all_stats: dict[ObservationID, StatsByQuant
     df.sort_values(["observation_id", "sunspot_id", "frame"], inplace=True)
 
     # ---- Add per-sunspot local index ----
-    df["spot_global_index"] = (
-        df[["observation_id", "sunspot_id"]]
-        .astype(str)
-        .agg("::".join, axis=1)
-        .astype("category")
-        .cat.codes
-        .astype("int32")
-    )
+    # Numbered by the sorted "observation_id::sunspot_id" names (precomputed slope files
+    # rely on this numbering). Rows are sorted, so each spot is one run of rows and the
+    # names are only built for the first row of each run
+    spot_start = (
+            df["observation_id"].ne(df["observation_id"].shift())
+            | df["sunspot_id"].ne(df["sunspot_id"].shift())
+    ).to_numpy()
+    spots = df.loc[spot_start, ["observation_id", "sunspot_id"]]
+    spot_names = spots["observation_id"].astype(str) + "::" + spots["sunspot_id"].astype(str)
+    spot_codes = pd.Categorical(spot_names).codes
+    df["spot_global_index"] = spot_codes[np.cumsum(spot_start) - 1].astype("int32")
 
     df.reset_index(drop=True, inplace=True)
 
     return df
+
+
+def _rows_to_table(rows: dict) -> pd.DataFrame:
+    """One row per (observation_id, sunspot_id, frame) key, one column per parameter."""
+    # A list of records is converted column-wise in C; from_dict(orient="index") is not
+    return pd.DataFrame(list(rows.values()), index=pd.MultiIndex.from_tuples(list(rows)))
+
+
+def _holds_arrays(column: pd.Series) -> bool:
+    """Whether an object column holds list parameters (array-like cells)."""
+    if column.dtype != object:
+        return False
+
+    present = column[column.notna()]
+    return not present.empty and np.ndim(present.iloc[0]) > 0
+
+
+def _to_float32_arrays(column: pd.Series) -> pd.Series:
+    """List parameters → float32 arrays (missing → NaN)."""
+    present = column.notna()
+    return column.where(~present, column[present].map(np.float32))
@@ -29,40 +29,34 @@ def merge_pore_sunspot_dataframes(
             or not df_pores["image_path"].equals(df_sunspots["image_path"])):
         raise ValueError("Row alignment mismatch between df_pores and df_sunspots")
 
-    # --- Helper: token-safe renaming ---
-    def _rename_umbra_to_pore(col: str) -> str:
+    # --- Token-safe renaming map (only the columns with an "umbra" token) ---
+    rename_map = {}
+    for col in df_pores.columns:
         parts = col.split("_")
-        parts = ["pore" if p == "umbra" else p for p in parts]
-        return "_".join(parts)
+        if "umbra" in parts:
+            rename_map[col] = "_".join("pore" if p == "umbra" else p for p in parts)
 
-    # --- Always start from a copy of df_pores with renamed columns ---
-    df_pores_renamed = df_pores.copy(deep=True).rename(columns=_rename_umbra_to_pore)
+    # --- Always start from df_pores with renamed columns ---
+    # (rename and concat already return new frames; no defensive deep copies)
+    df_pores_renamed = df_pores.rename(columns=rename_map)
 
     if major == "pores":
         df = df_pores_renamed
         # select umbra columns from sunspots
-        umbra_cols = [
-            c for c in df_sunspots.columns
-            if ("umbra" in c.split("_")) and (c not in keys)
-        ]
+        umbra_cols = _token_columns(df_sunspots.columns, token="umbra", excluded=keys)
         overlap = set(df.columns) & set(umbra_cols)
         if overlap:
             raise ValueError(f"Column collision during merge: {overlap}")
-        df_aux = df_sunspots[umbra_cols].copy()
-        df = pd.concat((df, df_aux), axis=1)
+        df = pd.concat((df, df_sunspots[umbra_cols]), axis=1)
 
     elif major == "sunspots":
-        df = df_sunspots.copy(deep=True)
+        df = df_sunspots
         # select pore columns from df_pores_renamed
-        pore_cols = [
-            c for c in df_pores_renamed.columns
-            if ("pore" in c.split("_")) and (c not in keys)
-        ]
+        pore_cols = _token_columns(df_pores_renamed.columns, token="pore", excluded=keys)
         overlap = set(df.columns) & set(pore_cols)
         if overlap:
             raise ValueError(f"Column collision during merge: {overlap}")
-        df_aux = df_pores_renamed[pore_cols].copy()
-        df = pd.concat((df, df_aux), axis=1)
+        df = pd.concat((df, df_pores_renamed[pore_cols]), axis=1)
 
     else:
         raise ValueError(f"Invalid value for `major`: {major}")
@@ -72,11 +66,24 @@ def merge_pore_sunspot_dataframes(
         if not save_path.endswith(".parquet"):
             save_path = f"{save_path}.parquet"
         check_dir(save_path, is_file=True)
-        save_parquet(save_path, df=df)
+        # Chunked, compressed storage: the plotting scripts read a few columns
+        # (and optionally filtered rows) of this wide table
+        save_parquet(save_path, df=df, compression="zstd", row_group_size=65_536)
 
     return df
 
 
+def _token_columns(
+        columns: pd.Index,
+        token: str,
+        excluded: tuple[str, ...] = ()
+) -> list[str]:
+    """Columns whose "_"-separated name contains `token` as a whole token (excluding `excluded`)."""
+    excluded = set(excluded)
+    # substring test first: only candidate names are split into tokens
+    return [c for c in columns if token in c and c not in excluded and token in c.split("_")]
+
+
 def run_merge_pore_sunspot_dataframes(
         path_pore_df: str,
         path_sunspot_df: str,
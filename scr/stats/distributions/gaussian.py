@@ -11,15 +11,55 @@ def gaussian(
     return A * np.exp(-(x - mu) ** 2 / (2 * sigma ** 2))
 
 
+def gaussian_jacobian(
+        x: np.ndarray,
+        A: np.ndarray,
+        mu: np.ndarray,
+        sigma: np.ndarray
+) -> np.ndarray:
+    """Analytic derivatives of `gaussian` w.r.t. (A, mu, sigma), shape (len(x), 3)."""
+    d = x - mu
+    g = np.exp(-d ** 2 / (2 * sigma ** 2))
+    Ag = A * g
+    return np.column_stack([g, Ag * d / sigma ** 2, Ag * d ** 2 / sigma ** 3])
+
+
 def fit_gaussian_to_histogram(
         data: np.ndarray,
         *,
-        bins: str | int = "auto"
+        bins: str | int = "auto",
+        value_range: tuple[float, float] | None = None
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    counts, edges = np.histogram(data[np.isfinite(data)], bins=bins, density=True)
+    """
+    Fit a Gaussian to the density histogram of the finite values of `data`.
+
+    With an integer `bins` and a fixed `value_range` (for quantities with known physical
+    limits), the histogram is a single binning pass over the data: the "auto" bin-width
+    estimators need extra passes, including a percentile (sort) for the IQR.
+    Values outside `value_range` are ignored.
+    """
+    counts, edges = np.histogram(data[np.isfinite(data)], bins=bins, range=value_range, density=True)
     centers = (edges[:-1] + edges[1:]) / 2
 
-    p0 = [counts.max(), centers[np.argmax(counts)], 50]
-    popt, pcov = curve_fit(gaussian, centers, counts, p0=p0)
+    i_max = np.argmax(counts)
+    p0 = [counts[i_max], centers[i_max], _sigma_guess(centers, counts, i_max)]
+    popt, pcov = curve_fit(gaussian, centers, counts, p0=p0, jac=gaussian_jacobian)
 
     return popt, pcov, centers, counts
+
+
+def _sigma_guess(
+        centers: np.ndarray,
+        counts: np.ndarray,
+        i_max: int
+) -> float:
+    """
+    Width from the distance between the peak and the nearest bin where the counts
+    drop to a quarter of the peak: A exp(-d^2 / (2 sigma^2)) = A / 4 → sigma = d / sqrt(2 ln 4).
+    """
+    below = np.flatnonzero(counts <= counts[i_max] / 4)
+    if below.size == 0:
+        return 50.  # no decay within the histogram range
+
+    d = np.min(np.abs(centers[below] - centers[i_max]))
+    return float(d / np.sqrt(2 * np.log(4)))
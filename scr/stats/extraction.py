@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Literal, Callable
+from typing import Literal, Callable, Iterable
 
 from scr.utils.types_alias import Stats
 
@@ -21,10 +21,7 @@ def extract_parameter_series(
         A list of 1D NumPy arrays, where each array contains values for one sunspot
         ordered by frame number.
     """
-    return [
-        np.array([stat[which][frame][param] for frame in sorted(stat[which])])
-        for stat in stats.values()
-    ]
+    return [_frames_and_values(stat[which], param)[1] for stat in stats.values()]
 
 
 def extract_parameter_series_with_frames(
@@ -45,11 +42,7 @@ def extract_parameter_series_with_frames(
             frames: 1D array of frame indices (ints)
             values: 1D array of corresponding parameter values
     """
-    return [
-        (np.array(sorted(stat[which])),  # x = frame numbers
-         np.array([stat[which][frame][param] for frame in sorted(stat[which])]))  # y = values
-        for stat in stats.values()
-    ]
+    return [_frames_and_values(stat[which], param) for stat in stats.values()]
 
 
 def aggregate_parameter_across_sunspots(
@@ -70,5 +63,47 @@ def aggregate_parameter_across_sunspots(
     Returns:
         The aggregated result as a float. Returns NaN if no data is present.
     """
-    values = np.concatenate(extract_parameter_series(stats=stats, which=which, param=param))
+    regions = [stat[which] for stat in stats.values()]
+    first = next((region[frame][param] for region in regions for frame in region), None)
+
+    values = None
+    if isinstance(first, float):
+        # float parameters (the common case) fill one buffer in a single pass (frame order
+        # as in `extract_parameter_series`) instead of one array per sunspot plus their concatenation
+        values = _float_buffer(
+            (region[frame][param] for region in regions for frame in sorted(region)),
+            count=sum(len(region) for region in regions),
+        )
+
+    if values is None:  # ints, lists etc. are stacked as np.array does
+        series = extract_parameter_series(stats=stats, which=which, param=param)
+        values = np.concatenate(series) if series else np.array([])
+
     return func(values) if values.size > 0 else float("nan")
+
+
+def _frames_and_values(
+        region_stats: dict,
+        param: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """Frames of one sunspot region (sorted once) and the parameter values in that order."""
+    frames = sorted(region_stats)
+
+    # float parameters (the common case) are streamed straight into a float64 buffer;
+    # ints, lists etc. keep the dtype / shape inference of np.array
+    if frames and isinstance(region_stats[frames[0]][param], float):
+        values = _float_buffer((region_stats[frame][param] for frame in frames), count=len(frames))
+        if values is not None:
+            return np.array(frames), values
+    return np.array(frames), np.array([region_stats[frame][param] for frame in frames])
+
+
+def _float_buffer(
+        values: Iterable,
+        count: int
+) -> np.ndarray | None:
+    """Values streamed into a float64 buffer; None if some of them are not scalars."""
+    try:
+        return np.fromiter(values, dtype=float, count=count)
+    except (TypeError, ValueError):
+        return None
@@ -7,7 +7,7 @@ def remove_empty_stats(
     """Remove stat entries with no valid region data."""
     return {
         sid: sdata for sid, sdata in stats.items()
-        if any(sdata.get(region) and sdata[region] for region in ("penumbra", "umbra", "ratio", "overall"))
+        if any(sdata.get(region) for region in ("penumbra", "umbra", "ratio", "overall"))
     }
 
 
@@ -42,14 +42,16 @@ def slice_statistics_to_sunspots(
             if sid not in stats_part:
                 continue
             result_part[sid] = {}
+            stats_sid = stats_part[sid]
 
-            valid_frames = sorted(set(sunspots[sid][which].keys()))
+            # dict keys view: O(1) membership (the sorted list was scanned per frame)
+            valid_frames = sunspots[sid][which].keys()
 
             for region in ["penumbra", "umbra", "ratio", "overall"]:
-                if region not in stats_part[sid]:
+                if region not in stats_sid:
                     continue
                 result_part[sid][region] = {
-                    t: stat for t, stat in stats_part[sid][region].items()
+                    t: stat for t, stat in stats_sid[region].items()
                     if t in valid_frames
                 }
         result[quantity] = result_part
@@ -9,17 +9,13 @@ def propagate_stat_parameter(
 ) -> None:
     for obs_id, areas in stats.get(source_quantity, {}).items():
         for area, frames in areas.items():
-            for frame_id, params in frames.items():
-                if param not in params:
-                    continue  # skip if `param` not computed for this frame
+            # skip frames where `param` was not computed
+            values = {frame_id: params[param] for frame_id, params in frames.items() if param in params}
+            if not values:
+                continue
 
-                value = params[param]
-                for q in target_quantities:
-                    stats.setdefault(q, {}) \
-                         .setdefault(obs_id, {}) \
-                         .setdefault(area, {}) \
-                         .setdefault(frame_id, {})[param] = value
-
-                    # stats.setdefault(q, {}).setdefault(obs_id, {}).setdefault(area, {}).setdefault(frame_id, {})
-                    # stats[q][obs_id][area][frame_id][param] = value
-                    value = params[param]
+            # target dicts fetched once per area, not once per frame
+            for q in target_quantities:
+                q_frames = stats.setdefault(q, {}).setdefault(obs_id, {}).setdefault(area, {})
+                for frame_id, value in values.items():
+                    q_frames.setdefault(frame_id, {})[param] = value
@@ -11,42 +11,66 @@ def apply_segments_to_combined_df(
     (slope, relative slope, phase duration) in place.
     """
 
-    for col in ["segment_slope", "segment_relative_slope", "phase_duration"]:
+    columns = {
+        "segment_slope": "slope",
+        "segment_relative_slope": "relative_slope",
+        "phase_duration": "duration",
+    }
+
+    for col in columns:
         if col not in combined_df:
             combined_df[col] = np.float32(np.nan)
 
-    # --- group once
+    # --- fill NumPy copies of the columns; assign each back once at the end
+    out = {col: combined_df[col].to_numpy(copy=True) for col in columns}
+    frames_all = combined_df["frame"].to_numpy()
+
+    # --- group once (positional row indices)
     combined_groups = combined_df.groupby(
         ["observation_id", "sunspot_id"],
         observed=True,
         sort=False,
-    )
+    ).indices
 
     segment_groups = segments_df.groupby(
         ["observation_id", "sunspot_id"],
         observed=True,
         sort=False,
-    )
+    ).indices
+
+    # --- segment bounds rounded (and values converted) once for all segments
+    starts_all = np.round(segments_df["start"].to_numpy(dtype=float))
+    stops_all = np.round(segments_df["stop"].to_numpy(dtype=float))
+    values_all = {col: segments_df[seg_col].to_numpy(dtype=np.float32) for col, seg_col in columns.items()}
 
     # --- iterate only over overlapping keys
-    for key, seg_group in segment_groups:
-        if key not in combined_groups.groups:
+    for key, seg_idx in segment_groups.items():
+        if key not in combined_groups:
             continue
 
-        idx = combined_groups.groups[key]
-        frames = combined_df.loc[idx, "frame"].to_numpy()
+        idx = combined_groups[key]
+        frames = frames_all[idx]
+        order = np.argsort(frames, kind="stable")
+        frames = frames[order]
 
-        for _, seg in seg_group.iterrows():
-            mask = (
-                (frames >= np.round(seg["start"])) &
-                (frames <= np.round(seg["stop"]))
-            )
+        starts = starts_all[seg_idx]
+        stops = stops_all[seg_idx]
+
+        # rows with start <= frame <= stop, as [lo, hi) ranges of the sorted frames
+        lo = np.searchsorted(frames, starts, side="left")
+        hi = np.searchsorted(frames, stops, side="right")
+        n_rows = np.where(np.isnan(starts) | np.isnan(stops), 0, np.maximum(hi - lo, 0))
+
+        if not n_rows.any():
+            continue
 
-            if not mask.any():
-                continue
+        # one scatter per column; segment order is kept, so later segments win on overlaps
+        seg_ids = np.repeat(np.arange(len(n_rows)), n_rows)
+        offsets = np.arange(len(seg_ids)) - np.repeat(np.cumsum(n_rows) - n_rows, n_rows)
+        loc = idx[order[lo[seg_ids] + offsets]]
 
-            loc = idx[mask]
+        for col, values in values_all.items():
+            out[col][loc] = values[seg_idx[seg_ids]]
 
-            combined_df.loc[loc, "segment_slope"] = np.float32(seg["slope"])
-            combined_df.loc[loc, "segment_relative_slope"] = np.float32(seg["relative_slope"])
-            combined_df.loc[loc, "phase_duration"] = np.float32(seg["duration"])
+    for col, values in out.items():
+        combined_df[col] = values
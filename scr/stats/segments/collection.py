@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from os import path
+from pwlf import PiecewiseLinFit
 from tqdm import tqdm
 
 from scr.config.paths import PATH_CONTOURS_PHASES, SLOPES_FILE
@@ -13,15 +15,38 @@ from scr.io.parquet import save_parquet
 from scr.stats.segments.fitting import fit_optimal_piecewise_linear_model
 
 
+# Output columns of `collect_slopes` and their dtypes
+_SEGMENT_COLUMNS = {
+    "observation_id": "category",
+    "sunspot_id": "int32",
+    "segment_index": "int32",
+    "start": "float32",
+    "stop": "float32",
+    "duration": "float32",
+    "slope": "float32",
+    "intercept": "float32",
+    "flux_max": "float32",
+    "flux_start": "float32",
+    "flux_stop": "float32",
+    "mean_flux": "float32",
+    "relative_slope": "float32",
+}
+
+
 def collect_slopes(
         df: pd.DataFrame,
-        control_plots: bool = False
+        control_plots: bool = False,
+        max_workers: int | None = None
 ) -> pd.DataFrame:
     """
     Fit piecewise-linear models to total magnetic flux evolution
     for each spot and return segment-level statistics.
+
+    The spots are fitted independently in `max_workers` processes (None = executor default);
+    only their time and flux arrays are sent to the workers.
     """
-    segments: list[dict] = []
+    # one list per output column; each fitted spot extends them by its segments
+    segments: dict[str, list] = {col: [] for col in _SEGMENT_COLUMNS}
 
     if is_empty(df):
         raise ValueError("No contour files at the input")
@@ -33,51 +58,30 @@ def collect_slopes(
         fig_outdir = path.join(PATH_FIGURES, "flux_fit")
         check_dir(fig_outdir, is_file=False)
 
-    for _, g in tqdm(df.groupby("spot_global_index", observed=True)):
+    # ----------------------------------------------------------
+    # Time axis + total flux per spot
+    # ----------------------------------------------------------
 
-        # ----------------------------------------------------------
-        # Time axis + total flux
-        # ----------------------------------------------------------
-
-        t = g["frame"].to_numpy(dtype=float)
-        total_flux = np.nansum(
+    spots, times, fluxes = [], [], []
+    for _, g in df.groupby("spot_global_index", observed=True):
+        spots.append((g["observation_id"].iloc[0], g["sunspot_id"].iloc[0]))
+        times.append(g["frame"].to_numpy(dtype=float))
+        fluxes.append(np.nansum(
             [
                 g["Br_umbra_corrected_flux_total"].to_numpy(dtype=float),
                 g["Br_penumbra_corrected_flux_total"].to_numpy(dtype=float),
             ],
             axis=0,
-        )
-
-        # ----------------------------------------------------------
-        # Finite / outlier handling
-        # ----------------------------------------------------------
-
-        total_flux = np.abs(total_flux)
-
-        idx_finite = np.isfinite(total_flux)
-        t, total_flux = t[idx_finite], total_flux[idx_finite]
-        if np.sum(idx_finite) <= 1:
-            continue
-
-        total_flux[find_outliers1D(total_flux, t, max_iter=1)] = np.nan
-        idx_finite = np.isfinite(total_flux)
-        t, total_flux = t[idx_finite], total_flux[idx_finite]
-        if np.sum(idx_finite) <= 1:
-            continue
+        ))
 
-        # ----------------------------------------------------------
-        # Normalisation + fitting
-        # ----------------------------------------------------------
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        fits = list(tqdm(executor.map(_fit_spot_flux, times, fluxes, chunksize=4), total=len(spots)))
 
-        flux_max = np.nanmax(total_flux)
-        total_flux /= flux_max  # normalise
-        model, results = fit_optimal_piecewise_linear_model(t, total_flux, verbose=False)
-
-        if model is None:
+    for (obs_id, sunspot_id), fit in zip(spots, fits):
+        if fit is None:
             continue
 
-        obs_id = g["observation_id"].iloc[0]
-        sunspot_id = g["sunspot_id"].iloc[0]
+        t, total_flux, flux_max, model = fit
 
         if control_plots:
             basename = path.basename(obs_id).replace(".npz", f"_{sunspot_id:04d}.jpg")
@@ -92,47 +96,80 @@ def collect_slopes(
         # Segment loop
         # ----------------------------------------------------------
 
-        for i in range(len(model.fit_breaks) - 1):
-            x0 = model.fit_breaks[i]
-            x1 = model.fit_breaks[i + 1]
-            slope = model.slopes[i]
-
-            y0 = model.predict([x0])[0]
-            y1 = model.predict([x1])[0]
-
-            # total_flux = slope * t + intercept; t in [start; stop]
-            intercept = y0 - slope * x0
-            relative_slope = slope / y0 if y0 != 0. else np.nan
-
-            segments.append({
-                "observation_id": obs_id,
-                "sunspot_id": sunspot_id,
-                "segment_index": i,
-                "start": x0,
-                "stop": x1,
-                "duration": x1 - x0,
-                "slope": slope,
-                "intercept": intercept,
-                "flux_max": flux_max,
-                "flux_start": y0,
-                "flux_stop": y1,
-                "mean_flux": 0.5 * (y0 + y1),
-                "relative_slope": relative_slope
-            })
-
-    segments_df = pd.DataFrame(segments)
-
-    # Optimise ID columns
-    cols = ["observation_id"]
-    segments_df[cols] = segments_df[cols].astype("category")
-
-    cols = ["sunspot_id", "segment_index"]
-    segments_df[cols] = segments_df[cols].astype("int32")
-
-    cols = ["start", "stop", "duration", "slope", "intercept", "flux_max", "flux_start", "flux_stop", "mean_flux", "relative_slope"]
-    segments_df[cols] = segments_df[cols].astype("float32")
+        # all segments of the spot at once: one predict call for all breakpoints
+        breaks = np.asarray(model.fit_breaks, dtype=float)
+        flux_breaks = model.predict(breaks)
+        slopes = np.asarray(model.slopes, dtype=float)
+
+        x0, x1 = breaks[:-1], breaks[1:]
+        y0, y1 = flux_breaks[:-1], flux_breaks[1:]
+
+        # total_flux = slope * t + intercept; t in [start; stop]
+        intercept = y0 - slopes * x0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative_slope = np.where(y0 != 0., slopes / y0, np.nan)
+
+        n_segments = len(slopes)
+        segments["observation_id"].extend([obs_id] * n_segments)
+        segments["sunspot_id"].extend([sunspot_id] * n_segments)
+        segments["segment_index"].extend(range(n_segments))
+        segments["start"].extend(x0)
+        segments["stop"].extend(x1)
+        segments["duration"].extend(x1 - x0)
+        segments["slope"].extend(slopes)
+        segments["intercept"].extend(intercept)
+        segments["flux_max"].extend([flux_max] * n_segments)
+        segments["flux_start"].extend(y0)
+        segments["flux_stop"].extend(y1)
+        segments["mean_flux"].extend(0.5 * (y0 + y1))
+        segments["relative_slope"].extend(relative_slope)
+
+    # Columns built with their final (optimised) dtypes
+    segments_df = pd.DataFrame({
+        col: pd.Categorical(values) if dtype == "category" else np.asarray(values, dtype=dtype)
+        for (col, dtype), values in zip(_SEGMENT_COLUMNS.items(), segments.values())
+    })
 
     check_dir(PATH_CONTOURS_PHASES)
     save_parquet(filename=SLOPES_FILE, df=segments_df)
 
     return segments_df
+
+
+def _fit_spot_flux(
+        t: np.ndarray,
+        total_flux: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, float, PiecewiseLinFit] | None:
+    """
+    Clean and normalise the total flux of one spot and fit the piecewise-linear model.
+    Runs in a worker process; returns (t, normalised flux, flux max, model) or None if nothing to fit.
+    """
+
+    # ----------------------------------------------------------
+    # Finite / outlier handling
+    # ----------------------------------------------------------
+
+    idx_finite = np.isfinite(total_flux)
+    if np.count_nonzero(idx_finite) <= 1:
+        return None
+    t, total_flux = t[idx_finite], np.abs(total_flux[idx_finite])
+
+    # drop the outliers by index; the remaining values are already finite
+    keep = np.ones(len(t), dtype=bool)
+    keep[find_outliers1D(total_flux, t, max_iter=1)] = False
+    if np.count_nonzero(keep) <= 1:
+        return None
+    t, total_flux = t[keep], total_flux[keep]
+
+    # ----------------------------------------------------------
+    # Normalisation + fitting
+    # ----------------------------------------------------------
+
+    flux_max = np.nanmax(total_flux)
+    total_flux /= flux_max  # normalise
+    model, results = fit_optimal_piecewise_linear_model(t, total_flux, assume_finite=True, verbose=False)
+
+    if model is None:
+        return None
+
+    return t, total_flux, flux_max, model
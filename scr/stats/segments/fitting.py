@@ -21,6 +21,7 @@ def fit_optimal_piecewise_linear_model(
         use_aic: bool = False,
         use_bic: bool = False,
         normalize_y: bool = False,
+        assume_finite: bool = False,
         verbose: bool = True
 ) -> tuple[PiecewiseLinFit | None, dict]:
     """
@@ -45,6 +46,8 @@ def fit_optimal_piecewise_linear_model(
         If True, use Bayesian Information Criterion instead of AIC.
     normalize_y : bool
         If True, normalize y to [0, 1] for numerical stability.
+    assume_finite : bool
+        If True, the caller guarantees that t and y are finite (skips the finiteness count).
     verbose : bool
         If True, print progress.
 
@@ -60,7 +63,7 @@ def fit_optimal_piecewise_linear_model(
 
     errors, aics, bics, breakpoints = [], [], [], []
     best_model, best_score = None, np.inf
-    n = np.count_nonzero(np.isfinite(t) & np.isfinite(y))
+    n = len(t) if assume_finite else np.count_nonzero(np.isfinite(t) & np.isfinite(y))
 
     poor_improvement_count = 0
     baseline_ssr = None  # set only when poor improvement is first seen
@@ -17,29 +17,39 @@ def extract_phase_segments(
     segments = []
     t_common = np.linspace(0, 1, n_interp)
 
-    for _, g in df.groupby("spot_global_index", observed=True):
-        g = g.sort_values("frame")
-
-        is_phase = g["phase"] == phase_name
-        breaks = is_phase.ne(is_phase.shift()).cumsum()
-
-        for _, seg in g[is_phase].groupby(breaks, observed=True):
-            if len(seg) < min_length:
-                continue
-
-            t = seg["frame"].to_numpy()
-            y = seg[quantity_col].to_numpy()
-
-            t_norm = (t - t[0]) / (t[-1] - t[0])
-
-            f = interp1d(
-                t_norm,
-                y,
-                kind="linear",
-                bounds_error=False,
-                fill_value=np.nan,
-            )
-            segments.append((t_common, f(t_common)))
+    # Sort once by spot and frame; a segment is then a run of consecutive
+    # rows in the phase that neither changes spot nor leaves the phase
+    df = df[df["spot_global_index"].notna()].sort_values(["spot_global_index", "frame"], kind="stable")
+
+    if df.empty:
+        return segments
+
+    spot = df["spot_global_index"]
+    is_phase = (df["phase"] == phase_name).to_numpy()
+    run_start = spot.ne(spot.shift()).to_numpy(copy=True)
+    run_start[1:] |= is_phase[1:] != is_phase[:-1]
+    bounds = np.r_[np.flatnonzero(run_start), len(df)]
+
+    frames = df["frame"].to_numpy()
+    values = df[quantity_col].to_numpy()
+
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if not is_phase[start] or stop - start < min_length:
+            continue
+
+        t = frames[start:stop]
+        y = values[start:stop]
+
+        t_norm = (t - t[0]) / (t[-1] - t[0])
+
+        f = interp1d(
+            t_norm,
+            y,
+            kind="linear",
+            bounds_error=False,
+            fill_value=np.nan,
+        )
+        segments.append((t_common, f(t_common)))
 
     return segments
 
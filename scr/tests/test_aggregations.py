@@ -0,0 +1,25 @@
+import numpy as np
+
+from scr.stats.aggregations import _grouped_nanpercentile_median_unbiased
+
+
+def test_grouped_nanpercentile_matches_nanpercentile() -> None:
+    rng = np.random.default_rng(3)
+    q = np.array([0., 0.05, 0.5, 0.95, 0.98, 1.])
+
+    for _ in range(50):
+        n_groups = int(rng.integers(1, 8))
+        codes = rng.integers(-1, n_groups, size=rng.integers(0, 60))  # -1 = no group
+        values = rng.normal(size=len(codes))
+        values[rng.random(len(codes)) < 0.2] = np.nan
+
+        result = _grouped_nanpercentile_median_unbiased(codes, values, n_groups=n_groups, q=q)
+
+        assert result.shape == (len(q), n_groups)
+        for group in range(n_groups):
+            group_values = values[(codes == group) & ~np.isnan(values)]
+            if group_values.size == 0:  # empty or all-NaN group
+                assert np.all(np.isnan(result[:, group]))
+            else:
+                expected = np.percentile(group_values, 100. * q, method="median_unbiased")
+                assert np.allclose(result[:, group], expected)
@@ -0,0 +1,93 @@
+import numpy as np
+
+from scr.geometry.contours.area import contour_area, contour_signed_area, contours_area, contours_signed_area
+from scr.geometry.crop.bounds import bounds_overlap
+from scr.geometry.raster.containment import roi_intersection
+from scr.geometry.raster.mask import contours_to_mask, contours_to_roi_mask
+from scr.tracks.matching import compute_iou, compute_roi_iou
+
+
+def _random_contours(rng: np.random.Generator, n: int, shape: tuple[int, int]) -> list[np.ndarray]:
+    # random (possibly self-intersecting, partly out-of-frame) polygons in (row, col) coordinates
+    contours = []
+    for _ in range(n):
+        centre = rng.uniform(-5., np.array(shape) + 5.)
+        points = centre + rng.normal(scale=rng.uniform(1., 8.), size=(rng.integers(3, 12), 2))
+        contours.append(points)
+    return contours
+
+
+def _paste(roi: tuple[np.ndarray, tuple[int, int]], shape: tuple[int, int]) -> np.ndarray:
+    mask, (y, x) = roi
+    full = np.zeros(shape, dtype=bool)
+    full[y:y + mask.shape[0], x:x + mask.shape[1]] = mask
+    return full
+
+
+def test_contours_area_matches_per_contour() -> None:
+    rng = np.random.default_rng(5)
+    contours = _random_contours(rng, 20, (50, 50))
+    contours.append(contours[0][::-1])  # clockwise copy has the same area
+
+    areas = contours_area(contours)
+
+    assert areas.shape == (len(contours),)
+    assert np.allclose(areas, [contour_area(contour) for contour in contours])
+    assert np.all(areas >= 0.) and np.isclose(areas[-1], areas[0])
+    assert np.size(contours_area([])) == 0
+
+
+def test_contours_signed_area_matches_per_contour() -> None:
+    rng = np.random.default_rng(0)
+    contours = _random_contours(rng, 20, (50, 50))
+    contours[3][1] = np.nan  # NaN points are skipped as in np.nansum
+
+    areas = contours_signed_area(contours)
+
+    assert areas.shape == (len(contours),)
+    assert np.allclose(areas, [contour_signed_area(contour) for contour in contours])
+    assert np.array_equal(contours_signed_area([]), np.zeros(0))
+
+
+def test_contours_to_roi_mask_matches_full_mask() -> None:
+    rng = np.random.default_rng(1)
+    shape = (40, 60)
+
+    for _ in range(50):
+        contours = _random_contours(rng, rng.integers(1, 4), shape)
+        roi = contours_to_roi_mask(contours, shape)
+
+        assert np.array_equal(_paste(roi, shape), contours_to_mask(contours, shape))
+
+    # no contour pixels inside the frame
+    mask, corner = contours_to_roi_mask(np.array([[-20., -20.], [-20., -10.], [-10., -10.]]), shape)
+    assert mask.shape == (0, 0) and corner == (0, 0)
+
+
+def test_roi_intersection_and_iou_match_full_masks() -> None:
+    rng = np.random.default_rng(2)
+    shape = (40, 60)
+
+    for _ in range(50):
+        contours1, contours2 = _random_contours(rng, 2, shape), _random_contours(rng, 2, shape)
+        roi1, roi2 = contours_to_roi_mask(contours1, shape), contours_to_roi_mask(contours2, shape)
+        mask1, mask2 = contours_to_mask(contours1, shape), contours_to_mask(contours2, shape)
+
+        assert roi_intersection(roi1, roi2) == np.count_nonzero(mask1 & mask2)
+        assert compute_roi_iou(roi1, roi2) == compute_iou(mask1, mask2)
+        assert compute_roi_iou(roi1, roi2, area1=np.count_nonzero(mask1),
+                               area2=np.count_nonzero(mask2)) == compute_iou(mask1, mask2)
+
+
+def test_bounds_overlap() -> None:
+    box = np.array([10, 20, 10, 20])
+
+    assert bounds_overlap(box, np.array([15, 25, 15, 25]))
+    assert bounds_overlap(box, np.array([20, 30, 5, 10]))  # touching corner counts
+    assert not bounds_overlap(box, np.array([21, 30, 10, 20]))
+    assert not bounds_overlap(box, np.array([10, 20, 0, 9]))
+
+    # broadcasting over leading axes
+    boxes = np.array([[0, 5, 0, 5], [12, 14, 12, 14], [30, 40, 0, 40]])
+    assert np.array_equal(bounds_overlap(boxes, box), [False, True, False])
+    assert bounds_overlap(boxes[:, None], boxes[None, :]).shape == (3, 3)
@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+from astropy.io import fits
+
+from scr.io.fits.read import load_image
+from scr.io.fits.stack import LazyFitsStack
+from scr.io.pickle import load_or_build_pickle
+from scr.utils.filesystem import files_signature, files_unchanged
+
+
+def _write_fits(filename: str, value: float) -> None:
+    data = np.full((1, 4, 5), value, dtype=np.float32)
+    fits.HDUList([fits.PrimaryHDU(), fits.ImageHDU(data, name="Ic")]).writeto(filename)
+
+
+def test_lazy_fits_stack(tmp_path) -> None:
+    filenames = [str(tmp_path / f"frame{i}.fits") for i in range(4)]
+    for i, filename in enumerate(filenames):
+        _write_fits(filename, float(i))
+
+    stack = LazyFitsStack(filenames, "Ic", cache_size=2)
+
+    assert len(stack) == len(filenames)
+    for i, filename in enumerate(filenames):
+        assert np.array_equal(stack[i], load_image(filename, "Ic"))
+    assert np.array_equal(stack[-1], stack[3])
+    assert [float(frame[0, 0]) for frame in stack] == [0., 1., 2., 3.]
+
+    for index in (4, -5):
+        try:
+            stack[index]
+        except IndexError:
+            pass
+        else:
+            raise AssertionError(f"index {index} did not raise IndexError")
+
+
+def test_load_or_build_pickle(tmp_path) -> None:
+    filename = str(tmp_path / "cache" / "obj.pkl")
+    calls = []
+
+    def build() -> dict:
+        calls.append(1)
+        return {"version": len(calls)}
+
+    assert load_or_build_pickle(filename, build) == {"version": 1}  # built and cached
+    assert load_or_build_pickle(filename, build) == {"version": 1}  # loaded
+    assert len(calls) == 1
+
+    assert load_or_build_pickle(filename, build, is_valid=lambda obj: obj["version"] == 1) == {"version": 1}
+    assert len(calls) == 1
+
+    # a stale cached object is rebuilt and the cache replaced
+    assert load_or_build_pickle(filename, build, is_valid=lambda obj: obj["version"] > 1) == {"version": 2}
+    assert load_or_build_pickle(filename, build) == {"version": 2}
+
+    assert load_or_build_pickle(filename, build, force_rebuild=True) == {"version": 3}
+    assert len(calls) == 3
+
+
+def test_files_signature(tmp_path) -> None:
+    filenames = [tmp_path / "a.txt", tmp_path / "b.txt"]
+    for filename in filenames:
+        filename.write_text("data")
+
+    signature = files_signature(str(filename) for filename in filenames)
+
+    assert [name for name, _ in signature] == [filename.resolve().as_posix() for filename in filenames]
+    assert files_unchanged(signature)
+    assert files_signature(map(str, filenames)) == signature
+
+    mtime = os.stat(filenames[1]).st_mtime
+    os.utime(filenames[1], (mtime + 10., mtime + 10.))
+    assert not files_unchanged(signature)
+
+    filenames[0].unlink()
+    assert not files_unchanged(files_signature([str(filenames[1])]) + signature[:1])
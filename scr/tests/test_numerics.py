@@ -0,0 +1,106 @@
+import warnings
+
+import numpy as np
+
+from scr.utils.numerics import denoise_array, find_outliers1D, is_constant, nan_minmax, return_ddof, return_mean_std
+
+
+def _reference_mean_std(array: np.ndarray, axis: int | None, ddof: int) -> tuple:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmean(array, axis=axis), np.nanstd(array, axis=axis, ddof=ddof)
+
+
+def test_return_mean_std_matches_nanmean_nanstd() -> None:
+    rng = np.random.default_rng(42)
+
+    for _ in range(200):
+        array = rng.normal(size=rng.integers(1, 6, size=2)) * rng.uniform(1., 1e4)
+        array = array.astype(rng.choice([np.float32, np.float64]))
+        array[rng.random(array.shape) < 0.3] = np.nan
+        axis = rng.choice([None, 0, 1])
+        ddof = return_ddof(array, axis=axis) if rng.random() < 0.5 else int(rng.integers(0, 4))
+
+        mean_value, std_value = return_mean_std(array, axis=axis, ddof=ddof)
+        mean_ref, std_ref = _reference_mean_std(array, axis=axis, ddof=ddof)
+
+        assert np.array_equal(mean_value, mean_ref, equal_nan=True)
+        assert np.array_equal(std_value, std_ref, equal_nan=True)
+        assert np.asarray(std_value).dtype == np.asarray(std_ref).dtype
+
+
+def test_return_mean_std_without_degrees_of_freedom() -> None:
+    # ddof >= number of valid values -> NaN std (as np.nanstd), without division warnings
+    cases = [
+        (np.array([3.]), None, 1),
+        (np.array([1., 2.]), None, 2),
+        (np.array([1., np.nan, np.nan]), None, 3),
+        (np.array([np.nan, np.nan]), None, 0),
+        (np.array([[1., np.nan], [np.nan, np.nan], [2., 4.]]), 1, 1),
+    ]
+
+    for array, axis, ddof in cases:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            mean_value, std_value = return_mean_std(array, axis=axis, ddof=ddof)
+
+        mean_ref, std_ref = _reference_mean_std(array, axis=axis, ddof=ddof)
+        assert np.array_equal(mean_value, mean_ref, equal_nan=True)
+        assert np.array_equal(std_value, std_ref, equal_nan=True)
+        assert not np.any(np.isinf(std_value))
+
+
+def test_denoise_array_single_sample() -> None:
+    array = np.array([[2.], [3.]])
+
+    for sum_or_int in ("sum", "int"):
+        for x in (None, np.array([5.])):
+            denoised = denoise_array(array, sigma=1., x=x, sum_or_int=sum_or_int)
+            assert np.array_equal(denoised, array)
+            assert denoised is not array
+
+
+def test_nan_minmax() -> None:
+    arrays = [np.array([[3., np.nan], [-1., 2.]]), np.array([]), np.array([np.nan]), np.array([7., 0.5])]
+
+    assert nan_minmax(arrays) == (-1., 7.)
+    assert nan_minmax(iter(arrays)) == (-1., 7.)  # single pass over a generator
+    assert nan_minmax([np.array([0., np.nan]), np.array([np.nan, 0.])]) == (0., 0.)
+
+    for arrays in ([], [np.array([])], [np.array([np.nan, np.nan])]):
+        assert np.all(np.isnan(nan_minmax(arrays)))
+
+
+def test_find_outliers1D() -> None:
+    x = np.arange(40.)
+    y = 2. * x + 1.
+
+    # constant derivative -> no outliers
+    assert np.size(find_outliers1D(y, x)) == 0
+
+    spiked = y.copy()
+    spiked[[7, 23]] += 50.
+    assert np.array_equal(find_outliers1D(spiked, x), [7, 23])
+
+    # x needs not be sorted; indices refer to the input order
+    order = np.random.default_rng(4).permutation(len(x))
+    assert np.array_equal(np.sort(order[find_outliers1D(spiked[order], x[order])]), [7, 23])
+
+    try:
+        find_outliers1D(y, np.zeros_like(x))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("non-unique x did not raise ValueError")
+
+
+def test_is_constant() -> None:
+    assert is_constant([2., 2., 2.]) and is_constant(5.)
+    assert is_constant([1., 1. + 1e-3], atol=1e-3) and not is_constant([1., 1. + 3e-3], atol=1e-3)
+    assert not is_constant([1., np.nan])
+    assert np.array_equal(is_constant([[1., 1.], [1., 2.]], axis=1), [True, False])
+
+    # empty input is not constant (per axis where an axis is given)
+    assert not is_constant([])
+    assert np.array_equal(is_constant(np.empty((0, 3)), axis=0), [False, False, False])
+    assert is_constant(np.empty((0, 3)), axis=1).shape == (0,)
@@ -0,0 +1,32 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from scr.plotting.generic.image import plot_image
+
+
+def test_decimated_pixels_centred_on_source_pixels() -> None:
+    image = np.arange(37 * 23, dtype=float).reshape(37, 23)
+
+    for origin in ("lower", "upper"):
+        fig, ax = plt.subplots()
+        im = plot_image(ax, image, origin=origin, max_display_size=10)
+        decimated = im.get_array()
+        ny, nx = decimated.shape
+
+        left, right, bottom, top = im.get_extent()
+        width, height = (right - left) / nx, (top - bottom) / ny
+
+        for i, j in ((0, 0), (ny - 1, nx - 1), (ny // 2, 1)):
+            # data coordinates of the centre of decimated pixel (i, j) (row i counted from `origin`)
+            x_centre = left + (j + 0.5) * width
+            y_centre = bottom + (i + 0.5) * height if origin == "lower" else top - (i + 0.5) * height
+
+            row, col = int(round(y_centre)), int(round(x_centre))
+            assert np.isclose(x_centre, col) and np.isclose(y_centre, row)
+            assert decimated[i, j] == image[row, col]
+
+        plt.close(fig)
@@ -0,0 +1,24 @@
+import numpy as np
+
+from scr.geometry.raster.mask import nested_contours_to_mask
+from scr.morphology.filling import filling_factor_mask
+
+
+def _square(y0: float, x0: float, size: float) -> np.ndarray:
+    # counter-clockwise (positive signed area) square in (row, col) coordinates
+    return np.array([[y0, x0], [y0, x0 + size], [y0 + size, x0 + size], [y0 + size, x0]], dtype=float)
+
+
+def test_masks_of_contours_outside_frame() -> None:
+    shape = (30, 40)
+
+    # above-left, right of and below the frame (clipped bounding box is empty)
+    for contour in (_square(-20., -20., 8.), _square(5., 60., 8.), _square(50., 5., 8.)):
+        for border_only in (False, True):
+            mask = nested_contours_to_mask(contour, shape, border_only=border_only)
+            assert mask.shape == shape and mask.dtype == bool
+            assert not np.any(mask)
+
+        filling = filling_factor_mask(contour, shape)
+        assert filling.shape == shape
+        assert not np.any(filling)
@@ -1,67 +1,124 @@
 import numpy as np
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
-from scr.utils.types_alias import Tracks, TrackID, FrameID
+from scr.utils.types_alias import Contour, Contours, Tracks, TrackID, FrameID
+from scr.utils.filesystem import is_empty
 
-from scr.geometry.raster.mask import contours_to_mask
-from scr.geometry.raster.containment import containment_ratio
+from scr.geometry.raster.mask import contours_to_roi_mask
+from scr.geometry.raster.containment import roi_intersection
+from scr.geometry.crop.bounds import compute_crop_bounds, bounds_overlap
 
 
 def find_nested_tracks(
         tracks: Tracks,
         image_shapes: list[tuple[int, int]],
         min_containment: float = 0.8,
+        max_workers: int | None = None
 ) -> set[tuple[TrackID, FrameID]]:
     """
     Identify penumbra track frames that are nested inside larger penumbrae
     in the same frame.
 
+    The frames are processed independently in `max_workers` processes (None = executor default);
+    only the contours of each frame are sent to the workers.
+
     Returns:
         Set of (track_id, frame_id) pairs to be removed.
     """
     to_remove: set[tuple[TrackID, FrameID]] = set()
 
-    track_ids = list(tracks.keys())
-
-    # All frames where at least one track is present
-    all_frames = set(
-        frame
-        for history in tracks.values()
-        for frame in history.keys()
-    )
-
-    for frame in all_frames:
-        active_ids = [
-            tid for tid in track_ids
-            if frame in tracks[tid]
-        ]
-
-        if len(active_ids) < 2:
-            continue
-
-        # Build masks per track
-        masks: dict[TrackID, list[np.ndarray]] = {
-            tid: [
-                contours_to_mask(contours, image_shapes[frame])
-                for contours in tracks[tid][frame]
-            ]
-            for tid in active_ids
-        }
-
-        for i, id1 in enumerate(active_ids):
-            for id2 in active_ids[i + 1:]:
-                for mask1 in masks[id1]:
-                    for mask2 in masks[id2]:
-                        area1 = mask1.sum()
-                        area2 = mask2.sum()
-
-                        # Always treat smaller region as candidate for removal
-                        if area1 < area2:
-                            ratio = containment_ratio(mask1, mask2)
-                            if ratio >= min_containment:
-                                to_remove.add((id1, frame))
-                        else:
-                            ratio = containment_ratio(mask2, mask1)
-                            if ratio >= min_containment:
-                                to_remove.add((id2, frame))
+    # Contours of the tracks present in each frame (in track order), gathered in one pass
+    frame_contours: dict[FrameID, dict[TrackID, list]] = defaultdict(dict)
+    for tid, history in tracks.items():
+        for frame, contours in history.items():
+            frame_contours[frame][tid] = contours
+
+    # Frames with a single track have nothing to compare
+    frames, frame_tracks = [], []
+    for frame, active in frame_contours.items():
+        if len(active) >= 2:
+            frames.append(frame)
+            frame_tracks.append(active)
+
+    if not frames:
+        return to_remove
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        nested = executor.map(
+            _nested_in_frame,
+            frames,
+            frame_tracks,
+            [image_shapes[frame] for frame in frames],
+            [min_containment] * len(frames),
+            chunksize=16,
+        )
+        for frame_nested in nested:
+            to_remove |= frame_nested
 
     return to_remove
+
+
+def _nested_in_frame(
+        frame: FrameID,
+        frame_tracks: dict[TrackID, list],
+        shape: tuple[int, int],
+        min_containment: float
+) -> set[tuple[TrackID, FrameID]]:
+    """
+    Nested (track_id, frame) pairs within one frame; `frame_tracks` holds the contours
+    of the tracks active in the frame. Runs in a worker process.
+    """
+    to_remove: set[tuple[TrackID, FrameID]] = set()
+    active_ids = list(frame_tracks)
+
+    # Masks of the frame in one flat list; owners[m] is the position in active_ids
+    # of the track that mask m belongs to
+    owners, frame_contours = [], []
+    for k, tid in enumerate(active_ids):
+        for contours in frame_tracks[tid]:
+            owners.append(k)
+            frame_contours.append(contours)
+    owners = np.array(owners)
+
+    if len(owners) < 2:
+        return to_remove
+
+    # Candidate pairs: masks of two different tracks (each pair once) ...
+    candidates = owners[:, None] < owners[None, :]
+    if min_containment > 0.:
+        # ... whose bounding boxes overlap; other pairs do not intersect (ratio 0)
+        bounds = np.array([_contours_bounds(contours) for contours in frame_contours])
+        candidates &= bounds_overlap(bounds[:, None], bounds[None, :])
+
+    # Rasterised (within the bounding box) only for masks in a candidate pair, once
+    rois: dict[int, tuple] = {}
+    areas: dict[int, int] = {}
+
+    for m1, m2 in np.argwhere(candidates):
+        for m in (m1, m2):
+            if m not in rois:
+                rois[m] = contours_to_roi_mask(frame_contours[m], shape)
+                areas[m] = np.count_nonzero(rois[m][0])
+
+        intersection = roi_intersection(rois[m1], rois[m2])
+        area1, area2 = areas[m1], areas[m2]
+
+        # Always treat smaller region as candidate for removal
+        if area1 < area2:
+            ratio = intersection / area1 if area1 > 0 else 0.0
+            if ratio >= min_containment:
+                to_remove.add((active_ids[owners[m1]], frame))
+        else:
+            ratio = intersection / area2 if area2 > 0 else 0.0
+            if ratio >= min_containment:
+                to_remove.add((active_ids[owners[m2]], frame))
+
+    return to_remove
+
+
+def _contours_bounds(contours: Contour | Contours) -> tuple[float, float, float, float]:
+    """Bounding box of a mask's contours; an empty mask gets a box that overlaps nothing."""
+    if is_empty(contours):
+        return np.inf, -np.inf, np.inf, -np.inf
+    return compute_crop_bounds(contours)
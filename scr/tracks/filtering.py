@@ -2,7 +2,7 @@ import numpy as np
 
 from scr.utils.types_alias import Tracks
 
-from scr.geometry.contours.orientation import is_ccw
+from scr.geometry.contours.area import contours_signed_area
 
 
 def filter_tracks_by_lifetime(
@@ -12,6 +12,9 @@ def filter_tracks_by_lifetime(
 ) -> Tracks:
     if min_lifetime <= 0 and max_lifetime == np.inf:
         return tracks
+    if max_lifetime == np.inf:
+        # lengths are finite; only the lower bound can reject a track
+        return {tid: hist for tid, hist in tracks.items() if len(hist) >= min_lifetime}
     return {tid: hist for tid, hist in tracks.items() if min_lifetime <= len(hist) <= max_lifetime}
 
 
@@ -30,6 +33,12 @@ def remove_clockwise_contours(tracks: Tracks) -> Tracks:
     cleaned_tracks : dict
         Tracks with negative-area contours removed.
     """
+    # Orientation of all contours (in track / frame order) from one vectorised shoelace pass
+    ccw = contours_signed_area([
+        c for frames in tracks.values() for contours in frames.values() for c in contours
+    ]) > 0.
+    position = 0
+
     cleaned = {}
 
     for tid, frames in tracks.items():
@@ -37,7 +46,8 @@ def remove_clockwise_contours(tracks: Tracks) -> Tracks:
 
         for t, contours in frames.items():
             # Keep only contours whose signed area is >= 0
-            kept = [c for c in contours if is_ccw(c)]
+            kept = [c for c, keep in zip(contours, ccw[position:position + len(contours)]) if keep]
+            position += len(contours)
 
             if kept:  # keep frame only if it still has contours
                 new_frames[t] = kept
@@ -5,9 +5,12 @@ from skimage.measure import ransac
 from skimage.transform import EuclideanTransform
 from skimage.registration import phase_cross_correlation
 import warnings
-from typing import Literal
+from functools import lru_cache
+from typing import Callable, Hashable, Literal
 
-from scr.utils.types_alias import Contour, Mask
+from scr.utils.types_alias import Contour, Contours, Mask
+
+from scr.geometry.raster.containment import roi_intersection
 
 
 def compute_iou(
@@ -20,11 +23,34 @@ def compute_iou(
     Optional morphological dilation can help bridge small gaps.
     """
     if dilation_radius:
-        selem = disk(dilation_radius)
+        selem = _disk(dilation_radius)
         mask1 = dilation(mask1, selem)
         mask2 = dilation(mask2, selem)
-    intersection = np.logical_and(mask1, mask2).sum()
-    union = np.logical_or(mask1, mask2).sum()
+    mask1 = np.asarray(mask1, dtype=bool)
+    mask2 = np.asarray(mask2, dtype=bool)
+    # union from the two areas; no second full-size temporary for logical_or
+    intersection = np.count_nonzero(mask1 & mask2)
+    union = np.count_nonzero(mask1) + np.count_nonzero(mask2) - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+def compute_roi_iou(
+        roi1: tuple[Mask, tuple[int, int]],
+        roi2: tuple[Mask, tuple[int, int]],
+        area1: int | None = None,
+        area2: int | None = None
+) -> float:
+    """
+    IoU of two cropped masks (as from `contours_to_roi_mask`), equal to `compute_iou` on the full masks.
+    Precomputed mask areas (pixel counts) can be passed to avoid recounting them.
+    """
+    if area1 is None:
+        area1 = np.count_nonzero(roi1[0])
+    if area2 is None:
+        area2 = np.count_nonzero(roi2[0])
+
+    intersection = roi_intersection(roi1, roi2)
+    union = area1 + area2 - intersection
     return intersection / union if union > 0 else 0.0
 
 
@@ -45,13 +71,38 @@ def warp_contour(
     return transform(contour[:, ::-1])[:, ::-1]
 
 
+def warp_contours(
+        contours: Contours,
+        transform: EuclideanTransform
+) -> Contours:
+    """
+    Apply one Euclidean transformation to several contours with a single transform call.
+
+    Parameters:
+        contours: Input contours as (N, 2) arrays in (y, x) format.
+        transform: Euclidean transformation to apply.
+
+    Returns:
+        Transformed contours, in the same order and of the same shapes.
+    """
+    if not contours:
+        return []
+
+    lengths = [len(contour) for contour in contours]
+    warped = warp_contour(np.concatenate(contours, axis=0), transform)
+    return np.split(warped, np.cumsum(lengths)[:-1])
+
+
 def register_images_pairwise(
         img_target: np.ndarray,
         img_source: np.ndarray,
         residual_threshold_max: float = 3.5,
         qs_threshold: float = 0.7,
         qs_mask_direction: Literal["above", "below"] = "below",
-        match_spatial_tolerance: float = 50.0
+        match_spatial_tolerance: float = 50.0,
+        feature_cache: dict | None = None,
+        target_key: Hashable | None = None,
+        source_key: Hashable | None = None
 ) -> EuclideanTransform:
     """
     Estimate Euclidean transform that maps `img_source` onto `img_target`
@@ -64,19 +115,35 @@ def register_images_pairwise(
         qs_threshold: Intensity threshold to mask granulation or magnetism.
         qs_mask_direction: "below" to keep quiet-Sun, "above" to keep active areas.
         match_spatial_tolerance: Max pixel distance allowed between matched keypoints.
+        feature_cache: Optional dict to reuse per-image results (ORB keypoints / descriptors and
+            phase-correlation masks) across calls, keyed by image key, dtype and settings; filled in place.
+        target_key: Key of `img_target` in `feature_cache` (e.g. its frame index); None → not cached.
+        source_key: Key of `img_source` in `feature_cache`; None → not cached.
 
     Returns:
         A EuclideanTransform object mapping img_source to img_target.
     """
 
+    def cached(image: np.ndarray, key: Hashable | None, settings: tuple, compute: Callable):
+        # per-image result, computed once per (image key, dtype, settings) if a cache is given
+        if feature_cache is None or key is None:
+            return compute(image)
+
+        cache_key = (key, image.dtype.str, *settings)
+        if cache_key not in feature_cache:
+            feature_cache[cache_key] = compute(image)
+        return feature_cache[cache_key]
+
     def try_feature_registration() -> EuclideanTransform | None:
         orb = ORB(n_keypoints=2000, fast_threshold=0.08)
 
+        def orb_features(image: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            orb.detect_and_extract(image)
+            return orb.keypoints, orb.descriptors
+
         try:
-            orb.detect_and_extract(img_target)
-            keypoints_target, descriptors_target = orb.keypoints, orb.descriptors
-            orb.detect_and_extract(img_source)
-            keypoints_source, descriptors_source = orb.keypoints, orb.descriptors
+            keypoints_target, descriptors_target = cached(img_target, target_key, ("orb",), orb_features)
+            keypoints_source, descriptors_source = cached(img_source, source_key, ("orb",), orb_features)
         except Exception as error:
             raise RuntimeError(f"ORB extraction failed: {error}")
 
@@ -113,12 +180,14 @@ def register_images_pairwise(
         raise ValueError("RANSAC failed to find a valid model.")
 
     def try_phase_correlation() -> EuclideanTransform:
-        if qs_mask_direction == "below":
-            mask_target = np.abs(img_target) < qs_threshold
-            mask_source = np.abs(img_source) < qs_threshold
-        else:
-            mask_target = np.abs(img_target) > qs_threshold
-            mask_source = np.abs(img_source) > qs_threshold
+        def qs_mask(image: np.ndarray) -> np.ndarray:
+            if qs_mask_direction == "below":
+                return np.abs(image) < qs_threshold
+            return np.abs(image) > qs_threshold
+
+        settings = ("qs_mask", qs_threshold, qs_mask_direction)
+        mask_target = cached(img_target, target_key, settings, qs_mask)
+        mask_source = cached(img_source, source_key, settings, qs_mask)
 
         shift, error, _ = phase_cross_correlation(
             reference_image=img_target,
@@ -143,3 +212,9 @@ def register_images_pairwise(
         except Exception as e:
             warnings.warn(f"Phase correlation also failed ({e}); using identity transform.", RuntimeWarning)
             return EuclideanTransform()  # Identity
+
+
+@lru_cache(maxsize=16)
+def _disk(radius: int) -> np.ndarray:
+    """Disk structuring element, built once per radius (shared; not to be modified)."""
+    return disk(radius)
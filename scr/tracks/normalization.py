@@ -1,4 +1,4 @@
-from copy import deepcopy
+from collections import defaultdict
 
 from scr.utils.types_alias import Tracks, TrackID, FrameID
 
@@ -31,17 +31,24 @@ def remove_track_frames(
 ) -> Tracks:
     """
     Remove specific (track_id, frame_id) entries from tracks.
-    Empty tracks are removed.
+    Empty tracks are removed. The input is not modified; untouched tracks are shared with it.
     """
-    cleaned = deepcopy(tracks)
-
+    # Frames to drop per track; only these tracks get a new frame dict,
+    # all other tracks (and all contours) are shared with the input
+    frames_to_drop: dict[TrackID, set[FrameID]] = defaultdict(set)
     for track_id, frame in to_remove:
-        if track_id not in cleaned:
+        frames_to_drop[track_id].add(frame)
+
+    cleaned = {}
+    for track_id, history in tracks.items():
+        drop = frames_to_drop.get(track_id)
+        if drop is None:
+            cleaned[track_id] = history
             continue
-        if frame in cleaned[track_id]:
-            del cleaned[track_id][frame]
-        if not cleaned[track_id]:
-            del cleaned[track_id]
+
+        history = {frame: contours for frame, contours in history.items() if frame not in drop}
+        if history:
+            cleaned[track_id] = history
 
     return cleaned
 
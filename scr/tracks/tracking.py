@@ -4,14 +4,15 @@ from tqdm import tqdm
 
 from scr.utils.types_alias import Tracks
 
-from scr.geometry.raster.mask import contours_to_mask
-from scr.geometry.contours.area import contour_area
+from scr.geometry.raster.mask import contours_to_roi_mask
+from scr.geometry.crop.bounds import compute_crop_bounds, bounds_overlap
+from scr.geometry.contours.area import contours_area
 from scr.geometry.contours.filtering import filter_contours_by_area
 from scr.geometry.contours.extraction import find_contours
 
 from scr.tracks.filtering import filter_tracks_by_lifetime
 from scr.tracks.normalization import relabel_tracks_by_lifetime
-from scr.tracks.matching import compute_iou, warp_contour, register_images_pairwise
+from scr.tracks.matching import compute_roi_iou, warp_contours, register_images_pairwise
 
 
 def track_contours(
@@ -22,7 +23,8 @@ def track_contours(
         iou_threshold: float = 0.3,
         min_frames: int = 3,
         registration: bool = True,
-        area_ratio_bounds: tuple[float, float] = (0.5, 2.0)
+        area_ratio_bounds: tuple[float, float] = (0.5, 2.0),
+        progress: bool = True
 ) -> Tracks:
     """
     Track contours across frames using IoU and image registration.
@@ -36,6 +38,7 @@ def track_contours(
         min_frames: Minimum lifetime to keep a track.
         registration: If True, register previous image to current.
         area_ratio_bounds: (min_ratio, max_ratio) to reject mismatched areas early.
+        progress: If True, show a progress bar over the frames.
 
     Returns:
         Dictionary of tracks: {track_id: {frame_index: [contours]}}
@@ -44,15 +47,31 @@ def track_contours(
     tracks = {}
     next_id = 0
     registration_cache = {}  # Cache image pair registrations to avoid recomputation
+    feature_cache = {}  # ORB features per frame, shared by all registrations of that frame
+    prev_cache = {}  # (track_id, t_prev) -> areas and area order of the track's contours in t_prev
     rmin, rmax = area_ratio_bounds
 
-    for t, image in enumerate(tqdm(images, desc="Tracking")):
+    for t, image in enumerate(tqdm(images, desc="Tracking", mininterval=0.5, disable=not progress)):
+        # frames more than max_gap back are not registered again
+        for key in [key for key in feature_cache if key[0] < t - max_gap]:
+            del feature_cache[key]
+        for key in [key for key in prev_cache if key[1] < t - max_gap]:
+            del prev_cache[key]
+
         # Step 1: Extract and filter contours
         contours = filter_contours_by_area(find_contours(image, level), threshold_min=min_area)
 
         # Step 2: Sort by area to improve matching consistency
-        contours = sorted(contours, key=contour_area, reverse=True)
+        # (areas computed once per frame, reused by the area ratio check)
+        areas = contours_area(contours)
+        order = np.argsort(-areas, kind="stable")
+        contours, areas = [contours[i] for i in order], areas[order]
         assigned = [False] * len(contours)
+        n_assigned = 0  # any(assigned), without rescanning the list
+        # rasterised lazily (once per contour and frame) within the contour's bounding box
+        bounds = np.reshape([compute_crop_bounds(c) for c in contours], (-1, 4))
+        rois = [None] * len(contours)
+        roi_areas = [0] * len(contours)
 
         # Step 3: Attempt to match with previous contours
         for tid, hist in tracks.items():
@@ -67,35 +86,55 @@ def track_contours(
                     # Register image[t_prev] to image[t] once
                     registration_cache[pair_key] = register_images_pairwise(
                         img_source=images[t_prev].astype(np.float32),
-                        img_target=image
+                        img_target=image,
+                        feature_cache=feature_cache,
+                        target_key=t,
+                        source_key=t_prev
                     ) if registration else EuclideanTransform()
                 transform = registration_cache[pair_key]
 
-                # Sort previous contours by area
-                prev_contours = sorted(hist[t_prev], key=contour_area, reverse=True)
-
-                for prev_c in prev_contours:
-                    warped_prev_c = warp_contour(prev_c, transform)
-                    prev_mask = contours_to_mask(warped_prev_c, image.shape)
-
-                    prev_area = contour_area(prev_c)  # Part of the early area ratio check
+                # Sort previous contours by area (once per track and frame; the frame is complete)
+                if (tid, t_prev) not in prev_cache:
+                    prev_areas = contours_area(hist[t_prev])
+                    prev_cache[(tid, t_prev)] = prev_areas, np.argsort(-prev_areas, kind="stable")
+                prev_areas, prev_order = prev_cache[(tid, t_prev)]
+                # all previous contours of the track warped with one transform call
+                warped_prev = warp_contours(hist[t_prev], transform)
+
+                for j in prev_order:
+                    warped_prev_c = warped_prev[j]
+                    # contours with disjoint bounding boxes cannot overlap (IoU 0)
+                    overlapping = bounds_overlap(compute_crop_bounds(warped_prev_c), bounds)
+                    prev_roi, prev_roi_area = None, 0
+
+                    prev_area = prev_areas[j]  # Part of the early area ratio check
                     for i, c in enumerate(contours):
                         if assigned[i]:
                             continue
 
                         # Early area ratio check
-                        area_ratio = contour_area(c) / prev_area
+                        area_ratio = areas[i] / prev_area
                         if not (rmin <= area_ratio <= rmax):
                             continue
 
-                        mask = contours_to_mask(c, image.shape)
-                        if compute_iou(prev_mask, mask) >= iou_threshold:
+                        if overlapping[i]:
+                            if prev_roi is None:
+                                prev_roi = contours_to_roi_mask(warped_prev_c, image.shape)
+                                prev_roi_area = np.count_nonzero(prev_roi[0])
+                            if rois[i] is None:
+                                rois[i] = contours_to_roi_mask(c, image.shape)
+                                roi_areas[i] = np.count_nonzero(rois[i][0])
+                            iou = compute_roi_iou(prev_roi, rois[i], area1=prev_roi_area, area2=roi_areas[i])
+                        else:
+                            iou = 0.0
+                        if iou >= iou_threshold:
                             hist.setdefault(t, []).append(c)
                             assigned[i] = True
+                            n_assigned += 1
                             break  # contour c assigned
-                    if any(assigned):
+                    if n_assigned:
                         break
-                if any(assigned):
+                if n_assigned:
                     break
 
         # Step 4: Create new tracks for unmatched contours
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from functools import lru_cache
 
 
 class NestedDefault:
@@ -10,8 +11,14 @@ class NestedDefault:
     def __call__(self) -> defaultdict:
         if self.depth <= 1:
             return defaultdict(self.leaf_factory)
-        # Create next level with depth-1
-        return defaultdict(NestedDefault(self.depth - 1, self.leaf_factory))
+        # Next level with depth-1; its factory is shared, not re-created per missing key
+        return defaultdict(_nested_default(self.depth - 1, self.leaf_factory))
+
+
+@lru_cache(maxsize=None)
+def _nested_default(depth: int, leaf_factory: type) -> NestedDefault:
+    """One shared (immutable) NestedDefault per (depth, leaf_factory)."""
+    return NestedDefault(depth, leaf_factory)
 
 
 def nested_defaultdict(
@@ -22,4 +29,4 @@ def nested_defaultdict(
     Create a nested defaultdict of specified depth.
     Pickleable, no lambdas or nested functions.
     """
-    return NestedDefault(depth, factory)()
+    return _nested_default(depth, factory)()
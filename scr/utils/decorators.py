@@ -1,4 +1,3 @@
-import numpy as np
 from functools import wraps
 import time
 import traceback
@@ -16,14 +15,14 @@ def timing(func=None, num_repeats: int = 1):
         n = 3.
 
         if t * n < 1.:  # less than 1/n seconds -> show milliseconds
-            return f"{np.round(t * 1000., prec):.{prec:d}f} milliseconds"
+            return f"{t * 1000.:.{prec:d}f} milliseconds"
         if t / 60. < n:  # less than n minutes -> show seconds
-            return f"{np.round(t, prec):.{prec:d}f} seconds"
+            return f"{t:.{prec:d}f} seconds"
         if t / 60. < n * 60.:  # between n minutes and n hours -> show minutes
-            return f"{np.round(t / 60., prec):.{prec:d}f} minutes"
+            return f"{t / 60.:.{prec:d}f} minutes"
         if t / 3600. < n * 24.:  # between n hours and n days -> show hours
-            return f"{np.round(t / 3600., prec):.{prec:d}f} hours"
-        return f"{np.round(t / 86400., prec):.{prec:d}f} days"  # show days
+            return f"{t / 3600.:.{prec:d}f} hours"
+        return f"{t / 86400.:.{prec:d}f} days"  # show days
 
     if not (callable(func) or func is None):
         raise ValueError('The usage of timing decorator is "@timing", "@timing()", "@timing(num_repeats=integer)", '
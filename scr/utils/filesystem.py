@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Sized
+from typing import Iterable, Sized
 
 
 def check_dir(
@@ -40,3 +40,21 @@ def is_empty(
         return len(data) == 0
 
     return False
+
+
+def files_signature(
+        filenames: Iterable[str]
+) -> tuple[tuple[str, float], ...]:
+    """
+    (absolute path, modification time) of each file, e.g. to key caches built from these files.
+    """
+    return tuple((Path(filename).resolve().as_posix(), Path(filename).stat().st_mtime) for filename in filenames)
+
+
+def files_unchanged(
+        signature: tuple[tuple[str, float], ...]
+) -> bool:
+    """
+    Whether all files of a `files_signature` still exist with the same modification times.
+    """
+    return all(Path(filename).is_file() and Path(filename).stat().st_mtime == mtime for filename, mtime in signature)
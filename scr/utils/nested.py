@@ -1,4 +1,5 @@
 import numpy as np
+import math
 import numbers
 from collections import defaultdict
 from typing import Sequence, Mapping
@@ -30,7 +31,40 @@ def nested_cast_arrays_dtype(
     - defaultdict default_factory is preserved
     - Only NumPy arrays are cast
     - Non-array objects are returned unchanged
+    - If all arrays already have `dtype`, `obj` itself is returned (no containers are rebuilt)
     """
+    if _all_arrays_have_dtype(obj, dtype):
+        return obj
+
+    return _cast_arrays_dtype(obj, dtype)
+
+
+def _all_arrays_have_dtype(
+        obj,
+        dtype: np.dtype
+) -> bool:
+    """Whether every NumPy array in a nested structure already has `dtype` (iterative walk, early exit)."""
+    stack = [obj]
+
+    while stack:
+        item = stack.pop()
+
+        if isinstance(item, np.ndarray):
+            if item.dtype != dtype:
+                return False
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+
+    return True
+
+
+def _cast_arrays_dtype(
+        obj,
+        dtype: np.dtype
+):
+    """Recursive part of `nested_cast_arrays_dtype`."""
 
     # --------------------------------------------------
     # NumPy arrays
@@ -46,7 +80,7 @@ def nested_cast_arrays_dtype(
     if isinstance(obj, defaultdict):
         out = defaultdict(obj.default_factory)
         for k, v in obj.items():
-            out[k] = nested_cast_arrays_dtype(v, dtype)
+            out[k] = _cast_arrays_dtype(v, dtype)
         return out
 
     # --------------------------------------------------
@@ -54,7 +88,7 @@ def nested_cast_arrays_dtype(
     # --------------------------------------------------
     if isinstance(obj, dict):
         return {
-            k: nested_cast_arrays_dtype(v, dtype)
+            k: _cast_arrays_dtype(v, dtype)
             for k, v in obj.items()
         }
 
@@ -62,10 +96,10 @@ def nested_cast_arrays_dtype(
     # list / tuple
     # --------------------------------------------------
     if isinstance(obj, list):
-        return [nested_cast_arrays_dtype(v, dtype) for v in obj]
+        return [_cast_arrays_dtype(v, dtype) for v in obj]
 
     if isinstance(obj, tuple):
-        return tuple(nested_cast_arrays_dtype(v, dtype) for v in obj)
+        return tuple([_cast_arrays_dtype(v, dtype) for v in obj])
 
     # --------------------------------------------------
     # everything else (scalars, None, etc.)
@@ -129,7 +163,8 @@ def nested_equal(
         # Float scalars
         # --------------------------------------------------
         if isinstance(x, (float, np.floating)) and isinstance(y, (float, np.floating)):
-            if np.isnan(x) and np.isnan(y):
+            # math.isnan also takes NumPy floats, without the ufunc dispatch of np.isnan
+            if math.isnan(x) and math.isnan(y):
                 return True
 
             diff = abs(x - y)
@@ -145,10 +180,12 @@ def nested_equal(
             _add_report(path, x, y, None)
             return False
 
+        kind = _comparison_kind(x)
+
         # --------------------------------------------------
         # Dictionaries
         # --------------------------------------------------
-        if isinstance(x, Mapping):
+        if kind == "mapping":
             equal = True
             keys = set(x) | set(y)
             for k in keys:
@@ -167,27 +204,31 @@ def nested_equal(
         # --------------------------------------------------
         # NumPy arrays
         # --------------------------------------------------
-        if isinstance(x, np.ndarray):
+        if kind == "array":
             if x.shape != y.shape:
                 _add_report(path, x.shape, y.shape, None)
                 return False
 
+            # Identical or exactly equal (NaN-free) arrays need no tolerance check
+            # and have nothing to report
+            if x is y or np.array_equal(x, y):
+                return True
+
             mask = ~np.isclose(x, y, atol=atol, rtol=0.0, equal_nan=True)
             if np.any(mask):
-                equal = True
-                for idx in map(tuple, np.argwhere(mask)):
+                # only the differences that can still be reported are looked up
+                # (the first one on early exit, at most max_reports otherwise)
+                limit = 1 if early_exit else max_reports
+                for idx in map(tuple, np.argwhere(mask)[:limit]):
                     diff = abs(x[idx] - y[idx])
                     _add_report(path + idx, x[idx], y[idx], diff)
-                    if early_exit:
-                        return False
-                    equal = False
-                return equal
+                return False
             return True
 
         # --------------------------------------------------
         # Sequences (lists / tuples)
         # --------------------------------------------------
-        if isinstance(x, Sequence) and not isinstance(x, (str, bytes)):
+        if kind == "sequence":
             if len(x) != len(y):
                 _add_report(path, len(x), len(y), None)
                 return False
@@ -228,6 +269,39 @@ def nested_equal(
     return equal
 
 
+# Comparison branch of nested_equal for the common concrete types (one dict lookup
+# instead of the isinstance chain); other types go through _comparison_kind's checks
+_COMPARISON_KINDS = {
+    dict: "mapping",
+    defaultdict: "mapping",
+    np.ndarray: "array",
+    list: "sequence",
+    tuple: "sequence",
+    str: "other",
+    bytes: "other",
+    int: "other",
+    bool: "other",
+    type(None): "other",
+}
+
+
+def _comparison_kind(
+        obj
+) -> str:
+    """Branch of `nested_equal` that compares `obj`: "mapping", "array", "sequence" or "other"."""
+    kind = _COMPARISON_KINDS.get(type(obj))
+    if kind is not None:
+        return kind
+
+    if isinstance(obj, Mapping):
+        return "mapping"
+    if isinstance(obj, np.ndarray):
+        return "array"
+    if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
+        return "sequence"
+    return "other"
+
+
 def nested_cast(
         a,
         b
@@ -254,7 +328,11 @@ def nested_cast(
             if x.shape != y.shape:
                 raise ValueError(f"{path}: shape mismatch {x.shape} vs {y.shape}")
 
-            if np.issubdtype(x.dtype, np.integer) and np.issubdtype(y.dtype, np.floating):
+            if x.dtype == y.dtype:
+                return y
+
+            # dtype kinds: "iu" = np.integer, "f" = np.floating
+            if x.dtype.kind in "iu" and y.dtype.kind == "f":
                 raise TypeError(f"{path}: refusing float → int array cast")
 
             return y.astype(x.dtype, copy=False)
@@ -266,7 +344,7 @@ def nested_cast(
             if not isinstance(y, Mapping):
                 raise TypeError(f"{path}: expected mapping, got {type(y).__name__}")
 
-            if set(x) != set(y):
+            if not _same_keys(x, y):
                 diff = set(x) ^ set(y)
                 raise ValueError(f"{path}: key mismatch {diff}")
 
@@ -282,7 +360,7 @@ def nested_cast(
             if not isinstance(y, Mapping):
                 raise TypeError(f"{path}: expected mapping, got {type(y).__name__}")
 
-            if set(x) != set(y):
+            if not _same_keys(x, y):
                 diff = set(x) ^ set(y)
                 raise ValueError(f"{path}: key mismatch {diff}")
 
@@ -301,10 +379,11 @@ def nested_cast(
             if len(x) != len(y):
                 raise ValueError(f"{path}: length mismatch {len(x)} vs {len(y)}")
 
-            return type(x)(
+            items = [
                 _cast(xx, yy, f"{path}[{i}]")
                 for i, (xx, yy) in enumerate(zip(x, y))
-            )
+            ]
+            return items if type(x) is list else type(x)(items)
 
         # --------------------------------------------------
         # None
@@ -335,3 +414,11 @@ def nested_cast(
         return y
 
     return _cast(a, b, "<root>")
+
+
+def _same_keys(
+        x: Mapping,
+        y: Mapping
+) -> bool:
+    """Whether two mappings have the same keys (no key sets are built)."""
+    return len(x) == len(y) and all(k in y for k in x)
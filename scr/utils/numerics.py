@@ -3,7 +3,8 @@ from scipy.stats import norm
 from scipy.ndimage import gaussian_filter1d
 from scipy.integrate import trapezoid
 import warnings
-from typing import Literal
+from functools import lru_cache
+from typing import Iterable, Literal
 
 from scr.utils.decorators import reduce_like
 
@@ -16,18 +17,26 @@ def is_constant(
         axis: int | None = None,
         atol: float = NUM_EPS
 ) -> bool:
+    """
+    Whether `array` is constant (or equal to `constant`) along `axis`.
+
+    Without `constant`, the values must lie within +-atol of their mid-range,
+    i.e. max - min <= 2 * atol (not std < atol). Empty input is not constant.
+    """
     if atol < 0.:
         raise ValueError('"atol" must be a non-negative number')
 
-    array = np.array(array, dtype=float)
+    array = np.asarray(array, dtype=float)  # no copy for float arrays
 
     if np.ndim(array) == 0:
         array = array[np.newaxis]
 
-    if constant is None:  # return True if the array is constant along the axis
-        ddof = return_ddof(array, axis=axis)
+    if constant is None and array.size == 0:  # np.ptp cannot reduce an empty axis
+        return np.zeros(np.shape(np.sum(array, axis=axis)), dtype=bool)[()]
 
-        return np.std(array, axis=axis, ddof=ddof) < atol
+    if constant is None:  # return True if the array is constant along the axis
+        # all values within +-atol of the mid-range; one min / max pass instead of the two-pass std
+        return np.ptp(array, axis=axis) <= 2. * atol
 
     else:  # return True if the array is equal to "constant" along the axis
         return np.all(np.abs(array - constant) < atol, axis=axis)
@@ -45,15 +54,60 @@ def return_mean_std(
         axis: int | None = None,
         ddof: int | None = None
 ) -> tuple[np.floating, np.floating]:
-    mean_value = np.nanmean(array, axis=axis)
+    array = np.asarray(array)
     if ddof is None:
         ddof = return_ddof(array, axis=axis)
 
-    std_value = np.nanstd(array, axis=axis, ddof=ddof)
+    # NaN-ignoring mean and std sharing one mean pass (np.nanstd would compute the mean again)
+    valid = ~np.isnan(array)
+    count = np.count_nonzero(valid, axis=axis)
+    mean_value = _divide_by_count(np.nansum(array, axis=axis), count)
+
+    deviation = np.where(valid, array - (mean_value if axis is None else np.expand_dims(mean_value, axis)), 0.)
+    dof = count - ddof
+    variance = _divide_by_count(np.sum(deviation * deviation, axis=axis), np.maximum(dof, 1))
+    # no degrees of freedom left (count <= ddof) -> NaN, as in np.nanstd
+    std_value = np.where(dof > 0, np.sqrt(variance), np.nan)[()]
 
     return mean_value, std_value
 
 
+def _divide_by_count(
+        total: np.ndarray | np.floating,
+        count: np.ndarray | int
+) -> np.ndarray | np.floating:
+    """total / count kept in the float dtype of `total` (as in np.nanmean / np.nanvar); 0 / 0 -> NaN."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.asarray(total / count)
+    if np.asarray(total).dtype.kind in "fc":
+        result = result.astype(np.asarray(total).dtype, copy=False)
+    return result[()]
+
+
+def nan_minmax(
+        arrays: Iterable[np.ndarray]
+) -> tuple[float, float]:
+    """
+    Global NaN-ignoring (min, max) over several arrays.
+
+    The extrema are accumulated array by array, so no stacked copy or
+    intermediate list of per-array extrema is built.
+    """
+    vmin, vmax = np.inf, -np.inf
+
+    for array in arrays:
+        if np.size(array) == 0:
+            continue
+        # fmin/fmax propagate non-NaN values, i.e. they ignore NaNs
+        vmin = np.fmin(vmin, np.fmin.reduce(array, axis=None))
+        vmax = np.fmax(vmax, np.fmax.reduce(array, axis=None))
+
+    if vmin > vmax:  # no finite values at all
+        return np.nan, np.nan
+
+    return float(vmin), float(vmax)
+
+
 def denoise_array(
         array: np.ndarray,
         sigma: float,
@@ -64,38 +118,82 @@ def denoise_array(
     if x is None:
         x = np.arange(0., np.shape(array)[-1])  # 0. to convert it to float
 
-    equidistant_measure = np.var(np.diff(x))
+    if np.size(x) < 2:  # a single sample is its own smoothed value (no grid steps, no trapezoid)
+        return np.array(array, dtype=np.result_type(array, float))
+
+    # all steps exactly equal; one min / max pass over the steps instead of the two-pass variance
+    steps = np.diff(x)
+    equidistant = np.size(steps) > 0 and np.ptp(steps) == 0.
 
-    if equidistant_measure == 0.:  # equidistant step -> gaussian_filter1d is faster
+    if equidistant:  # equidistant step -> gaussian_filter1d is faster
         step = x[1] - x[0]
-        correction = gaussian_filter1d(np.ones(len(x)), sigma=float(sigma / step), mode="constant")
+        correction = _edge_correction(len(x), float(sigma / step))
         array_denoised = gaussian_filter1d(array, sigma=float(sigma / step), mode="constant")
 
         array_denoised = normalise_in_columns(array_denoised, norm_vector=correction)
 
     else:  # transmission application
-        # Gaussian filters in columns
-        gaussian = norm.pdf(np.reshape(x, (len(x), 1)), loc=x, scale=sigma)
-
-        # need num_filters x num_wavelengths
-        if np.ndim(gaussian) == 1:
-            gaussian = np.reshape(gaussian, (1, -1))
-        if np.ndim(gaussian) > 2:
-            raise ValueError("Filter must be 1-D or 2-D array.")
+        x = np.asarray(x)
+        gaussian = _gaussian_filters(x.tobytes(), x.dtype.str, np.shape(x), float(sigma), sum_or_int)
 
         if sum_or_int == "sum":
-            gaussian = normalise_in_columns(gaussian)
             array_denoised = array @ gaussian
         else:
-            gaussian = normalise_in_columns(gaussian, trapezoid(y=gaussian, x=x))
-            array_denoised = trapezoid(y=np.einsum("...j, kj -> ...kj", array, gaussian), x=x)
+            # trapezoid over j of array[..., j] * gaussian[k, j] as one product with the trapezoidal
+            # weights folded into the array (no (..., k, j) intermediate)
+            weights = np.empty(len(x))
+            weights[1:-1] = 0.5 * (x[2:] - x[:-2])
+            weights[0], weights[-1] = 0.5 * (x[1] - x[0]), 0.5 * (x[-1] - x[-2])
+            array_denoised = (array * weights) @ gaussian.T
 
     if remove_mean:  # here I assume that the noise has a zero mean
-        mn = np.mean(array_denoised - array, axis=-1, keepdims=True)
+        # array_denoised is a new array in both branches -> subtract in place
+        array_denoised -= np.mean(array_denoised - array, axis=-1, keepdims=True)
+
+    return array_denoised
+
+
+@lru_cache(maxsize=32)
+def _edge_correction(
+        n: int,
+        sigma: float
+) -> np.ndarray:
+    """Response of the constant-mode Gaussian filter to ones (shared; read-only)."""
+    correction = gaussian_filter1d(np.ones(n), sigma=sigma, mode="constant")
+    correction.flags.writeable = False
+    return correction
+
+
+@lru_cache(maxsize=8)
+def _gaussian_filters(
+        x_bytes: bytes,
+        x_dtype: str,
+        x_shape: tuple[int, ...],
+        sigma: float,
+        sum_or_int: Literal["sum", "int"]
+) -> np.ndarray:
+    """
+    Normalised Gaussian filters in columns for the grid x (passed as bytes to be hashable).
+    Built once per grid and settings; the returned matrix is shared and read-only.
+    """
+    x = np.frombuffer(x_bytes, dtype=x_dtype).reshape(x_shape)
+
+    # Gaussian filters in columns
+    gaussian = norm.pdf(np.reshape(x, (len(x), 1)), loc=x, scale=sigma)
+
+    # need num_filters x num_wavelengths
+    if np.ndim(gaussian) == 1:
+        gaussian = np.reshape(gaussian, (1, -1))
+    if np.ndim(gaussian) > 2:
+        raise ValueError("Filter must be 1-D or 2-D array.")
+
+    if sum_or_int == "sum":
+        gaussian = normalise_in_columns(gaussian)
     else:
-        mn = 0.
+        gaussian = normalise_in_columns(gaussian, trapezoid(y=gaussian, x=x))
 
-    return array_denoised - mn
+    gaussian.flags.writeable = False
+    return gaussian
 
 
 def find_outliers1D(
@@ -112,36 +210,44 @@ def find_outliers1D(
         raise ValueError('"x" input must be unique.')
 
     inds = np.argsort(x)
-    x_iterate, y_iterate = x[inds], y[inds]
+    x_sorted, y_sorted = x[inds], y[inds]
 
     z_thresh = np.clip(z_thresh, a_min=num_eps, a_max=None)
 
+    # points still in the fit (in sorted order); outliers are switched off instead of deleted
+    keep = np.ones(len(x), dtype=bool)
+
     num_iter = 0
     while True:
         num_iter += 1
+        kept = np.flatnonzero(keep)
+        x_iterate, y_iterate = x_sorted[kept], y_sorted[kept]
+
         deriv = np.diff(y_iterate) / np.diff(x_iterate)
         mu, sigma = return_mean_std(deriv)
-        z_score = (deriv - mu) / sigma if sigma > 0. else np.array([0.])
+        if not sigma > 0.:  # constant (or no) derivative -> no outliers
+            break
+        z_score = (deriv - mu) / sigma
 
-        positive = np.where(np.logical_or(z_score > z_thresh, ~np.isfinite(z_score)))[0]
-        negative = np.where(np.logical_or(-z_score > z_thresh, ~np.isfinite(z_score)))[0]
+        not_finite = ~np.isfinite(z_score)
+        positive = (z_score > z_thresh) | not_finite
+        negative = (-z_score > z_thresh) | not_finite
 
         # noise -> the points are next to each other (overlap if compensated for "diff" shift)
-        outliers = stack((np.intersect1d(positive, negative + 1), np.intersect1d(negative, positive + 1)))
-
-        if 0 in positive or 0 in negative:  # first index is outlier
-            outliers = stack(([0], outliers))
+        outliers = np.zeros(len(kept), dtype=bool)
+        outliers[1:-1] = (positive[1:] & negative[:-1]) | (negative[1:] & positive[:-1])
 
-        # last index is outlier
-        if (len(z_score) - 1) in positive or (len(z_score) - 1) in negative:  # -1 to count "len" from 0
-            outliers = stack((outliers, [len(x_iterate) - 1]))
+        if len(z_score) > 0:
+            outliers[0] |= positive[0] | negative[0]  # first index is outlier
+            outliers[-1] |= positive[-1] | negative[-1]  # last index is outlier
 
-        if np.size(outliers) == 0 or num_iter > max_iter:
+        if not np.any(outliers) or num_iter > max_iter:
             break
 
-        x_iterate, y_iterate = np.delete(x_iterate, outliers), np.delete(y_iterate, outliers)
+        keep[kept[outliers]] = False
 
-    return np.where(~np.isin(x, x_iterate))[0]
+    # indices into the original (unsorted) x
+    return np.sort(inds[~keep])
 
 
 def normalise_array(
@@ -151,14 +257,15 @@ def normalise_array(
         norm_constant: float = 1.,
         num_eps: float = NUM_EPS
 ) -> np.ndarray:
-    if norm_vector is None:
+    if norm_vector is None:  # keepdims -> already broadcastable against the array
         norm_vector = np.nansum(array, axis=axis, keepdims=True)
 
     # to force correct dimensions (e.g. when passing the output of interp1d)
-    if np.ndim(norm_vector) != np.ndim(array) and np.ndim(norm_vector) > 0:
+    elif np.ndim(norm_vector) != np.ndim(array) and np.ndim(norm_vector) > 0:
         norm_vector = np.expand_dims(norm_vector, axis=axis)
 
-    if np.any(np.abs(norm_vector) < num_eps):
+    # smallest magnitude instead of a full boolean mask (fmin skips NaNs, as the comparison did)
+    if np.size(norm_vector) > 0 and np.fmin.reduce(np.abs(norm_vector), axis=None) < num_eps:
         warnings.warn("You normalise with (almost) zero values. Check the normalisation vector.")
 
     return array / norm_vector * norm_constant
@@ -206,7 +313,9 @@ def stack(
             arrays: tuple | list,
             axis: int | None = None
     ) -> np.ndarray:
-        ndim = np.array([np.ndim(array) for array in arrays])
+        # shapes read once (the inputs are arrays here); ndim follows from them
+        shapes = [np.shape(array) for array in arrays]
+        ndim = np.array([len(shape) for shape in shapes])
         _check_dims(ndim, reduce)
 
         if np.all(ndim == 1):  # vector + vector + ...
@@ -219,16 +328,16 @@ def stack(
             max_dim = np.max(ndim)
 
             # longest array
-            shape = np.array(np.shape(arrays[np.argmax(ndim)]))
+            shape = np.array(shapes[np.argmax(ndim)])
             shape[axis] = -1
 
             # reshape is dangerous; you can potentially stack e.g. 10x1 with 2x5x2 along axis=0 that is confusing
             # possible dimension difference is one; omit the -1 shape. The rest should be equal.
-            shapes = [np.array(np.shape(array)) for array in arrays if np.ndim(array) < max_dim]
-            if not np.all([sh in shape[shape > 0] for sh in shapes]):
+            lower = ndim < max_dim
+            if not np.all([np.array(sh) in shape[shape > 0] for sh, low in zip(shapes, lower) if low]):
                 raise ValueError("Arrays of these dimensions cannot be stacked.")
 
-            arrays = [np.reshape(array, shape) if np.ndim(array) < max_dim else array for array in arrays]
+            arrays = [np.reshape(array, shape) if low else array for array, low in zip(arrays, lower)]
 
             return np.concatenate(arrays, axis=axis)
 
@@ -1,6 +1,40 @@
+import re
 from datetime import datetime
 
 
+# Possible date formats, in the order they are tried
+_DATE_FORMATS = (
+    "%Y.%m.%d_%H:%M:%S.%f",  # e.g., 2025.05.06_12:30:45.123456
+    "%Y.%m.%d_%H:%M:%S",  # e.g., 2025.05.06_12:30:45
+    "%Y%m%d_%H%M%S",  # e.g., 20250506_123045
+    "%Y-%m-%dT%H:%M:%S.%f",  # e.g., 2025-02-13T12:30:45.123456
+    "%Y-%m-%dT%H:%M:%S",  # e.g., 2025-02-13T12:30:45
+    "%Y-%m-%dT%H:%M",  # e.g., 2025-02-13T12:30
+    "%Y-%m-%dT%H",  # e.g., 2025-02-13T12
+    "%Y-%m-%d",  # e.g., 2025-02-13
+    "%Y-%m-%d %H:%M:%S",  # e.g., 2025-02-13 12:30:45
+    "%d/%m/%Y %H:%M:%S.%f",  # e.g., 13/02/2025 12:30:45.123456
+    "%d/%m/%Y %H:%M:%S",  # e.g., 13/02/2025 12:30:45
+    "%d/%m/%Y %H:%M",  # e.g., 13/02/2025 12:30
+    "%d/%m/%Y %H",  # e.g., 13/02/2025 12
+    "%d/%m/%Y",  # e.g., 13/02/2025
+    "%d.%m.%Y",  # e.g., 13.02.2025
+)
+
+
+def _separators(text: str) -> frozenset[str]:
+    """Non-digit, non-whitespace characters of a string (case-insensitive, as in strptime)."""
+    return frozenset(c.lower() for c in text if not c.isdigit() and not c.isspace())
+
+
+# All directives used above match digits only, so a format can only match strings
+# whose separators are exactly the format's literal characters
+_FORMAT_SEPARATORS = tuple(
+    (date_format, _separators(re.sub(r"%.", "", date_format)))
+    for date_format in _DATE_FORMATS
+)
+
+
 def parse_datetime(
         date_str: str
 ) -> datetime | None:
@@ -8,27 +42,12 @@ def parse_datetime(
     Try parsing the date string with multiple formats and return the parsed datetime object.
     Returns None if parsing fails.
     """
+    separators = _separators(date_str)
 
-    # List of possible date formats
-    formats = [
-        "%Y.%m.%d_%H:%M:%S.%f",  # e.g., 2025.05.06_12:30:45.123456
-        "%Y.%m.%d_%H:%M:%S",  # e.g., 2025.05.06_12:30:45
-        "%Y%m%d_%H%M%S",  # e.g., 20250506_123045
-        "%Y-%m-%dT%H:%M:%S.%f",  # e.g., 2025-02-13T12:30:45.123456
-        "%Y-%m-%dT%H:%M:%S",  # e.g., 2025-02-13T12:30:45
-        "%Y-%m-%dT%H:%M",  # e.g., 2025-02-13T12:30
-        "%Y-%m-%dT%H",  # e.g., 2025-02-13T12
-        "%Y-%m-%d",  # e.g., 2025-02-13
-        "%Y-%m-%d %H:%M:%S",  # e.g., 2025-02-13 12:30:45
-        "%d/%m/%Y %H:%M:%S.%f",  # e.g., 13/02/2025 12:30:45.123456
-        "%d/%m/%Y %H:%M:%S",  # e.g., 13/02/2025 12:30:45
-        "%d/%m/%Y %H:%M",  # e.g., 13/02/2025 12:30
-        "%d/%m/%Y %H",  # e.g., 13/02/2025 12
-        "%d/%m/%Y",  # e.g., 13/02/2025
-        "%d.%m.%Y",  # e.g., 13.02.2025
-    ]
-
-    for date_format in formats:
+    # strptime is only tried for the formats with matching separators
+    for date_format, format_separators in _FORMAT_SEPARATORS:
+        if format_separators != separators:
+            continue
         try:
             return datetime.strptime(date_str, date_format)
         except ValueError: